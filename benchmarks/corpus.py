@@ -0,0 +1,66 @@
+# benchmarks/corpus.py
+import os
+import random
+
+from PyQt5.QtCore import Qt, QPointF
+from PyQt5.QtGui import QImage, QPainter, QColor, QLinearGradient
+
+DEFAULT_FORMATS = ('jpg', 'png', 'bmp')
+DEFAULT_SIZES = ((640, 480), (1920, 1080), (4000, 3000))
+
+
+def parse_sizes(text):
+    """'640x480,1920x1080' 형식의 문자열을 (w, h) 튜플 목록으로 변환"""
+    sizes = []
+    for item in text.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        width, height = item.lower().split('x')
+        sizes.append((int(width), int(height)))
+    return tuple(sizes)
+
+
+def _render_image(width, height, rng):
+    """그라데이션 배경 위에 도형을 그려 실제 사진과 비슷한 압축률의 이미지를 만든다"""
+    image = QImage(width, height, QImage.Format_RGB32)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+
+    gradient = QLinearGradient(QPointF(0, 0), QPointF(width, height))
+    gradient.setColorAt(0.0, QColor(rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)))
+    gradient.setColorAt(1.0, QColor(rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)))
+    painter.fillRect(image.rect(), gradient)
+
+    painter.setPen(Qt.NoPen)
+    for _ in range(40):
+        painter.setBrush(QColor(rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255), 180))
+        w = rng.randint(width // 20, width // 3)
+        h = rng.randint(height // 20, height // 3)
+        painter.drawEllipse(rng.randint(0, width - 1), rng.randint(0, height - 1), w, h)
+    painter.end()
+
+    return image
+
+
+def generate_corpus(output_dir, sizes=DEFAULT_SIZES, formats=DEFAULT_FORMATS, per_combination=2, seed=0):
+    """포맷 × 크기 조합별로 이미지를 생성하고 파일 경로 목록을 반환
+
+    출력 디렉토리에 이미 생성된 파일은 재사용한다.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+
+    for width, height in sizes:
+        for fmt in formats:
+            for index in range(per_combination):
+                file_path = os.path.join(output_dir, f"bench_{width}x{height}_{index}.{fmt}")
+                if not os.path.exists(file_path):
+                    rng = random.Random(f"{seed}-{width}x{height}-{fmt}-{index}")
+                    image = _render_image(width, height, rng)
+                    if not image.save(file_path, None, 90):
+                        raise RuntimeError(f"코퍼스 이미지 저장 실패: {file_path}")
+                paths.append(file_path)
+
+    return paths
@@ -0,0 +1,233 @@
+# benchmarks/mock_server.py
+import base64
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class WireCounter:
+    """단계별(upload/poll/result) 송수신 바이트 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bytes = {}
+        self._requests = {}
+
+    def add(self, category, received, sent):
+        with self._lock:
+            self._bytes[category] = self._bytes.get(category, 0) + received + sent
+            self._requests[category] = self._requests.get(category, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'bytes': dict(self._bytes),
+                'requests': dict(self._requests),
+            }
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        # 벤치마크 출력이 지저분해지지 않도록 접근 로그는 생략
+        pass
+
+    def _header_size(self):
+        return len(self.requestline) + sum(len(k) + len(v) + 4 for k, v in self.headers.items()) + 4
+
+    def _send(self, category, status, body, content_type, received, headers=None, truncate=False):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if truncate:
+            # 본문 절반만 보내고 연결을 끊는다
+            body = body[:len(body) // 2]
+            self.close_connection = True
+        self.wfile.write(body)
+        self.server.counter.add(category, received, len(body))
+
+    def _send_json(self, category, payload, received, status=200):
+        self._send(category, status, json.dumps(payload).encode('utf-8'), 'application/json', received)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        received = self._header_size() + length
+
+        if not self.path.startswith('/image/'):
+            self._send_json('upload', {'detail': 'not found'}, received, status=404)
+            return
+
+        if self.server.is_overloaded():
+            self._send_json('upload', {'detail': 'server busy'}, received, status=503)
+            return
+
+        if self.server.should_fail():
+            self._send_json('upload', {'detail': 'internal error'}, received, status=500)
+            return
+
+        image_bytes, content_type = _extract_image_part(self.headers.get('Content-Type', ''), body)
+        token = uuid.uuid4().hex
+        self.server.store_job(token, image_bytes, content_type)
+        self._send_json('upload', {'image_token': token}, received)
+
+    def do_GET(self):
+        received = self._header_size()
+
+        if self.path.startswith('/image/'):
+            token = self.path[len('/image/'):]
+            job = self.server.poll_job(token)
+            if job is None:
+                self._send_json('poll', {'detail': 'unknown token'}, received, status=404)
+                return
+
+            if job['ready']:
+                host, port = self.server.server_address[:2]
+                result_url = f"http://{host}:{port}/result/{token}"
+                self._send_json('poll', {'result_images': [result_url]}, received)
+            else:
+                self._send_json('poll', {'result_images': []}, received)
+
+        elif self.path.startswith('/result/'):
+            token = self.path[len('/result/'):]
+            job = self.server.get_job(token)
+            if job is None:
+                self._send_json('result', {'detail': 'unknown token'}, received, status=404)
+                return
+            self._send_result(job, token, received)
+
+        else:
+            self._send_json('other', {'detail': 'not found'}, received, status=404)
+
+
+    def _send_result(self, job, token, received):
+        """결과 이미지 전송. Range 요청이면 요청한 부분만 206 으로 보낸다"""
+        image = job['image']
+        headers = {
+            'Accept-Ranges': 'bytes',
+            'ETag': f'"{token}"',
+            'Repr-Digest': f"sha-256=:{base64.b64encode(hashlib.sha256(image).digest()).decode('ascii')}:",
+        }
+        match = re.match(r'bytes=(\d+)-$', self.headers.get('Range', ''))
+        if_range = self.headers.get('If-Range')
+        if match and (if_range is None or if_range == headers['ETag']) and int(match.group(1)) < len(image):
+            start = int(match.group(1))
+            headers['Content-Range'] = f"bytes {start}-{len(image) - 1}/{len(image)}"
+            self._send('result', 206, image[start:], job['content_type'], received, headers,
+                       truncate=self.server.should_truncate())
+            return
+        self._send('result', 200, image, job['content_type'], received, headers,
+                   truncate=self.server.should_truncate())
+
+
+def _extract_image_part(content_type, body):
+    """multipart/form-data 본문에서 'image' 파트의 바이트와 타입을 추출"""
+    marker = 'boundary='
+    if marker not in content_type:
+        return body, 'application/octet-stream'
+
+    boundary = b'--' + content_type.split(marker, 1)[1].strip().strip('"').encode('latin-1')
+    for part in body.split(boundary):
+        header_end = part.find(b'\r\n\r\n')
+        if header_end < 0:
+            continue
+        headers = part[:header_end].decode('latin-1', errors='replace')
+        if 'name="image"' not in headers:
+            continue
+
+        part_type = 'application/octet-stream'
+        for line in headers.split('\r\n'):
+            if line.lower().startswith('content-type:'):
+                part_type = line.split(':', 1)[1].strip()
+
+        data = part[header_end + 4:]
+        if data.endswith(b'\r\n'):
+            data = data[:-2]
+        return data, part_type
+
+    return body, 'application/octet-stream'
+
+
+class MockSegmentationServer(ThreadingHTTPServer):
+    """업로드 → 토큰 → 폴링 → 결과 URL 흐름을 흉내내는 로컬 서버
+
+    processing_delay 초가 지나기 전까지는 폴링에 빈 결과를 돌려주고,
+    결과로는 업로드된 이미지를 그대로 반환한다.
+    capacity 가 주어지면 처리 중인 작업이 그보다 많을 때 업로드에 503 을 돌려준다.
+    failure_rate 비율만큼의 업로드에는 500 을 돌려준다 (불안정한 서버/네트워크 재현용).
+    결과 다운로드는 Range 요청과 Repr-Digest 체크섬을 지원하고,
+    truncate_rate 비율만큼은 본문 절반만 보내고 연결을 끊는다 (VPN 에서 끊기는 다운로드 재현용).
+    """
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, processing_delay=0.0, capacity=None, failure_rate=0.0,
+                 truncate_rate=0.0):
+        super().__init__((host, port), _MockHandler)
+        self.processing_delay = processing_delay
+        self.capacity = capacity
+        self.failure_rate = failure_rate
+        self.truncate_rate = truncate_rate
+        self.counter = WireCounter()
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def api_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/image/"
+
+    def store_job(self, token, image_bytes, content_type):
+        with self._lock:
+            self._jobs[token] = {
+                'image': image_bytes,
+                'content_type': content_type,
+                'created': time.monotonic(),
+            }
+
+    def should_fail(self):
+        return self.failure_rate > 0 and random.random() < self.failure_rate
+
+    def should_truncate(self):
+        return self.truncate_rate > 0 and random.random() < self.truncate_rate
+
+    def is_overloaded(self):
+        if not self.capacity:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            pending = sum(1 for job in self._jobs.values() if now - job['created'] < self.processing_delay)
+        return pending >= self.capacity
+
+    def poll_job(self, token):
+        with self._lock:
+            job = self._jobs.get(token)
+            if job is None:
+                return None
+            ready = time.monotonic() - job['created'] >= self.processing_delay
+            return {'ready': ready}
+
+    def get_job(self, token):
+        with self._lock:
+            return self._jobs.get(token)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
@@ -0,0 +1,353 @@
+# benchmarks/run_benchmark.py
+"""
+업로드/폴링, 썸네일, 다운로드 경로의 엔드투엔드 벤치마크
+
+    python -m benchmarks.run_benchmark --sizes 640x480,1920x1080 --per-combination 3
+    python -m benchmarks.run_benchmark --compare bench_results/이전결과.json
+
+로컬 목(mock) 서버와 생성된 JPEG/PNG/BMP 코퍼스를 사용하며,
+단계별 images/s, 작업당 p50/p95 지연시간, 단계 중 최대 RSS, 전송 바이트를 JSON 으로 저장한다.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QGuiApplication
+
+from benchmarks.corpus import generate_corpus, parse_sizes, DEFAULT_FORMATS, DEFAULT_SIZES
+from benchmarks.mock_server import MockSegmentationServer
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PARAMETERS = {'mask_blur': 0, 'mask_offset': 0, 'invert_output': False}
+
+
+def percentile(values, pct):
+    """nearest-rank 방식 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def peak_rss_bytes():
+    """현재까지의 프로세스 최대 RSS (바이트)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 는 KB, macOS 는 바이트 단위
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def current_rss_bytes():
+    """지금의 RSS (바이트). /proc 이 없으면 None"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class _RssSampler:
+    """단계가 도는 동안 RSS 를 주기적으로 읽어 그 단계의 최대값을 잰다
+
+    ru_maxrss 는 프로세스 전체 기간의 최대값이라 앞 단계의 최대값이 뒤 단계에 그대로 남는다.
+    /proc 이 없는 플랫폼(Windows, macOS)에서는 ru_maxrss 로 대신한다 (scope 가 'process').
+    """
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak = None
+        self.scope = 'stage' if current_rss_bytes() is not None else 'process'
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        if self.scope == 'stage':
+            self.peak = current_rss_bytes()
+            self._thread = threading.Thread(target=self._sample, name="rss-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self.peak = max(self.peak, current_rss_bytes() or 0)
+        else:
+            self.peak = peak_rss_bytes()
+        return False
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss_bytes() or 0)
+
+
+def git_commit():
+    try:
+        output = subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, stderr=subprocess.DEVNULL
+        )
+        return output.decode().strip()
+    except Exception:
+        return 'unknown'
+
+
+class _ServerGroup:
+    """여러 목 서버를 하나처럼 다루는 래퍼 (전송 바이트 합산)"""
+
+    def __init__(self, servers):
+        self.servers = servers
+
+    @property
+    def api_urls(self):
+        return [server.api_url for server in self.servers]
+
+    def wire_snapshot(self):
+        merged = {'bytes': {}, 'requests': {}}
+        for server in self.servers:
+            snapshot = server.counter.snapshot()
+            for key in merged:
+                for category, value in snapshot[key].items():
+                    merged[key][category] = merged[key].get(category, 0) + value
+        return merged
+
+
+def _wire_delta(before, after):
+    delta = {}
+    for category, value in after['bytes'].items():
+        delta[category] = value - before['bytes'].get(category, 0)
+    return {k: v for k, v in delta.items() if v}
+
+
+def _summarize(name, count, elapsed, latencies, wire_before, wire_after, rss):
+    return {
+        'stage': name,
+        'images': count,
+        'elapsed_s': round(elapsed, 4),
+        'images_per_s': round(count / elapsed, 3) if elapsed > 0 else None,
+        'latency_p50_s': percentile(latencies, 50),
+        'latency_p95_s': percentile(latencies, 95),
+        'peak_rss_bytes': rss.peak,
+        'peak_rss_scope': rss.scope,
+        'wire_bytes': _wire_delta(wire_before, wire_after),
+    }
+
+
+class _JobClock:
+    """작업마다 넘겨진 시각부터 완료 신호까지를 지연시간으로 기록
+
+    워커가 파일 목록을 순회하며 하나씩 꺼내 제출하므로, 꺼내는 순간을 제출 시각으로 본다.
+    동시에 여러 작업이 진행돼도 완료 간격이 아닌 작업별 지연시간이 된다.
+    """
+
+    def __init__(self, paths):
+        self.paths = paths
+        self.latencies = []
+        self._submitted = {}
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __iter__(self):
+        for path in self.paths:
+            self._submitted.setdefault(path, deque()).append(time.perf_counter())
+            yield path
+
+    def done(self, path, *args):
+        self.latencies.append(time.perf_counter() - self._submitted[path].popleft())
+
+
+def bench_thumbnails(paths, servers):
+    from core.services.load_image_worker import LoadImageWorker
+
+    wire_before = servers.wire_snapshot()
+    clock = _JobClock(paths)
+    worker = LoadImageWorker(clock, QSize(100, 100))
+    worker.signals.image_loaded.connect(clock.done)
+
+    with _RssSampler() as rss:
+        start = time.perf_counter()
+        worker.run()
+        elapsed = time.perf_counter() - start
+
+    return _summarize('thumbnail', len(clock.latencies), elapsed, clock.latencies,
+                      wire_before, servers.wire_snapshot(), rss)
+
+
+def bench_upload(paths, servers, parameters):
+    from core.services.endpoint_pool import EndpointPool
+    from utils.metrics import metrics
+    from utils.worker_thread import WorkerThread
+
+    wire_before = servers.wire_snapshot()
+    pool = EndpointPool(servers.api_urls, health_interval=0)
+    worker = WorkerThread(paths, pool, parameters)
+    errors = []
+    worker.error.connect(errors.append)
+    metrics.reset()
+
+    with _RssSampler() as rss:
+        start = time.perf_counter()
+        # QThread.run() 을 직접 호출해 현재 스레드에서 동기 실행
+        worker.run()
+        elapsed = time.perf_counter() - start
+
+    # 작업별 지연시간과 구간 분해는 WorkerThread 가 기록한 메트릭에서 가져온다
+    snapshot = metrics.snapshot()
+    job_total = snapshot['histograms'].get('job.total', {})
+    summary = _summarize('upload_poll', len(worker.results), elapsed, [],
+                         wire_before, servers.wire_snapshot(), rss)
+    summary['latency_p50_s'] = job_total.get('p50')
+    summary['latency_p95_s'] = job_total.get('p95')
+    summary['spans'] = {
+        name[len('span.'):]: value for name, value in snapshot['histograms'].items() if name.startswith('span.')
+    }
+    summary['errors'] = len(errors)
+    return summary, worker.results
+
+
+def bench_download(results, servers, output_dir):
+    from core.services.auto_saver import download_result
+
+    wire_before = servers.wire_snapshot()
+    latencies = []
+
+    with _RssSampler() as rss:
+        start = time.perf_counter()
+        for file_path, result_data in results:
+            image_url = result_data['results'][0]['result_images'][0]['image']
+            base_name = os.path.splitext(os.path.basename(file_path))[0]
+            save_path = os.path.join(output_dir, f"{base_name}_result.png")
+
+            job_start = time.perf_counter()
+            download_result(image_url, save_path)
+            latencies.append(time.perf_counter() - job_start)
+        elapsed = time.perf_counter() - start
+
+    return _summarize('download', len(latencies), elapsed, latencies,
+                      wire_before, servers.wire_snapshot(), rss)
+
+
+def compare(current, baseline):
+    """두 결과 파일의 단계별 처리량/지연시간 비율 출력"""
+    baseline_stages = {s['stage']: s for s in baseline.get('stages', [])}
+    print(f"\n비교 기준: {baseline['meta'].get('commit')} → 현재: {current['meta'].get('commit')}")
+    for stage in current['stages']:
+        old = baseline_stages.get(stage['stage'])
+        if not old:
+            continue
+        parts = [f"{stage['stage']:<12}"]
+        for key in ('images_per_s', 'latency_p50_s', 'latency_p95_s', 'peak_rss_bytes'):
+            if stage.get(key) and old.get(key):
+                parts.append(f"{key}: x{stage[key] / old[key]:.2f}")
+        print("  ".join(parts))
+
+
+def print_report(report):
+    print(f"\n커밋 {report['meta']['commit']} / 이미지 {report['meta']['corpus_images']}장")
+    for stage in report['stages']:
+        p50 = stage['latency_p50_s']
+        p95 = stage['latency_p95_s']
+        rss = stage['peak_rss_bytes']
+        print(
+            f"{stage['stage']:<12} {stage['images_per_s'] or 0:>8.2f} img/s  "
+            f"p50 {p50 * 1000 if p50 is not None else 0:>8.1f} ms  "
+            f"p95 {p95 * 1000 if p95 is not None else 0:>8.1f} ms  "
+            f"RSS {rss / (1024 * 1024) if rss else 0:>7.1f} MB  "
+            f"wire {stage['wire_bytes']}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ImageSegmentTool 파이프라인 벤치마크")
+    parser.add_argument('--sizes', type=parse_sizes,
+                        default=DEFAULT_SIZES, help="예: 640x480,1920x1080")
+    parser.add_argument('--formats', default=','.join(DEFAULT_FORMATS))
+    parser.add_argument('--per-combination', type=int, default=2)
+    parser.add_argument('--corpus-dir', default=os.path.join(tempfile.gettempdir(), 'imageseg_bench_corpus'))
+    parser.add_argument('--processing-delay', type=float, default=0.0,
+                        help="목 서버가 결과를 준비하는 데 걸리는 시간 (초)")
+    parser.add_argument('--server-capacity', type=int, default=None,
+                        help="목 서버 하나가 동시에 처리하는 작업 수. 넘으면 503 응답")
+    parser.add_argument('--servers', type=int, default=1, help="띄울 목 서버 수 (엔드포인트 풀 분산 확인용)")
+    parser.add_argument('--failure-rate', type=float, default=0.0,
+                        help="목 서버가 500 으로 실패시키는 업로드 비율 (재시도 확인용)")
+    parser.add_argument('--truncate-rate', type=float, default=0.0,
+                        help="목 서버가 중간에 끊는 결과 다운로드 비율 (이어 받기 확인용)")
+    parser.add_argument('--output', help="결과 JSON 경로 (기본: bench_results/<시각>_<커밋>.json)")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv[:1])
+
+    formats = tuple(f.strip() for f in args.formats.split(',') if f.strip())
+    paths = generate_corpus(args.corpus_dir, args.sizes, formats, args.per_combination)
+
+    servers = _ServerGroup([
+        MockSegmentationServer(processing_delay=args.processing_delay, capacity=args.server_capacity,
+                               failure_rate=args.failure_rate, truncate_rate=args.truncate_rate).start() for _ in range(args.servers)
+    ])
+    try:
+        stages = [bench_thumbnails(paths, servers)]
+        upload_summary, results = bench_upload(paths, servers, DEFAULT_PARAMETERS)
+        stages.append(upload_summary)
+        with tempfile.TemporaryDirectory() as download_dir:
+            stages.append(bench_download(results, servers, download_dir))
+    finally:
+        for server in servers.servers:
+            server.stop()
+
+    commit = git_commit()
+    report = {
+        'meta': {
+            'commit': commit,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'corpus_images': len(paths),
+            'sizes': [f"{w}x{h}" for w, h in args.sizes],
+            'formats': list(formats),
+            'processing_delay_s': args.processing_delay,
+            'servers': args.servers,
+            'server_capacity': args.server_capacity,
+        },
+        'stages': stages,
+    }
+
+    output = args.output or os.path.join(
+        REPO_ROOT, 'bench_results', f"{datetime.now():%Y%m%d-%H%M%S}_{commit}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4, ensure_ascii=False)
+
+    print_report(report)
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(report, json.load(f))
+
+    del app
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,19 +1,29 @@
 import logging
-from io import BytesIO
 
-import requests
-from PyQt5.QtGui import QPixmap
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QPushButton, QLabel, QProgressBar, QMessageBox, QScrollArea, QFileDialog,
-                             QSizePolicy)
-from PyQt5.QtCore import Qt
+                             QSizePolicy, QCheckBox)
+from PyQt5.QtCore import Qt, QSize, QThreadPool, QTimer
 
 from core.services.image_processor import ImageProcessor
 from core.widget.file_list_widget import FileListWidget
+from core.widget.stats_panel import StatsPanel
+from core.widget.error_panel import ErrorPanel
+from core.widget.result_gallery import ResultGallery
+from core.widget.image_viewer import ImageViewer
+from core.services.result_model import ResultListModel
+from core.services.image_decoder import ImageDecodeWorker
+from core.services.result_store import get_result_store
 from core.services.file_operations import FileOperations
+from core.services.folder_watcher import FolderWatcher
+from core.services.auto_saver import AutoSaver, DownloadTask
+from core.services.session_store import SessionStore
 from utils.path_manager import PathManager
+from utils.config_manager import get_config
+from utils.startup_profiler import profiler
 
 import os
+import time
 
 class MainUI(QMainWindow):
     def __init__(self):
@@ -22,9 +32,8 @@ class MainUI(QMainWindow):
         self.setWindowTitle("Image Segment Tool")
         self.setMinimumSize(1600, 900)
 
-        self.file_ops = FileOperations(self, None)
-        # Config file setup
-        self.config_file = "config.json"
+        # 설정은 ConfigManager 가 한 번 읽어 메모리에 들고 있는다
+        self.config = get_config()
 
         # Main widget setup
         main_widget = QWidget()
@@ -40,14 +49,46 @@ class MainUI(QMainWindow):
         main_layout.addWidget(right_panel, 2)
 
         # Initialize file operations
-        self.file_ops = FileOperations(self, self.config_file)
+        self.file_ops = FileOperations(self, self.config)
         self.file_ops.widget_file_list = self.file_list_widget
 
         self.image_processor = ImageProcessor(self)
         self.processed_files = [] # 처리된 이미지
+        self.stats_panel = None
+        self.error_panel = None
+
+        # 세션: 바뀐 뒤 1초 동안 더 바뀌지 않으면 변경분만 기록
+        self.session_store = SessionStore()
+        self.session_timer = QTimer(self)
+        self.session_timer.setSingleShot(True)
+        self.session_timer.setInterval(1000)
+        self.session_timer.timeout.connect(self.save_session)
+
         # Setup connections
         self.setup_connections()
 
+        # 첫 화면을 그린 뒤 지난 세션 복원과 처리 스레드 준비 (paintEvent 참고)
+        self.startup_pending = True
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.startup_pending:
+            self.startup_pending = False
+            # 첫 화면을 다 그린 다음 이벤트 루프 차례에 실행해 첫 프레임을 늦추지 않는다
+            QTimer.singleShot(0, self.finish_startup)
+
+    def finish_startup(self):
+        """첫 화면을 띄운 뒤 할 일. 세션 목록을 먼저 보여 주고 처리 스레드는 그다음에 준비한다"""
+        if self.config.get('restore_session'):
+            self.restore_session()
+            profiler.mark("세션 복원")
+        QTimer.singleShot(0, self.warm_up)
+
+    def warm_up(self):
+        # 처리 스레드 모듈(numpy, requests)을 불러오고 서버 상태 확인을 시작
+        self.image_processor.warm_up()
+        profiler.finish("처리 스레드 준비")
+
     def create_left_panel(self):
         left_panel = QWidget()
         left_layout = QVBoxLayout(left_panel)
@@ -61,9 +102,48 @@ class MainUI(QMainWindow):
         """)
         left_layout.addWidget(self.load_btn)
 
+        # Watch folder (새로 들어오는 이미지를 자동으로 목록에 추가)
+        watch_layout = QHBoxLayout()
+        self.watch_btn = QPushButton("폴더 감시")
+        self.watch_btn.setCheckable(True)
+        self.watch_btn.setToolTip("선택한 폴더에 새로 저장되는 이미지를 목록에 추가합니다.")
+        watch_layout.addWidget(self.watch_btn)
+        self.auto_submit_check = QCheckBox("자동 처리")
+        self.auto_submit_check.setToolTip("감시 폴더에 들어온 이미지를 마지막으로 사용한 파라미터로 바로 처리합니다.")
+        self.auto_submit_check.setChecked(self.config.get('watch_auto_submit'))
+        watch_layout.addWidget(self.auto_submit_check)
+        left_layout.addLayout(watch_layout)
+        self.watch_label = QLabel("")
+        self.watch_label.setStyleSheet("color: #666666;")
+        self.watch_label.hide()
+        left_layout.addWidget(self.watch_label)
+        self.folder_watcher = FolderWatcher(self, force_polling=self.config.get('watch_polling'))
+
         # File list widget
         self.file_list_widget = FileListWidget()
-        left_layout.addWidget(self.file_list_widget.get_container())  # get_container() 메서드 사용
+        left_layout.addWidget(self.file_list_widget.get_container(), 3)  # get_container() 메서드 사용
+
+        # Result gallery (화면에 보이는 결과만 썸네일을 만든다)
+        thumbnail_side = self.config.get('result_thumbnail_size')
+        self.result_model = ResultListModel(QSize(thumbnail_side, thumbnail_side),
+                                            self.config.get_bytes('pixmap_cache_mb'), parent=self)
+        gallery_header = QHBoxLayout()
+        gallery_label = QLabel("처리 결과")
+        gallery_label.setStyleSheet("color: #333333; font-weight: bold;")
+        gallery_header.addWidget(gallery_label)
+        gallery_header.addStretch()
+        # 결과가 나오는 대로 출력 폴더에 저장 (서버 결과가 만료되기 전에)
+        self.auto_save_check = QCheckBox("자동 저장")
+        self.auto_save_check.setToolTip("처리 결과를 나오는 대로 선택한 폴더에 내보내기 설정대로 저장합니다.")
+        gallery_header.addWidget(self.auto_save_check)
+        left_layout.addLayout(gallery_header)
+        self.auto_save_label = QLabel("")
+        self.auto_save_label.setStyleSheet("color: #666666;")
+        self.auto_save_label.hide()
+        left_layout.addWidget(self.auto_save_label)
+        self.auto_saver = AutoSaver(self)
+        self.result_gallery = ResultGallery(self.result_model)
+        left_layout.addWidget(self.result_gallery, 2)
 
         return left_panel
 
@@ -96,9 +176,8 @@ class MainUI(QMainWindow):
         """)
         image_layout = QVBoxLayout(image_container)
 
-        self.image_preview = QLabel()
-        self.image_preview.setAlignment(Qt.AlignCenter)
-        image_layout.addWidget(self.image_preview)
+        self.image_viewer = ImageViewer()
+        image_layout.addWidget(self.image_viewer)
         viewer_layout.addWidget(image_container, alignment=Qt.AlignHCenter)
 
         # Navigation bar
@@ -181,18 +260,25 @@ class MainUI(QMainWindow):
         self.process_btn = QPushButton("이미지 전송")
         self.download_all_btn = QPushButton("전체 이미지 다운로드")
         self.download_current_btn = QPushButton("현재 이미지 다운로드")
+        self.stats_btn = QPushButton("처리 통계")
+        self.errors_btn = QPushButton("오류 0건")
 
         self.process_btn.setStyleSheet(control_button_style)
         self.download_all_btn.setStyleSheet(control_button_style)
         self.download_current_btn.setStyleSheet(control_button_style)
+        self.stats_btn.setStyleSheet(control_button_style)
+        self.errors_btn.setStyleSheet(control_button_style)
 
         self.download_all_btn.setEnabled(False)
         self.download_current_btn.setEnabled(False)
+        self.errors_btn.setEnabled(False)
 
         # Add buttons horizontally
         button_layout.addWidget(self.process_btn)
         button_layout.addWidget(self.download_current_btn)
         button_layout.addWidget(self.download_all_btn)
+        button_layout.addWidget(self.stats_btn)
+        button_layout.addWidget(self.errors_btn)
 
         control_layout.addWidget(button_container)
 
@@ -215,51 +301,36 @@ class MainUI(QMainWindow):
         right_layout.addWidget(control_panel)
 
         # 연결 및 초기화
-        self.processed_images = []
         self.current_index = -1
+        # 결과 이미지 디코딩용 (가장 최근 요청만 화면에 반영)
+        self.decode_pool = QThreadPool(self)
+        self.decode_pool.setMaxThreadCount(self.config.get('decode_threads'))
+        self.decode_request_id = 0
 
         self.prev_btn.clicked.connect(self.show_previous_image)
         self.next_btn.clicked.connect(self.show_next_image)
         self.download_current_btn.clicked.connect(self.download_current_image)
         self.download_all_btn.clicked.connect(self.download_all_images)
+        self.stats_btn.clicked.connect(self.show_stats_panel)
 
         return right_panel
 
-    def create_image_item(self, original_path, result_url):
-        """개별 이미지 아이템 위젯 생성"""
-        item_widget = QWidget()
-        item_layout = QVBoxLayout(item_widget)
-
-        # 이미지 표시
-        image_label = QLabel()
-        response = requests.get(result_url)
-        img_data = BytesIO(response.content)
-        pixmap = QPixmap()
-        pixmap.loadFromData(img_data.getvalue())
-        scaled_pixmap = pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        image_label.setPixmap(scaled_pixmap)
-
-        # 파일명과 다운로드 버튼을 위한 컨테이너
-        info_widget = QWidget()
-        info_layout = QHBoxLayout(info_widget)
-
-        filename_label = QLabel(os.path.basename(original_path))
-        download_btn = QPushButton("다운로드")
-        download_btn.clicked.connect(lambda: self.download_image(result_url))
-
-        info_layout.addWidget(filename_label)
-        info_layout.addWidget(download_btn)
-
-        item_layout.addWidget(image_label)
-        item_layout.addWidget(info_widget)
-
-        return item_widget
-
     def setup_connections(self):
 
         # File operations
         self.load_btn.clicked.connect(self.file_ops.load_files)
         self.file_list_widget.file_clicked.connect(self.show_preview)
+        self.file_list_widget.priority_requested.connect(self.image_processor.bump_priority)
+
+        # Watch folder
+        self.watch_btn.toggled.connect(self.toggle_folder_watch)
+        self.auto_submit_check.toggled.connect(lambda checked: self.config.set('watch_auto_submit', checked))
+        self.folder_watcher.files_ready.connect(self.handle_watched_files)
+        self.folder_watcher.error.connect(self.handle_error)
+
+        # Auto save
+        self.auto_save_check.toggled.connect(self.toggle_auto_save)
+        self.auto_saver.changed.connect(self.update_auto_save_status)
 
         # Process button - explicitly connect to process_selected_images
         self.process_btn.clicked.connect(self.process_selected_images)
@@ -268,8 +339,18 @@ class MainUI(QMainWindow):
         self.image_processor.progress_updated.connect(self.update_progress)
         self.image_processor.error_occurred.connect(self.handle_error)
         self.image_processor.process_finished.connect(self.handle_process_complete)
-        self.image_processor.image_processed.connect(self.handle_processed_image)
+        self.image_processor.images_processed.connect(self.handle_processed_images)
+        self.image_processor.errors.changed.connect(self.update_error_count)
+        self.errors_btn.clicked.connect(self.show_error_panel)
         self.remove_btn.clicked.connect(self.remove_current_result)
+        self.result_gallery.result_activated.connect(self.show_result_at)
+
+        # Session
+        file_model = self.file_list_widget.model()
+        for signal in (file_model.rowsInserted, file_model.rowsRemoved, self.file_list_widget.files_selected,
+                       self.file_list_widget.parameters_changed, self.result_model.rowsInserted,
+                       self.result_model.rowsRemoved):
+            signal.connect(self.schedule_session_save)
 
     def process_selected_images(self):
         """Called when the process button is clicked"""
@@ -283,10 +364,123 @@ class MainUI(QMainWindow):
 
         # Start processing with ImageProcessor
         try:
-            self.image_processor.send_selected_images(files_to_process)
+            self.image_processor.send_selected_images(
+                files_to_process,
+                self.file_list_widget.get_parameter_overrides()
+            )
         except Exception as e:
             QMessageBox.critical(self, "오류", f"이미지 처리 시작 중 오류가 발생했습니다: {str(e)}")
 
+    # 세션 저장/복원
+    def schedule_session_save(self, *args):
+        self.session_timer.start()
+
+    def session_state(self):
+        return {
+            'files': self.file_list_widget.get_all_files(),
+            'checked': self.file_list_widget.get_selected_files(),
+            'overrides': self.file_list_widget.get_parameter_overrides(),
+            'results': [[record.source_path, record.location, record.parameters, record.job_id]
+                        for record in self.result_model.records],
+            'current_index': self.current_index,
+        }
+
+    def save_session(self, final=False):
+        """변경분을 기록. final 이면 (앱 종료 시) 스냅샷을 새로 쓴다"""
+        self.session_timer.stop()
+        state = self.session_state()
+        if final:
+            self.session_store.compact(state)
+        else:
+            self.session_store.save(state)
+
+    def restore_session(self):
+        """목록과 갤러리는 항목만 채우고, 썸네일은 보이는 행부터 캐시에서 읽는다"""
+        started = time.perf_counter()
+        state = self.session_store.load()
+        if not state:
+            return
+
+        self.file_list_widget.restore_files(state['files'], state['checked'], state['overrides'])
+        if state['results']:
+            self.result_model.add_results([tuple(result) for result in state['results']])
+            self.download_all_btn.setEnabled(True)
+            self.download_current_btn.setEnabled(True)
+            index = state['current_index']
+            self.current_index = index if 0 <= index < self.result_model.rowCount() else 0
+            self.show_current_image()
+            self.update_navigation_buttons()
+        logging.info(f"Restored session: {len(state['files'])} files, {len(state['results'])} results "
+                     f"in {time.perf_counter() - started:.2f}s")
+
+    def toggle_folder_watch(self, checked):
+        if not checked:
+            self.folder_watcher.stop()
+            self.watch_label.hide()
+            return
+
+        dir_path = QFileDialog.getExistingDirectory(
+            self, "감시할 폴더 선택",
+            self.config.get('watch_dir') or os.path.expanduser("~"),
+            QFileDialog.ShowDirsOnly
+        )
+        if not dir_path or not self.folder_watcher.start(dir_path):
+            self.watch_btn.blockSignals(True)
+            self.watch_btn.setChecked(False)
+            self.watch_btn.blockSignals(False)
+            return
+
+        self.config.set('watch_dir', dir_path)
+        mode = "주기 확인" if self.folder_watcher.polling else "알림"
+        self.watch_label.setText(f"감시 중 ({mode}): {dir_path}")
+        self.watch_label.show()
+
+    def toggle_auto_save(self, checked):
+        if not checked:
+            self.auto_saver.stop()
+            return
+
+        dir_path = QFileDialog.getExistingDirectory(
+            self, "자동 저장할 폴더 선택",
+            self.config.get('auto_save_dir') or self.config.get('export_dir') or os.path.expanduser("~"),
+            QFileDialog.ShowDirsOnly
+        )
+        presets = None
+        if dir_path:
+            from core.services.export_pipeline import load_export_presets
+            try:
+                presets = load_export_presets()
+            except ValueError as e:
+                QMessageBox.critical(self, "오류", f"내보내기 설정 오류: {str(e)}")
+        if not presets:
+            self.auto_save_check.blockSignals(True)
+            self.auto_save_check.setChecked(False)
+            self.auto_save_check.blockSignals(False)
+            return
+
+        self.config.set('auto_save_dir', dir_path)
+        self.auto_saver.start(dir_path, presets)
+
+    def update_auto_save_status(self):
+        saver = self.auto_saver
+        if not saver.enabled and not saver.pending:
+            self.auto_save_label.hide()
+            return
+        parts = [f"저장 {len(saver.saved)}개"]
+        if saver.pending:
+            parts.append(f"대기 {saver.pending}개")
+        if saver.failures:
+            parts.append(f"실패 {saver.failures}개")
+        target = saver.output_dir or "중지됨"
+        self.auto_save_label.setText(f"자동 저장: {target} ({', '.join(parts)})")
+        self.auto_save_label.show()
+
+    def handle_watched_files(self, files):
+        """감시 폴더에 다 쓰인 이미지가 들어왔을 때"""
+        self.file_list_widget.add_file_to_list(files, show_progress=False, skip_existing=True)
+        if self.auto_submit_check.isChecked():
+            self.image_processor.start_processing(files, interactive=False)
+
     def update_progress(self, value):
         # """진행 상태 업데이트"""
         # self.progress_bar.setValue(value)
@@ -300,6 +494,31 @@ class MainUI(QMainWindow):
         """진행 상태 업데이트"""
         self.progress_bar.setValue(value)
 
+    def show_stats_panel(self):
+        if self.stats_panel is None:
+            self.stats_panel = StatsPanel(self)
+        self.stats_panel.show()
+        self.stats_panel.raise_()
+
+    def show_error_panel(self, activate=True):
+        if self.error_panel is None:
+            self.error_panel = ErrorPanel(self.image_processor.errors, self)
+            self.error_panel.retry_requested.connect(self.image_processor.retry_failed)
+        self.error_panel.show()
+        if activate:
+            self.error_panel.raise_()
+            self.error_panel.activateWindow()
+
+    def update_error_count(self):
+        """실패 건수를 버튼에 표시하고, 새 실패가 생기면 오류 창을 (포커스는 그대로 둔 채) 띄운다"""
+        count = len(self.image_processor.errors)
+        previous = int(self.errors_btn.property("count") or 0)
+        self.errors_btn.setProperty("count", count)
+        self.errors_btn.setText(f"오류 {count}건")
+        self.errors_btn.setEnabled(count > 0)
+        if count > previous and (self.error_panel is None or not self.error_panel.isVisible()):
+            self.show_error_panel(activate=False)
+
     def show_preview(self, file_path, mode):
         if mode == "preview":
             self.preview_label.setText(f"Selected: {os.path.basename(file_path)}")
@@ -309,12 +528,8 @@ class MainUI(QMainWindow):
 
     def handle_process_complete(self):
         """모든 이미지 처리가 완료된 후 호출"""
-        for file_path in self.processed_files:
-            for row in range(self.file_list_widget.rowCount()):
-                widget = self.file_list_widget.cellWidget(row, 0)
-                if widget and widget.property("file_path") == file_path:
-                    self.file_list_widget.removeRow(row)
-                    break
+        # 목록을 한 번만 훑으면서 지우고, 다 지울 때까지 다시 그리지 않는다
+        self.file_list_widget.remove_files(self.processed_files)
 
         self.processed_files = []
 
@@ -322,54 +537,91 @@ class MainUI(QMainWindow):
         from PyQt5.QtCore import QTimer
         QTimer.singleShot(500, lambda: self.progress_bar.setValue(0))
 
-    def handle_processed_image(self, file_path, result_data):
-        """처리된 이미지 결과 추가"""
+    def handle_processed_images(self, processed):
+        """처리된 이미지 결과 추가 ([(file_path, result_data)] 를 한 번에)"""
         try:
-            if isinstance(result_data, dict) and 'results' in result_data and result_data['results']:
-                result = result_data['results'][0]
-                if result.get('result_images'):
-                    image_url = result['result_images'][0]['image']
-                    self.processed_images.append((file_path, image_url))
-                    self.processed_files.append(file_path)  # 추가: 처리된 파일 경로 기록
-
-                    # 첫 이미지인 경우 표시
-                    if len(self.processed_images) == 1:
-                        self.current_index = 0
-                        self.show_current_image()
-
-                    # 현재 페이지 레이블 업데이트
-                    self.update_page_label()
-
-                    # 버튼 상태 업데이트
-                    self.update_navigation_buttons()
-                    self.download_all_btn.setEnabled(True)
-                    self.download_current_btn.setEnabled(True)
+            new_results = []
+            for file_path, result_data in processed:
+                if isinstance(result_data, dict) and 'results' in result_data and result_data['results']:
+                    result = result_data['results'][0]
+                    if result.get('result_images'):
+                        image_url = result['result_images'][0]['image']
+                        new_results.append((file_path, image_url, result_data.get('parameters'),
+                                            result_data.get('job_id')))
+                        self.processed_files.append(file_path)  # 추가: 처리된 파일 경로 기록
+            if not new_results:
+                return
+
+            was_empty = self.result_model.rowCount() == 0
+            first_row = self.result_model.add_results(new_results)
+            if self.auto_saver.enabled:
+                self.auto_saver.submit([(record.location, record.base_name)
+                                        for record in self.result_model.records[first_row:]])
+
+            # 첫 이미지인 경우 표시
+            if was_empty:
+                self.current_index = 0
+                self.show_current_image()
+
+            # 현재 페이지 레이블 업데이트
+            self.update_page_label()
+
+            # 버튼 상태 업데이트
+            self.update_navigation_buttons()
+            self.download_all_btn.setEnabled(True)
+            self.download_current_btn.setEnabled(True)
 
         except Exception as e:
             QMessageBox.critical(self, "오류", f"이미지 처리 결과 표시 중 오류 발생: {str(e)}")
 
     def update_page_label(self):
         """페이지 레이블 업데이트"""
-        total_images = len(self.processed_images)
+        total_images = self.result_model.rowCount()
         current_page = self.current_index + 1 if self.current_index >= 0 else 0
         self.page_label.setText(f"{current_page}/{total_images}")
 
-    def show_current_image(self):
-        if 0 <= self.current_index < len(self.processed_images):
-            _, image_url = self.processed_images[self.current_index]
-
-            response = requests.get(image_url)
-            img_data = BytesIO(response.content)
-            pixmap = QPixmap()
-            pixmap.loadFromData(img_data.getvalue())
+    def show_result_at(self, row):
+        if 0 <= row < self.result_model.rowCount():
+            self.current_index = row
+            self.show_current_image()
+            self.update_navigation_buttons()
 
-            # Scale image while maintaining aspect ratio
-            scaled_pixmap = pixmap.scaled(780, 780, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.image_preview.setPixmap(scaled_pixmap)
+    def show_current_image(self):
+        record = self.result_model.record(self.current_index)
+        if record is not None:
+            # 받기/디코딩/축소는 워커 스레드에서 하고 완성된 QImage 만 돌려받는다
+            # (빠른 축소본 → 고품질 축소본 순서로 두 번 온다)
+            self.decode_request_id += 1
+            self.image_viewer.begin_image()
+            worker = ImageDecodeWorker(self.decode_request_id, record.location, self.image_viewer.size(),
+                                       source_path=record.source_path)
+            worker.signals.source_loaded.connect(self.set_viewer_source)
+            worker.signals.preview.connect(self.display_decoded_image)
+            worker.signals.decoded.connect(self.display_decoded_image)
+            worker.signals.failed.connect(self.handle_decode_failed)
+            self.decode_pool.start(worker)
 
             # 페이지 레이블 업데이트를 별도 함수로 분리
             self.update_page_label()
+            self.result_gallery.set_current_row(self.current_index)
             self.remove_btn.setEnabled(True)
+            self.schedule_session_save()
+
+    def set_viewer_source(self, request_id, location, data, full_size):
+        if request_id == self.decode_request_id:
+            self.image_viewer.set_source(location, data, full_size)
+
+    def display_decoded_image(self, request_id, location, image):
+        # 그 사이 다른 이미지로 넘어갔으면 버린다
+        if request_id != self.decode_request_id:
+            return
+        self.image_viewer.set_display_image(image)
+
+    def handle_decode_failed(self, request_id, location, error_message):
+        if request_id != self.decode_request_id:
+            return
+        logging.error(f"Failed to load result image {location}: {error_message}")
+        self.image_viewer.show_message("결과 이미지를 불러올 수 없습니다.")
 
     def show_previous_image(self):
         if self.current_index > 0:
@@ -378,19 +630,20 @@ class MainUI(QMainWindow):
             self.update_navigation_buttons()
 
     def show_next_image(self):
-        if self.current_index < len(self.processed_images) - 1:
+        if self.current_index < self.result_model.rowCount() - 1:
             self.current_index += 1
             self.show_current_image()
             self.update_navigation_buttons()
 
     def update_navigation_buttons(self):
         self.prev_btn.setEnabled(self.current_index > 0)
-        self.next_btn.setEnabled(self.current_index < len(self.processed_images) - 1)
+        self.next_btn.setEnabled(self.current_index < self.result_model.rowCount() - 1)
 
     def download_current_image(self):
-        if 0 <= self.current_index < len(self.processed_images):
-            file_path, image_url = self.processed_images[self.current_index]
-            base_name = os.path.splitext(os.path.basename(file_path))[0]
+        record = self.result_model.record(self.current_index)
+        if record is not None:
+            image_url = record.location
+            base_name = record.base_name
             suggested_name = f"{base_name}_result.png"
 
             save_path, _ = QFileDialog.getSaveFileName(
@@ -400,62 +653,82 @@ class MainUI(QMainWindow):
             )
 
             if save_path:
-                self.download_image(image_url, save_path)
+                # 받기/검증은 자동 저장과 같은 입출력 스레드 풀에서 한다 (종료할 때 함께 기다린다)
+                task = DownloadTask(image_url, save_path)
+                task.signals.finished.connect(self.handle_download_complete)
+                task.signals.failed.connect(self.handle_download_failed)
+                self.download_current_btn.setEnabled(False)
+                self.auto_saver.pool.start(task)
+
+    def handle_download_complete(self, save_path):
+        self.download_current_btn.setEnabled(self.result_model.rowCount() > 0)
+        QMessageBox.information(self, "완료", f"이미지가 저장되었습니다.\n저장 위치: {save_path}")
+
+    def handle_download_failed(self, save_path, message):
+        self.download_current_btn.setEnabled(self.result_model.rowCount() > 0)
+        logging.error(f"Failed to save result to {save_path}: {message}")
+        QMessageBox.warning(self, "저장 실패", f"이미지를 저장하지 못했습니다:\n{message}")
 
     def download_all_images(self):
-        if not self.processed_images:
+        if not self.result_model.rowCount():
             return
 
-        # 저장할 디렉토리 선택
+        # 저장할 디렉토리 선택 (마지막으로 내보낸 폴더에서 시작)
         dir_path = QFileDialog.getExistingDirectory(
             self, "저장할 폴더 선택",
-            os.path.expanduser("~"),
+            self.config.get('export_dir') or os.path.expanduser("~"),
             QFileDialog.ShowDirsOnly
         )
 
         if dir_path:
+            self.config.set('export_dir', dir_path)
+            # 내보내기 모듈은 numpy 를 불러오므로 처음 저장할 때 import 한다
+            from core.services.export_pipeline import ExportWorker, load_export_presets
             try:
-                for idx, (file_path, image_url) in enumerate(self.processed_images):
-                    base_name = os.path.splitext(os.path.basename(file_path))[0]
-                    save_path = os.path.join(dir_path, f"{base_name}_result.png")
-                    self.download_image(image_url, save_path)
-
-                    # Update progress
-                    progress = int(((idx + 1) / len(self.processed_images)) * 100)
-                    self.progress_bar.setValue(progress)
-
-                QMessageBox.information(self, "완료", f"모든 이미지가 저장되었습니다.\n저장 위치: {dir_path}")
-                self.progress_bar.setValue(0)
-
-            except Exception as e:
-                QMessageBox.critical(self, "오류", f"이미지 저장 중 오류 발생: {str(e)}")
-
-    def download_image(self, url, save_path):
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
-
-        except Exception as e:
-            raise Exception(f"다운로드 중 오류 발생: {str(e)}")
+                presets = load_export_presets()
+            except ValueError as e:
+                QMessageBox.critical(self, "오류", f"내보내기 설정 오류: {str(e)}")
+                return
+
+            # 설정된 프리셋마다 변환/인코딩은 프로세스 풀에서 병렬로 처리
+            # 같은 폴더에 이미 자동 저장된 결과는 다시 받지 않는다
+            items = [(record.location, record.base_name) for record in self.result_model.records
+                     if not self.auto_saver.is_saved(record.location, dir_path)]
+            if not items:
+                QMessageBox.information(self, "완료", f"모든 결과가 이미 저장되어 있습니다.\n저장 위치: {dir_path}")
+                return
+            self.export_dir = dir_path
+            self.export_worker = ExportWorker(items, dir_path, presets)
+            self.export_worker.progress.connect(self.update_progress)
+            self.export_worker.error.connect(
+                lambda message: QMessageBox.critical(self, "오류", f"이미지 저장 중 오류 발생:\n{message}"))
+            self.export_worker.finished.connect(self.handle_export_complete)
+            self.download_all_btn.setEnabled(False)
+            self.export_worker.start()
+
+    def handle_export_complete(self, exported_files):
+        self.download_all_btn.setEnabled(True)
+        self.progress_bar.setValue(0)
+        if exported_files:
+            QMessageBox.information(self, "완료",
+                                    f"{len(exported_files)}개 파일이 저장되었습니다.\n저장 위치: {self.export_dir}")
 
     def remove_current_result(self):
-        if 0 <= self.current_index < len(self.processed_images):
+        if 0 <= self.current_index < self.result_model.rowCount():
             # 현재 이미지 정보 저장
-            removed_image = self.processed_images.pop(self.current_index)
+            removed_image = self.result_model.remove_row(self.current_index)
+            get_result_store().remove(removed_image.location)
 
             # 이미지가 더 있는 경우
-            if self.processed_images:
-                if self.current_index >= len(self.processed_images):
+            if self.result_model.rowCount():
+                if self.current_index >= self.result_model.rowCount():
                     # 마지막 이미지였다면 이전 이미지로
-                    self.current_index = len(self.processed_images) - 1
+                    self.current_index = self.result_model.rowCount() - 1
                 self.show_current_image()
             else:
                 # 모든 이미지가 제거된 경우
                 self.current_index = -1
-                self.image_preview.clear()
+                self.image_viewer.clear()
                 self.page_label.setText("0/0")
                 self.download_current_btn.setEnabled(False)
                 self.download_all_btn.setEnabled(False)
@@ -1,19 +1,58 @@
+import os
+
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
                              QLabel, QSpinBox, QCheckBox)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QImage, QPixmap, QPainter, QColor, QBrush
+
+from core.services.mask_compositor import (get_mask_cache, qimage_to_rgba, rgba_to_qimage, resize_mask,
+                                           scale_parameters, apply_mask_parameters, composite)
+from utils.worker_thread import WorkerThread
+
 
 class ParameterInputDialog(QDialog):
-    def __init__(self, parent=None):
+    DEFAULT_PARAMETERS = {
+        'mask_blur': 0,
+        'mask_offset': 0,
+        'invert_output': False,
+        'local_compositing': False,
+        'auto_crop': False,
+        'crop_padding': 0
+    }
+    PREVIEW_SIZE = 280
+    PREVIEW_DEBOUNCE_MS = 120
+
+    def __init__(self, parent=None, sample_file=None, endpoint_pool=None, controller=None):
         super().__init__(parent)
+        self.sample_file = sample_file
+        self.endpoint_pool = endpoint_pool
+        self.controller = controller
+
+        # 미리보기 해상도로 줄여 둔 원본/마스크 (파라미터가 바뀔 때마다 재사용)
+        self.preview_source = None
+        self.preview_mask = None
+        self.preview_factor = 1.0
+        self.mask_worker = None
+
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(self.PREVIEW_DEBOUNCE_MS)
+        self.preview_timer.timeout.connect(self.render_preview)
+
         self.setup_ui()
+        self.setup_preview()
 
     def setup_ui(self):
         self.setWindowTitle("마스크 파라미터 설정")
         self.setModal(True)
         self.setMinimumWidth(300)
 
-        layout = QVBoxLayout(self)
+        root_layout = QHBoxLayout(self)
+        root_layout.setSpacing(15)
+
+        layout = QVBoxLayout()
         layout.setSpacing(15)
+        root_layout.addLayout(layout)
 
         # Mask blur parameter (0 ~ 10)
         blur_layout = QHBoxLayout()
@@ -57,10 +96,43 @@ class ParameterInputDialog(QDialog):
         invert_layout.addStretch()
         layout.addLayout(invert_layout)
 
+        # Local compositing mode
+        local_layout = QHBoxLayout()
+        local_label = QLabel("로컬 합성:")
+        self.local_input = QCheckBox()
+        self.local_input.setChecked(False)
+        local_input_info = QLabel("(마스크를 한 번만 받아 blur/offset/invert 를 로컬에서 적용)")
+        local_input_info.setStyleSheet("color: gray; font-size: 10px;")
+        local_layout.addWidget(local_label)
+        local_layout.addWidget(self.local_input)
+        local_layout.addWidget(local_input_info)
+        local_layout.addStretch()
+        layout.addLayout(local_layout)
+
+        # Auto crop (결과의 투명 여백 자르기)
+        crop_layout = QHBoxLayout()
+        crop_label = QLabel("여백 자르기:")
+        self.crop_input = QCheckBox()
+        self.crop_input.setChecked(False)
+        self.crop_padding_input = QSpinBox()
+        self.crop_padding_input.setRange(0, 500)
+        self.crop_padding_input.setValue(0)
+        self.crop_padding_input.setSuffix(" px")
+        self.crop_padding_input.setEnabled(False)
+        self.crop_input.toggled.connect(self.crop_padding_input.setEnabled)
+        crop_input_info = QLabel("(남길 여백)")
+        crop_input_info.setStyleSheet("color: gray; font-size: 10px;")
+        crop_layout.addWidget(crop_label)
+        crop_layout.addWidget(self.crop_input)
+        crop_layout.addWidget(self.crop_padding_input)
+        crop_layout.addWidget(crop_input_info)
+        crop_layout.addStretch()
+        layout.addLayout(crop_layout)
+
         # 설명 추가
-        info_label = QLabel("선택된 모든 이미지에 동일한 파라미터가 적용됩니다.")
-        info_label.setStyleSheet("color: gray; font-size: 10px;")
-        layout.addWidget(info_label)
+        self.info_label = QLabel("개별 파라미터가 지정된 이미지를 제외한 선택 이미지에 적용됩니다.")
+        self.info_label.setStyleSheet("color: gray; font-size: 10px;")
+        layout.addWidget(self.info_label)
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -75,12 +147,125 @@ class ParameterInputDialog(QDialog):
         button_layout.addWidget(self.cancel_button)
         layout.addLayout(button_layout)
 
+        # Live preview pane
+        if self.sample_file:
+            preview_layout = QVBoxLayout()
+            self.preview_label = QLabel()
+            self.preview_label.setFixedSize(self.PREVIEW_SIZE, self.PREVIEW_SIZE)
+            self.preview_label.setAlignment(Qt.AlignCenter)
+            self.preview_label.setStyleSheet("background-color: #e0e0e0; border: 1px solid #cccccc;")
+            preview_layout.addWidget(self.preview_label)
+
+            self.preview_info = QLabel(os.path.basename(self.sample_file))
+            self.preview_info.setStyleSheet("color: gray; font-size: 10px;")
+            preview_layout.addWidget(self.preview_info)
+
+            self.fetch_mask_btn = QPushButton("마스크 가져오기")
+            self.fetch_mask_btn.clicked.connect(self.fetch_sample_mask)
+            self.fetch_mask_btn.setEnabled(self.endpoint_pool is not None)
+            preview_layout.addWidget(self.fetch_mask_btn)
+            preview_layout.addStretch()
+            root_layout.addLayout(preview_layout)
+
+            self.blur_input.valueChanged.connect(self.schedule_preview)
+            self.offset_input.valueChanged.connect(self.schedule_preview)
+            self.invert_input.stateChanged.connect(self.schedule_preview)
+
         # 창 크기 조정
         self.setFixedSize(self.sizeHint())
 
+    # 미리보기
+    def setup_preview(self):
+        if not self.sample_file:
+            return
+
+        mask = get_mask_cache().get(self.sample_file)
+        if mask is None:
+            self.preview_label.setText("캐시된 마스크가 없습니다.\n마스크를 가져오면 미리보기를 볼 수 있습니다.")
+            return
+
+        source = QImage(self.sample_file)
+        if source.isNull():
+            self.preview_label.setText("이미지를 열 수 없습니다.")
+            return
+
+        # 원본과 마스크를 한 번만 미리보기 크기로 줄여 둔다
+        scaled = source.scaled(self.PREVIEW_SIZE, self.PREVIEW_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.preview_factor = scaled.width() / source.width()
+        self.preview_source = qimage_to_rgba(scaled)
+        self.preview_mask = resize_mask(mask, scaled.width(), scaled.height())
+
+        self.fetch_mask_btn.hide()
+        self.local_input.setChecked(True)
+        self.render_preview()
+
+    @staticmethod
+    def checker_brush(cell=10):
+        tile = QPixmap(cell * 2, cell * 2)
+        tile.fill(QColor('#ffffff'))
+        painter = QPainter(tile)
+        painter.fillRect(0, 0, cell, cell, QColor('#d0d0d0'))
+        painter.fillRect(cell, cell, cell, cell, QColor('#d0d0d0'))
+        painter.end()
+        return QBrush(tile)
+
+    def schedule_preview(self, *args):
+        if self.preview_mask is not None:
+            self.preview_timer.start()
+
+    def render_preview(self):
+        if self.preview_mask is None:
+            return
+
+        parameters = scale_parameters(self.get_parameters(), self.preview_factor)
+        output = composite(self.preview_source, apply_mask_parameters(self.preview_mask, parameters))
+        image = rgba_to_qimage(output)
+
+        # 투명 영역이 보이도록 체크무늬 위에 그린다
+        pixmap = QPixmap(image.width(), image.height())
+        painter = QPainter(pixmap)
+        painter.fillRect(pixmap.rect(), self.checker_brush())
+        painter.drawImage(0, 0, image)
+        painter.end()
+
+        self.preview_label.setPixmap(pixmap)
+
+    def fetch_sample_mask(self):
+        """샘플 이미지 한 장만 서버에 보내 원본 마스크를 캐시한다"""
+        parameters = dict(self.get_parameters(), local_compositing=True)
+        self.mask_worker = WorkerThread([self.sample_file], self.endpoint_pool, parameters, self.controller)
+        self.mask_worker.result.connect(lambda result: self.setup_preview())
+        self.mask_worker.failed.connect(lambda file_path, message, parameters, cause: self.mask_fetch_failed(message))
+        self.mask_worker.error.connect(self.mask_fetch_failed)
+
+        self.fetch_mask_btn.setEnabled(False)
+        self.preview_label.setText("마스크를 가져오는 중...")
+        self.mask_worker.start()
+
+    def mask_fetch_failed(self, error_message):
+        self.fetch_mask_btn.setEnabled(True)
+        self.preview_label.setText(f"마스크를 가져오지 못했습니다.\n{error_message}")
+
+    def done(self, result):
+        if self.mask_worker and self.mask_worker.isRunning():
+            self.mask_worker.stop()
+            self.mask_worker.wait()
+        super().done(result)
+
+    def set_parameters(self, parameters):
+        self.blur_input.setValue(parameters.get('mask_blur', 0))
+        self.offset_input.setValue(parameters.get('mask_offset', 0))
+        self.invert_input.setChecked(bool(parameters.get('invert_output')))
+        self.local_input.setChecked(bool(parameters.get('local_compositing')))
+        self.crop_input.setChecked(bool(parameters.get('auto_crop')))
+        self.crop_padding_input.setValue(parameters.get('crop_padding', 0))
+
     def get_parameters(self):
         return {
             'mask_blur': self.blur_input.value(),
             'mask_offset': self.offset_input.value(),
-            'invert_output': self.invert_input.isChecked()
+            'invert_output': self.invert_input.isChecked(),
+            'local_compositing': self.local_input.isChecked(),
+            'auto_crop': self.crop_input.isChecked(),
+            'crop_padding': self.crop_padding_input.value()
         }
\ No newline at end of file
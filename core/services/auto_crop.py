@@ -0,0 +1,98 @@
+# core/services/auto_crop.py
+import hashlib
+import logging
+import os
+import time
+
+import numpy as np
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QImage
+
+from utils.path_manager import PathManager
+
+
+def alpha_channel(image):
+    """QImage 의 알파 채널을 (H, W) uint8 배열로 반환"""
+    alpha_image = image.convertToFormat(QImage.Format_Alpha8)
+    bits = alpha_image.constBits()
+    bits.setsize(alpha_image.byteCount())
+    alpha = np.frombuffer(bits, dtype=np.uint8).reshape(alpha_image.height(), alpha_image.bytesPerLine())
+    return alpha[:, :alpha_image.width()].copy()
+
+
+def alpha_bounds(alpha, threshold=0):
+    """알파가 threshold 보다 큰 픽셀을 감싸는 (left, top, right, bottom). right/bottom 은 포함하지 않는다
+
+    행 방향 최댓값으로 위/아래 경계를 먼저 찾고, 열 방향은 그 사이 행만 본다.
+    모두 투명하면 None.
+    """
+    opaque_rows = alpha.max(axis=1) > threshold
+    if not opaque_rows.any():
+        return None
+    top = int(np.argmax(opaque_rows))
+    bottom = len(opaque_rows) - int(np.argmax(opaque_rows[::-1]))
+
+    opaque_cols = alpha[top:bottom].max(axis=0) > threshold
+    left = int(np.argmax(opaque_cols))
+    right = len(opaque_cols) - int(np.argmax(opaque_cols[::-1]))
+    return left, top, right, bottom
+
+
+def crop_rect(bounds, padding, width, height):
+    """경계에 여백을 더하고 이미지 안으로 자른 QRect"""
+    left, top, right, bottom = bounds
+    left, top = max(0, left - padding), max(0, top - padding)
+    right, bottom = min(width, right + padding), min(height, bottom + padding)
+    return QRect(left, top, right - left, bottom - top)
+
+
+def crop_to_content(image, padding=0, threshold=0):
+    """투명 여백을 잘라낸 (QImage, 잘린 영역 QRect) 반환
+
+    잘라낼 것이 없거나(여백 없음/알파 없음) 전부 투명하면 원본과 None 을 반환한다.
+    """
+    if not image.hasAlphaChannel():
+        return image, None
+    bounds = alpha_bounds(alpha_channel(image), threshold)
+    if bounds is None:
+        return image, None
+
+    rect = crop_rect(bounds, padding, image.width(), image.height())
+    if rect.size() == image.size():
+        return image, None
+    return image.copy(rect), rect
+
+
+def auto_crop_result(content, padding=0, output_dir=None):
+    """다운로드한 결과 이미지를 잘라 PNG 로 저장
+
+    반환값: (저장 경로 또는 None, 잘린 영역 QRect 또는 None, 원본 크기 QSize, 단계별 소요 시간 dict)
+    잘라낼 것이 없으면 저장하지 않고 경로로 None 을 돌려준다.
+    """
+    timings = {}
+    started = time.perf_counter()
+    image = QImage.fromData(content)
+    if image.isNull():
+        raise Exception("결과 이미지를 해석할 수 없습니다.")
+    timings['decode'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    cropped, rect = crop_to_content(image, padding)
+    timings['bounds'] = time.perf_counter() - started
+    if rect is None:
+        return None, None, image.size(), timings
+
+    started = time.perf_counter()
+    output_dir = output_dir or os.path.join(PathManager.get_cache_dir(), 'results')
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, f"{hashlib.sha1(content).hexdigest()}_crop{padding}.png")
+    temp_path = output_path + '.part'
+    # 압축률보다 속도를 우선 (render_local_result 와 같은 기준)
+    if not cropped.save(temp_path, 'PNG', 90):
+        raise Exception("잘라낸 결과를 저장하지 못했습니다.")
+    os.replace(temp_path, output_path)
+    timings['encode'] = time.perf_counter() - started
+
+    logging.getLogger(__name__).info(
+        f"Auto-cropped {image.width()}x{image.height()} -> {rect.width()}x{rect.height()}")
+    return output_path, rect, image.size(), timings
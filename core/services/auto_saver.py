@@ -0,0 +1,184 @@
+# core/services/auto_saver.py
+import logging
+import os
+import shutil
+
+from PyQt5.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, pyqtSignal
+
+from core.services.image_decoder import is_decodable_file
+from utils.config_manager import get_config
+from utils.http_client import DownloadError, get_http_client, is_remote
+from utils.metrics import metrics
+
+
+def save_result(location, base_name, output_dir, presets):
+    """결과 한 장을 프리셋대로 output_dir 에 저장하고 저장한 경로 목록을 반환
+
+    그대로 저장하는 PNG 프리셋 하나뿐이면 메모리에 모으지 않고 파일로 바로 받는다.
+    변환이 필요한 프리셋은 받은 바이트를 프로세스 풀에서 인코딩한다.
+    """
+    # numpy 를 쓰는 모듈이라 자동 저장을 처음 할 때 불러온다 (시작 시간 단축)
+    from core.services.export_pipeline import PNG_SIGNATURE, can_stream, export_result, write_atomic
+    from core.services.process_pool import get_process_pool, share_bytes
+    data = None
+    if len(presets) == 1 and can_stream(presets[0]):
+        output_path = os.path.join(output_dir, f"{base_name}{presets[0]['suffix']}.png")
+        if is_remote(location):
+            get_http_client().download(location, output_path, validate=is_decodable_file)
+        else:
+            write_atomic(output_path, lambda path: shutil.copyfile(location, path))
+        with open(output_path, 'rb') as f:
+            if f.read(len(PNG_SIGNATURE)) == PNG_SIGNATURE:
+                return [output_path]
+            # 서버가 PNG 가 아닌 결과를 돌려줬으면 받은 파일을 변환한다 (다시 받지 않는다)
+            f.seek(0)
+            data = f.read()
+
+    if data is None:
+        data = get_http_client().fetch_bytes(location)
+    with share_bytes(data) as shared:
+        outputs, elapsed = get_process_pool().run(export_result, shared, base_name, output_dir, presets)
+    metrics.observe('export.encode', elapsed)
+    return [path for path, _ in outputs]
+
+
+def download_result(location, save_path):
+    """결과 한 장을 변환 없이 save_path 에 저장. 실패하면 DownloadError"""
+    try:
+        # 로컬 합성 결과는 이미 디스크에 있으므로 복사만 한다
+        if not is_remote(location):
+            shutil.copyfile(location, save_path)
+            return
+        # 길이/체크섬 확인, 끊기면 이어 받기, 디코딩 확인까지 통과해야 save_path 에 생긴다
+        get_http_client().download(location, save_path, validate=is_decodable_file)
+    except DownloadError:
+        raise
+    except Exception as e:
+        raise DownloadError(f"다운로드 중 오류 발생: {e}") from e
+
+
+class DownloadTask(QRunnable):
+    """download_result 를 워커 스레드에서 실행"""
+    class Signals(QObject):
+        finished = pyqtSignal(str)  # 저장한 경로
+        failed = pyqtSignal(str, str)  # 저장할 경로, 오류 메시지
+
+    def __init__(self, location, save_path):
+        super().__init__()
+        self.signals = self.Signals()
+        self.location = location
+        self.save_path = save_path
+
+    def run(self):
+        try:
+            download_result(self.location, self.save_path)
+            self.signals.finished.emit(self.save_path)
+        except Exception as e:
+            self.signals.failed.emit(self.save_path, str(e))
+
+
+class AutoSaveTask(QRunnable):
+    class Signals(QObject):
+        saved = pyqtSignal(str, list)  # 결과 위치, 저장한 경로
+        failed = pyqtSignal(str, str)  # 결과 위치, 오류 메시지
+
+    def __init__(self, location, base_name, output_dir, presets):
+        super().__init__()
+        self.signals = self.Signals()
+        self.location = location
+        self.base_name = base_name
+        self.output_dir = output_dir
+        self.presets = presets
+
+    def run(self):
+        try:
+            with metrics.span(None, 'auto_save', file=self.base_name):
+                paths = save_result(self.location, self.base_name, self.output_dir, self.presets)
+            self.signals.saved.emit(self.location, paths)
+        except Exception as e:
+            self.signals.failed.emit(self.location, str(e))
+
+
+class AutoSaver(QObject):
+    """처리 결과가 나오는 대로 출력 폴더에 저장
+
+    받기는 입출력 위주라 전용 스레드 풀(auto_save_threads)에서 하고, 인코딩은 공유 프로세스 풀을 쓴다.
+    서버의 결과가 만료되기 전에 디스크에 남기고, 배치가 끝나면 파일이 이미 저장되어 있게 한다.
+    GUI 스레드에서만 호출한다.
+    """
+    changed = pyqtSignal()
+    failed = pyqtSignal(str, str)  # 결과 위치, 오류 메시지
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, get_config().get('auto_save_threads')))
+        self.output_dir = None
+        self.presets = None
+        self.closed = False
+        self.failures = 0
+        self.in_flight = {}  # {결과 위치: 저장할 기본 파일명} (넘겼지만 아직 끝나지 않은 저장)
+        self.saved = {}  # {결과 위치: [저장한 경로]} (현재 output_dir 기준)
+
+    @property
+    def enabled(self):
+        return self.output_dir is not None and not self.closed
+
+    @property
+    def pending(self):
+        return len(self.in_flight)
+
+    def start(self, output_dir, presets):
+        if output_dir != self.output_dir:
+            self.saved = {}
+        self.output_dir = output_dir
+        self.presets = presets
+        self.failures = 0
+        self.changed.emit()
+
+    def stop(self):
+        """새 결과는 더 받지 않는다. 이미 넘긴 저장은 끝까지 진행된다"""
+        self.output_dir = None
+        self.changed.emit()
+
+    def submit(self, items):
+        """items: [(결과 위치, 저장할 기본 파일명)]"""
+        if not self.enabled:
+            return
+        for location, base_name in items:
+            task = AutoSaveTask(location, base_name, self.output_dir, self.presets)
+            task.signals.saved.connect(self.handle_saved)
+            task.signals.failed.connect(self.handle_failed)
+            self.in_flight[location] = base_name
+            self.pool.start(task)
+        if items:
+            self.changed.emit()
+
+    def is_saved(self, location, output_dir):
+        return output_dir == self.output_dir and location in self.saved
+
+    def handle_saved(self, location, paths):
+        self.in_flight.pop(location, None)
+        self.saved[location] = paths
+        self.changed.emit()
+
+    def handle_failed(self, location, message):
+        self.in_flight.pop(location, None)
+        self.failures += 1
+        self.logger.error(f"Auto save failed for {location}: {message}")
+        self.failed.emit(location, message)
+        self.changed.emit()
+
+    def shutdown(self, timeout_ms=30000):
+        """앱 종료 시 새 저장은 받지 않고, 대기 중인 것까지 남은 저장이 끝나길 기다린다
+
+        프로세스 풀을 닫기 전에 호출한다. timeout_ms 안에 끝나지 않으면 저장하지 못한 결과를 로그에 남긴다.
+        """
+        self.closed = True
+        if self.pool.waitForDone(timeout_ms):
+            return
+        # 끝난 작업의 완료 시그널(대기열 연결)을 반영한 뒤 남은 것만 기록
+        QCoreApplication.processEvents()
+        for location, base_name in self.in_flight.items():
+            self.logger.error(f"Auto save not finished before exit: {base_name} ({location})")
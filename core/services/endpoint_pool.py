@@ -0,0 +1,187 @@
+# core/services/endpoint_pool.py
+import logging
+import threading
+import time
+
+from utils.config_manager import get_config
+from utils.http_client import get_http_client
+
+DEFAULT_ENDPOINTS = [
+    # "http://mldinos.sogang.ac.kr:58888/image/",
+    "http://172.16.6.92:58888/image/",
+]
+
+
+class Endpoint:
+    """세그멘테이션 서버 하나의 상태"""
+
+    # 지연시간 지수이동평균 가중치
+    LATENCY_ALPHA = 0.3
+
+    def __init__(self, url, weight=1.0):
+        self.url = url if url.endswith('/') else url + '/'
+        self.weight = max(float(weight), 0.01)
+        self.outstanding = 0
+        self.healthy = True
+        self.down_until = 0.0
+        self.failures = 0
+        self.latency = None
+
+    def is_available(self, now):
+        return self.healthy or now >= self.down_until
+
+    def observe_latency(self, seconds):
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency = self.LATENCY_ALPHA * seconds + (1 - self.LATENCY_ALPHA) * self.latency
+
+    def __repr__(self):
+        return f"Endpoint({self.url}, outstanding={self.outstanding}, healthy={self.healthy})"
+
+
+class EndpointPool:
+    """여러 세그멘테이션 서버 사이의 부하 분산과 장애 조치
+
+    새 업로드는 가중치 대비 진행 중 작업 수가 가장 적은 서버로 보낸다.
+    토큰은 발급한 서버에서만 조회할 수 있으므로 작업은 업로드한 Endpoint 를
+    결과를 받을 때까지 쥐고 있다가 release() 한다.
+    """
+
+    def __init__(self, endpoints, jobs_per_endpoint=2, down_cooldown=30.0, slow_threshold=10.0,
+                 health_interval=30.0, failure_threshold=3):
+        self.endpoints = [self._make_endpoint(e) for e in endpoints]
+        if not self.endpoints:
+            raise ValueError("서버 주소가 설정되지 않았습니다.")
+
+        self.jobs_per_endpoint = jobs_per_endpoint
+        self.down_cooldown = down_cooldown
+        self.slow_threshold = slow_threshold
+        self.health_interval = health_interval
+        # 업로드가 이만큼 연달아 실패해야 죽은 서버로 표시 (요청 하나의 5xx 로 배치 전체가 막히지 않게)
+        self.failure_threshold = failure_threshold
+
+        self._lock = threading.Lock()
+        self._health_thread = None
+        self._stop_event = threading.Event()
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def _make_endpoint(entry):
+        if isinstance(entry, Endpoint):
+            return entry
+        if isinstance(entry, dict):
+            return Endpoint(entry['url'], entry.get('weight', 1.0))
+        return Endpoint(entry)
+
+    def __len__(self):
+        return len(self.endpoints)
+
+    @property
+    def capacity(self):
+        """동시에 진행할 수 있는 작업 수"""
+        return len(self.endpoints) * self.jobs_per_endpoint
+
+    def _score(self, endpoint):
+        weight = endpoint.weight
+        if endpoint.latency is not None and endpoint.latency > self.slow_threshold:
+            # 응답이 느린 서버는 가중치를 크게 낮춰 다른 서버가 우선 선택되게 한다
+            weight *= 0.25
+        return (endpoint.outstanding + 1) / weight, endpoint.latency or 0.0
+
+    def acquire(self, exclude=(), include_down=False):
+        """업로드할 서버를 골라 진행 중 작업 수를 올린다. 고를 서버가 없으면 None
+
+        include_down 이면(재시도) 살아 있는 서버가 없을 때 가장 먼저 복구 예정인 서버를 시험 삼아 고른다.
+        성공하면 record_success 로 다시 살아난다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [e for e in self.endpoints if e not in exclude and e.is_available(now)]
+            if not candidates and include_down:
+                probes = [e for e in self.endpoints if e not in exclude]
+                if probes:
+                    endpoint = min(probes, key=lambda e: e.down_until)
+                    endpoint.outstanding += 1
+                    return endpoint
+            if not candidates:
+                return None
+            endpoint = min(candidates, key=self._score)
+            endpoint.outstanding += 1
+            return endpoint
+
+    def release(self, endpoint):
+        with self._lock:
+            endpoint.outstanding = max(0, endpoint.outstanding - 1)
+
+    def record_success(self, endpoint, latency):
+        with self._lock:
+            endpoint.observe_latency(latency)
+            endpoint.failures = 0
+            endpoint.healthy = True
+
+    def record_failure(self, endpoint, reason=""):
+        """업로드 실패 기록. 연속 실패가 failure_threshold 에 이르면 죽은 서버로 표시"""
+        with self._lock:
+            endpoint.failures += 1
+            reached = endpoint.failures >= self.failure_threshold
+        if reached:
+            self.mark_down(endpoint, reason)
+        return reached
+
+    def mark_down(self, endpoint, reason=""):
+        with self._lock:
+            endpoint.failures = max(endpoint.failures, 1)
+            endpoint.healthy = False
+            endpoint.down_until = time.monotonic() + self.down_cooldown
+        self.logger.warning(f"Endpoint {endpoint.url} marked down: {reason}")
+
+    def endpoint_for_url(self, url):
+        for endpoint in self.endpoints:
+            if url.startswith(endpoint.url):
+                return endpoint
+        return None
+
+    # 상태 점검
+    def check_health(self):
+        import requests
+        client = get_http_client()
+        for endpoint in self.endpoints:
+            start = time.monotonic()
+            try:
+                response = client.get(endpoint.url, timeout=(2.0, 5.0))
+                alive = response.status_code < 500
+            except requests.RequestException:
+                alive = False
+
+            if alive:
+                self.record_success(endpoint, time.monotonic() - start)
+            elif endpoint.healthy:
+                self.mark_down(endpoint, "health check failed")
+
+    def start_health_checks(self):
+        if self._health_thread is not None or self.health_interval <= 0:
+            return
+        self._stop_event.clear()
+        self._health_thread = threading.Thread(target=self._health_loop, name="endpoint-health", daemon=True)
+        self._health_thread.start()
+
+    def stop_health_checks(self):
+        self._stop_event.set()
+        self._health_thread = None
+
+    def _health_loop(self):
+        while not self._stop_event.is_set():
+            try:
+                self.check_health()
+            except Exception as e:
+                self.logger.error(f"Health check error: {str(e)}")
+            self._stop_event.wait(self.health_interval)
+
+
+def load_endpoints():
+    """config.json 의 'endpoints' 항목을 읽는다. 없으면 기본 서버 사용
+
+    항목은 URL 문자열 또는 {"url": ..., "weight": ...} 형식이다.
+    """
+    return get_config().get('endpoints') or list(DEFAULT_ENDPOINTS)
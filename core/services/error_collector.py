@@ -0,0 +1,138 @@
+# core/services/error_collector.py
+import re
+import time
+from collections import OrderedDict
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+CAUSE_CONNECT = "서버에 연결할 수 없음"
+CAUSE_TIMEOUT = "서버 응답 시간 초과"
+CAUSE_OVERLOAD = "서버 과부하"
+CAUSE_SERVER_ERROR = "서버 오류 (5xx)"
+CAUSE_CLIENT_ERROR = "요청 거부 (4xx)"
+
+# 자주 보는 원인은 메시지 대신 짧은 설명으로 묶는다: (정규식, 설명). 앞에서부터 처음 맞는 것을 쓴다
+# requests 의 메시지에는 모두 'HTTPConnectionPool(...)' 이 들어 있으므로 connect 같은 넓은 단어로 묶지 않는다
+KNOWN_CAUSES = [
+    (re.compile(r'ConnectTimeout|connect timeout', re.IGNORECASE), CAUSE_CONNECT),
+    (re.compile(r'timed? ?out|Timeout', re.IGNORECASE), CAUSE_TIMEOUT),
+    (re.compile(r'사용 가능한 서버가 없습니다|ConnectionError|Failed to establish|Max retries'
+                r'|Connection (aborted|refused|reset)', re.IGNORECASE), CAUSE_CONNECT),
+    (re.compile(r'\b(429|503)\b'), CAUSE_OVERLOAD),
+    (re.compile(r'\b5\d\d\b.*Error|Server Error', re.IGNORECASE), CAUSE_SERVER_ERROR),
+    (re.compile(r'\b4\d\d\b.*Error|Client Error', re.IGNORECASE), CAUSE_CLIENT_ERROR),
+    (re.compile(r'처리 결과를 받지 못했습니다'), "처리 결과 대기 시간 초과"),
+    (re.compile(r'해석할 수 없습니다|디코딩|decode', re.IGNORECASE), "결과 이미지 손상"),
+    (re.compile(r'No such file|열 수 없습니다|Permission denied', re.IGNORECASE), "원본 파일을 읽을 수 없음"),
+]
+
+_URL = re.compile(r'https?://\S+')
+_PATH = re.compile(r'(?:[A-Za-z]:)?[\\/][^\s:\'"]+')
+_NUMBER = re.compile(r'\b[0-9a-f]{8,}\b|\b\d+\b')
+
+
+def exception_cause(error):
+    """예외 종류(원인 사슬 포함)로 원인을 고른다. 종류로 알 수 없으면 None"""
+    import requests
+    while error is not None:
+        # ConnectTimeout 은 Timeout 이면서 ConnectionError 이다. 연결을 맺지 못한 경우로 본다
+        if isinstance(error, requests.ConnectTimeout):
+            return CAUSE_CONNECT
+        if isinstance(error, requests.Timeout):
+            return CAUSE_TIMEOUT
+        if isinstance(error, requests.ConnectionError):
+            return CAUSE_CONNECT
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            status = error.response.status_code
+            if status in (429, 503):
+                return CAUSE_OVERLOAD
+            if status >= 500:
+                return CAUSE_SERVER_ERROR
+            if status >= 400:
+                return CAUSE_CLIENT_ERROR
+        error = error.__cause__
+    return None
+
+
+def error_cause(message, error=None):
+    """오류를 원인별로 묶을 키로 바꾼다. 예외가 있으면 종류로, 없으면 메시지로 판단한다
+
+    메시지로 판단할 때 알려진 원인이 아니면 파일 경로, URL, 토큰, 숫자를 지운 메시지를 쓴다.
+
+    >>> error_cause("HTTPConnectionPool(host='a', port=80): Read timed out. (read timeout=60)")
+    '서버 응답 시간 초과'
+    >>> error_cause("HTTPConnectionPool(host='a', port=80): Max retries exceeded with url: / "
+    ...             "(Caused by ConnectTimeoutError(None, 'Connection to a timed out. (connect timeout=5)'))")
+    '서버에 연결할 수 없음'
+    >>> error_cause("HTTPConnectionPool(host='a', port=1): Max retries exceeded with url: / "
+    ...             "(Caused by NewConnectionError('Failed to establish a new connection'))")
+    '서버에 연결할 수 없음'
+    >>> error_cause("404 Client Error: Not Found for url: http://a/connect/result.png")
+    '요청 거부 (4xx)'
+    >>> error_cause("503 Server Error: Service Unavailable for url: http://a/image/")
+    '서버 과부하'
+    """
+    cause = exception_cause(error) if error is not None else None
+    if cause is not None:
+        return cause
+    for pattern, cause in KNOWN_CAUSES:
+        if pattern.search(message):
+            return cause
+    normalized = _NUMBER.sub('#', _PATH.sub('<path>', _URL.sub('<url>', message)))
+    return normalized.strip().splitlines()[0][:120] if normalized.strip() else "알 수 없는 오류"
+
+
+class Failure:
+    def __init__(self, file_path, message, parameters, cause=None):
+        self.file_path = file_path
+        self.message = message
+        self.parameters = parameters
+        self.cause = cause or error_cause(message)
+        self.time = time.time()
+
+
+class ErrorCollector(QObject):
+    """처리에 실패한 파일을 원인별로 모아 두는 곳
+
+    같은 파일이 다시 실패하면 마지막 실패로 바꾸고, 나중에 성공하면 목록에서 빠진다.
+    GUI 스레드에서만 사용한다.
+    """
+    changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.failures = OrderedDict()  # {file_path: Failure}
+
+    def add_failures(self, failures):
+        """[(file_path, message, parameters, cause)] cause 는 워커가 예외 종류로 고른 원인 (없으면 빈 문자열)"""
+        for file_path, message, parameters, cause in failures:
+            self.failures.pop(file_path, None)
+            self.failures[file_path] = Failure(file_path, message, parameters, cause)
+        if failures:
+            self.changed.emit()
+
+    def discard(self, file_paths):
+        removed = [self.failures.pop(file_path) for file_path in file_paths if file_path in self.failures]
+        if removed:
+            self.changed.emit()
+        return removed
+
+    def groups(self):
+        """[(원인, [Failure, ...])] 건수가 많은 원인부터"""
+        grouped = OrderedDict()
+        for failure in self.failures.values():
+            grouped.setdefault(failure.cause, []).append(failure)
+        return sorted(grouped.items(), key=lambda item: len(item[1]), reverse=True)
+
+    def take(self, cause=None):
+        """원인이 cause 인(없으면 전부) 실패 항목을 목록에서 꺼낸다"""
+        taken = [failure for failure in self.failures.values() if cause is None or failure.cause == cause]
+        return self.discard([failure.file_path for failure in taken])
+
+    def clear(self):
+        if self.failures:
+            self.failures.clear()
+            self.changed.emit()
+
+    def __len__(self):
+        return len(self.failures)
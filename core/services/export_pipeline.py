@@ -0,0 +1,214 @@
+# core/services/export_pipeline.py
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from PyQt5.QtCore import QThread, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QPainter, QColor
+
+from core.services.auto_crop import crop_to_content
+from core.services.process_pool import get_process_pool, share_bytes
+from utils.http_client import get_http_client
+from utils.config_manager import get_config
+from utils.metrics import metrics
+
+# 형식별 확장자와 QImage 저장 형식
+EXPORT_FORMATS = {
+    'png': ('png', 'PNG'),
+    'jpg': ('jpg', 'JPG'),
+    'jpeg': ('jpg', 'JPG'),
+    'webp': ('webp', 'WEBP'),
+}
+
+# 알파 채널이 없는 형식은 배경색을 지정하지 않으면 흰색으로 채운다
+OPAQUE_FORMATS = ('jpg', 'jpeg')
+
+# 기본값은 예전과 같이 서버 결과를 {파일명}_result.png 로 그대로 저장
+DEFAULT_EXPORT_PRESETS = [
+    {'name': 'result', 'format': 'png'},
+]
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def normalize_preset(preset):
+    """설정 파일의 프리셋 항목을 빠진 값 없이 채운다"""
+    name = preset.get('name') or preset.get('format', 'png')
+    image_format = preset.get('format', 'png').lower()
+    if image_format not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 내보내기 형식입니다: {image_format}")
+    return {
+        'name': name,
+        'format': image_format,
+        'quality': int(preset.get('quality', -1)),
+        'max_size': int(preset.get('max_size', 0)),
+        'background': preset.get('background'),
+        'auto_crop': bool(preset.get('auto_crop', False)),
+        'crop_padding': int(preset.get('crop_padding', 0)),
+        'suffix': preset.get('suffix', f"_{name}"),
+    }
+
+
+def load_export_presets():
+    """설정의 'export_presets' 항목을 읽는다. 없으면 기본 프리셋 사용"""
+    presets = get_config().get('export_presets')
+    return [normalize_preset(preset) for preset in (presets or DEFAULT_EXPORT_PRESETS)]
+
+
+def can_stream(preset):
+    """PNG 결과라면 받은 바이트를 그대로 저장하는 프리셋인지 (데이터를 보기 전에 판단)"""
+    return (preset['format'] == 'png' and not preset['auto_crop']
+            and not preset['max_size'] and not preset['background'])
+
+
+# 아래 함수들은 별도 프로세스에서 실행된다
+def is_passthrough(preset, data):
+    """변환 없이 받은 바이트를 그대로 써도 되는 프리셋인지"""
+    return can_stream(preset) and data[:8] == PNG_SIGNATURE
+
+
+def render_variant(image, preset):
+    if preset['auto_crop']:
+        image, _ = crop_to_content(image, preset['crop_padding'])
+
+    max_size = preset['max_size']
+    if max_size and (image.width() > max_size or image.height() > max_size):
+        image = image.scaled(max_size, max_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    background = preset['background'] or ('#ffffff' if preset['format'] in OPAQUE_FORMATS else None)
+    if background:
+        filled = QImage(image.size(), QImage.Format_RGB32)
+        filled.fill(QColor(background))
+        painter = QPainter(filled)
+        painter.drawImage(0, 0, image)
+        painter.end()
+        image = filled
+    return image
+
+
+def write_atomic(path, writer):
+    """같은 폴더의 임시 파일에 쓴 뒤 이름을 바꿔, 중간에 실패해도 반쯤 쓴 파일이 남지 않게 한다"""
+    temp_path = path + '.part'
+    try:
+        writer(temp_path)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def export_result(data, base_name, output_dir, presets):
+    """결과 이미지 한 장을 모든 프리셋으로 저장. [(경로, 바이트 수)] 와 걸린 시간을 반환"""
+    started = time.perf_counter()
+    outputs = []
+    image = None
+
+    for preset in presets:
+        extension, qt_format = EXPORT_FORMATS[preset['format']]
+        output_path = os.path.join(output_dir, f"{base_name}{preset['suffix']}.{extension}")
+
+        if is_passthrough(preset, data):
+            def writer(path):
+                with open(path, 'wb') as f:
+                    f.write(data)
+        else:
+            # 디코딩은 프리셋이 몇 개든 한 번만
+            if image is None:
+                image = QImage.fromData(data)
+                if image.isNull():
+                    raise Exception(f"결과 이미지를 디코딩할 수 없습니다: {base_name}")
+                image = image.convertToFormat(QImage.Format_ARGB32)
+            variant = render_variant(image, preset)
+
+            def writer(path):
+                if not variant.save(path, qt_format, preset['quality']):
+                    raise Exception(f"{preset['name']} 형식으로 저장하지 못했습니다: {base_name}")
+
+        write_atomic(output_path, writer)
+        outputs.append((output_path, os.path.getsize(output_path)))
+
+    return outputs, time.perf_counter() - started
+
+
+class ExportWorker(QThread):
+    """결과를 받아 프리셋별로 변환/인코딩해 저장
+
+    받기는 이 스레드에서 공유 커넥션 풀로 하고, 디코딩/변환/인코딩은 공유 프로세스 풀에서 병렬로 한다.
+    받은 바이트는 공유 메모리로 넘기며, 메모리에 쌓이지 않도록 넘긴 작업은 워커 수의 두 배까지만 둔다.
+    """
+    progress = pyqtSignal(int)
+    file_exported = pyqtSignal(str)
+    error = pyqtSignal(str)
+    finished = pyqtSignal(list)
+
+    def __init__(self, items, output_dir, presets):
+        """items: [(결과 위치, 저장할 기본 파일명)]"""
+        super().__init__()
+        self.items = list(items)
+        self.output_dir = output_dir
+        self.presets = presets
+        self.is_running = True
+
+    def stop(self):
+        self.is_running = False
+
+    def run(self):
+        exported = []
+        errors = []
+        total = len(self.items)
+        done = 0
+
+        pending = {}
+        try:
+            pool = get_process_pool()
+            items = iter(self.items)
+
+            while self.is_running:
+                # 처리 중인 작업이 적으면 다음 결과를 받아 넘긴다
+                while len(pending) < pool.max_workers * 2:
+                    item = next(items, None)
+                    if item is None:
+                        break
+                    location, base_name = item
+                    try:
+                        with metrics.span(None, 'export_fetch', file=base_name):
+                            data = share_bytes(get_http_client().fetch_bytes(location))
+                    except Exception as e:
+                        errors.append(f"{base_name}: {str(e)}")
+                        done += 1
+                        continue
+                    future = pool.submit(export_result, data, base_name, self.output_dir, self.presets)
+                    pending[future] = (base_name, data)
+
+                if not pending:
+                    break
+
+                completed, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    base_name, data = pending.pop(future)
+                    data.release()
+                    done += 1
+                    try:
+                        outputs, elapsed = future.result()
+                        metrics.observe('export.encode', elapsed)
+                        for path, _ in outputs:
+                            exported.append(path)
+                            self.file_exported.emit(path)
+                    except Exception as e:
+                        errors.append(f"{base_name}: {str(e)}")
+                    self.progress.emit(int(done * 100 / total))
+        except Exception as e:
+            errors.append(str(e))
+        finally:
+            # 중단된 경우 남은 작업을 취소하고, 자식 프로세스가 다 쓴 뒤에 공유 메모리를 해제
+            for future in pending:
+                future.cancel()
+            if pending:
+                wait(pending)
+            for _, data in pending.values():
+                data.release()
+
+        if errors:
+            self.error.emit("\n".join(errors))
+        self.finished.emit(exported)
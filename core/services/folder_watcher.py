@@ -0,0 +1,152 @@
+# core/services/folder_watcher.py
+import logging
+import os
+import time
+
+from PyQt5.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+
+ALLOWED_FORMATS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+class FolderWatcher(QObject):
+    """감시 폴더에 새로 들어온 이미지를 찾아 알려준다
+
+    QFileSystemWatcher(Linux 는 inotify)로 폴더 변경 알림을 받고, 알림을 쓸 수 없는 경우
+    (네트워크 드라이브 등) 주기적으로 폴더를 다시 읽는다.
+    복사 중인 파일을 잡지 않도록 크기와 수정 시각이 settle_time 동안 변하지 않고
+    읽기로 열 수 있을 때만 files_ready 로 내보낸다.
+    """
+    files_ready = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+    SCAN_DEBOUNCE_MS = 300
+    SETTLE_CHECK_MS = 500
+
+    def __init__(self, parent=None, settle_time=1.0, poll_interval=2.0, force_polling=False):
+        super().__init__(parent)
+        self.settle_time = settle_time
+        self.force_polling = force_polling
+        self.directory = None
+        self.polling = False
+        self.logger = logging.getLogger(__name__)
+
+        # 이미 알린 파일과 아직 쓰이는 중인 파일 {경로: (크기, 수정 시각, 마지막 변화 시각)}
+        self.known_files = set()
+        self.pending_files = {}
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.schedule_scan)
+
+        self.scan_timer = QTimer(self)
+        self.scan_timer.setSingleShot(True)
+        self.scan_timer.setInterval(self.SCAN_DEBOUNCE_MS)
+        self.scan_timer.timeout.connect(self.scan)
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(int(poll_interval * 1000))
+        self.poll_timer.timeout.connect(self.scan)
+
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setInterval(self.SETTLE_CHECK_MS)
+        self.settle_timer.timeout.connect(self.check_pending)
+
+    def start(self, directory, include_existing=False):
+        """directory 감시 시작. include_existing 이면 이미 있던 이미지도 새 파일로 취급"""
+        self.stop()
+        if not os.path.isdir(directory):
+            self.error.emit(f"감시할 폴더가 없습니다: {directory}")
+            return False
+
+        self.directory = directory
+        self.known_files = set() if include_existing else set(self.list_images())
+        self.pending_files = {}
+
+        self.polling = self.force_polling or not self.watcher.addPath(directory)
+        if self.polling:
+            self.logger.info(f"Watching {directory} by polling")
+            self.poll_timer.start()
+        else:
+            self.logger.info(f"Watching {directory} with filesystem notifications")
+
+        if include_existing:
+            self.scan()
+        return True
+
+    def stop(self):
+        if self.watcher.directories():
+            self.watcher.removePaths(self.watcher.directories())
+        self.scan_timer.stop()
+        self.poll_timer.stop()
+        self.settle_timer.stop()
+        self.directory = None
+        self.pending_files = {}
+
+    def is_watching(self):
+        return self.directory is not None
+
+    def list_images(self):
+        try:
+            with os.scandir(self.directory) as entries:
+                return [entry.path for entry in entries
+                        if entry.is_file() and entry.name.lower().endswith(ALLOWED_FORMATS)]
+        except OSError as e:
+            self.logger.error(f"Failed to scan watch folder: {str(e)}")
+            return []
+
+    def schedule_scan(self, path=None):
+        # 파일 하나를 복사하는 동안에도 알림이 여러 번 오므로 모아서 한 번만 읽는다
+        self.scan_timer.start()
+
+    def scan(self):
+        if self.directory is None:
+            return
+        now = time.monotonic()
+        for path in self.list_images():
+            if path in self.known_files or path in self.pending_files:
+                continue
+            stat = self.stat(path)
+            if stat is not None:
+                self.pending_files[path] = (stat[0], stat[1], now)
+
+        if self.pending_files and not self.settle_timer.isActive():
+            self.settle_timer.start()
+
+    def check_pending(self):
+        now = time.monotonic()
+        ready = []
+        for path, (size, mtime, changed_at) in list(self.pending_files.items()):
+            stat = self.stat(path)
+            if stat is None:
+                # 쓰는 도중 삭제/이름 변경된 파일
+                del self.pending_files[path]
+                continue
+            if stat != (size, mtime) or stat[0] == 0:
+                self.pending_files[path] = (stat[0], stat[1], now)
+                continue
+            if now - changed_at >= self.settle_time and self.is_readable(path):
+                del self.pending_files[path]
+                self.known_files.add(path)
+                ready.append(path)
+
+        if not self.pending_files:
+            self.settle_timer.stop()
+        if ready:
+            self.files_ready.emit(sorted(ready))
+
+    @staticmethod
+    def stat(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def is_readable(path):
+        # Windows 에서는 복사 중인 파일을 열 수 없다
+        try:
+            with open(path, 'rb') as f:
+                f.read(1)
+            return True
+        except OSError:
+            return False
@@ -0,0 +1,185 @@
+# core/services/image_decoder.py
+from PyQt5.QtCore import Qt, QObject, QRunnable, QRect, QSize, QBuffer, QByteArray, QIODevice, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader, QImageIOHandler
+
+from core.services.result_store import get_result_store
+from utils.http_client import get_http_client
+from utils.metrics import metrics
+
+
+def _open_reader(data):
+    # QByteArray.fromRawData 는 data 버퍼를 복사하지 않고 그대로 가리킨다.
+    # QBuffer 는 QByteArray 를 참조만 하므로 raw 도 읽는 동안 살아 있어야 한다
+    raw = QByteArray.fromRawData(data)
+    buffer = QBuffer(raw)
+    buffer.open(QIODevice.ReadOnly)
+    return raw, buffer, QImageReader(buffer)
+
+
+def read_image_size(data):
+    """디코딩 없이 헤더만 읽어 원본 크기를 반환"""
+    raw, buffer, reader = _open_reader(data)
+    try:
+        return reader.size()
+    finally:
+        buffer.close()
+
+
+def supports_scaled_decode(data):
+    """JPEG 처럼 디코더가 직접 축소 디코딩을 지원하는 형식인지"""
+    raw, buffer, reader = _open_reader(data)
+    try:
+        return reader.supportsOption(QImageIOHandler.ScaledSize)
+    finally:
+        buffer.close()
+
+
+def is_decodable_file(path):
+    """파일 끝까지 디코딩되는 이미지인지 (잘린 다운로드 검사용)"""
+    return not QImageReader(path).read().isNull()
+
+
+def decode_image(data, scaled_to=None, clip_rect=None):
+    """메모리의 이미지 바이트를 QImage 로 디코딩
+
+    data 는 복사 없이 읽으므로 이 함수가 끝날 때까지 살아 있어야 한다 (호출 측 지역 변수면 충분).
+    clip_rect 를 주면 원본 좌표계의 그 영역만 읽고, scaled_to 를 주면 읽기 단계에서
+    그 크기 안으로 축소해 전체 해상도 결과를 만들지 않는다.
+    반환값: (QImage, 원본 크기 QSize)
+    """
+    raw, buffer, reader = _open_reader(data)
+    try:
+        full_size = reader.size()
+        source_size = full_size
+        if clip_rect is not None:
+            reader.setClipRect(clip_rect)
+            source_size = clip_rect.size()
+        if scaled_to is not None and source_size.isValid():
+            if source_size.width() > scaled_to.width() or source_size.height() > scaled_to.height():
+                reader.setScaledSize(source_size.scaled(scaled_to, Qt.KeepAspectRatio))
+
+        image = reader.read()
+        if image.isNull():
+            raise Exception(f"이미지를 디코딩할 수 없습니다: {reader.errorString()}")
+        # read() 결과는 자체 메모리에 디코딩되므로 버퍼가 해제되어도 안전하다
+        return image, full_size
+    finally:
+        buffer.close()
+
+
+class ImageDecodeWorker(QRunnable):
+    """결과 이미지를 받아 워커 스레드에서 디코딩/축소하고 QImage 만 GUI 스레드로 넘긴다
+
+    먼저 빠른 축소본(preview)을 보내고, 부드럽게 축소한 최종본(decoded)을 이어서 보낸다.
+    원본 바이트는 확대 시 필요한 영역만 다시 디코딩할 수 있도록 source_loaded 로 넘긴다.
+    화면보다 큰 결과는 압축 타일로 ResultImageStore 에 넣어 두고, 다음에 다시 열면
+    받기/디코딩 없이 저장된 작은 단계에서 바로 그린다.
+    """
+
+    class Signals(QObject):
+        source_loaded = pyqtSignal(int, str, object, QSize)
+        preview = pyqtSignal(int, str, QImage)
+        decoded = pyqtSignal(int, str, QImage)
+        failed = pyqtSignal(int, str, str)
+
+    def __init__(self, request_id, location, display_size=None, source_path=None):
+        super().__init__()
+        self.signals = self.Signals()
+        self.request_id = request_id
+        self.location = location
+        self.display_size = display_size
+        self.source_path = source_path
+
+    def run(self):
+        try:
+            if self.display_size is not None and self.render_from_store():
+                return
+
+            with metrics.span(None, 'result_fetch', file=self.source_path):
+                content = get_http_client().fetch_bytes(self.location)
+            self.signals.source_loaded.emit(self.request_id, self.location, content, read_image_size(content))
+
+            with metrics.span(None, 'decode', file=self.source_path):
+                if self.display_size is None:
+                    image, _ = decode_image(content)
+                    self.signals.decoded.emit(self.request_id, self.location, image)
+                    return
+
+                # 1단계: 디코더가 축소 디코딩을 지원하면 그대로, 아니면 전체 디코딩 후 빠른 축소
+                if supports_scaled_decode(content):
+                    preview, _ = decode_image(content, scaled_to=self.display_size)
+                    self.signals.preview.emit(self.request_id, self.location, preview)
+                    image, _ = decode_image(content)
+                else:
+                    image, _ = decode_image(content)
+                    if self.fits(image):
+                        self.signals.decoded.emit(self.request_id, self.location, image)
+                        return
+                    preview = image.scaled(self.display_size, Qt.KeepAspectRatio, Qt.FastTransformation)
+                    self.signals.preview.emit(self.request_id, self.location, preview)
+
+                # 2단계: 고품질 축소본으로 교체
+                full_image = image
+                if not self.fits(image):
+                    image = image.scaled(self.display_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            self.signals.decoded.emit(self.request_id, self.location, image)
+
+            # 전체 해상도 QImage 는 여기서 버리고 압축 타일만 남긴다
+            if not self.fits(full_image):
+                get_result_store().put_image(self.location, full_image)
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, self.location, str(e))
+
+    def render_from_store(self):
+        store = get_result_store()
+        tiled = store.get(self.location)
+        if tiled is None:
+            return False
+
+        size = tiled.size
+        scale = min(1.0, self.display_size.width() / size.width(), self.display_size.height() / size.height())
+        with metrics.span(None, 'decode', file=self.source_path, cached=True):
+            image = store.render_region(self.location, QRect(0, 0, size.width(), size.height()), scale)
+        if image is None:
+            return False
+
+        self.signals.source_loaded.emit(self.request_id, self.location, None, size)
+        self.signals.decoded.emit(self.request_id, self.location, image)
+        return True
+
+    def fits(self, image):
+        return image.width() <= self.display_size.width() and image.height() <= self.display_size.height()
+
+
+class RegionDecodeWorker(QRunnable):
+    """확대된 뷰에 보이는 영역만 필요한 해상도로 디코딩
+
+    타일 저장소에 있으면 겹치는 타일만 풀어 쓰고, 없으면 원본 바이트에서 그 영역만 읽는다.
+    """
+
+    class Signals(QObject):
+        decoded = pyqtSignal(int, QRect, QImage)
+        failed = pyqtSignal(int, str)
+
+    def __init__(self, request_id, location, data, clip_rect, scale):
+        super().__init__()
+        self.signals = self.Signals()
+        self.request_id = request_id
+        self.location = location
+        self.data = data
+        self.clip_rect = clip_rect
+        self.scale = scale
+
+    def run(self):
+        try:
+            with metrics.span(None, 'tile_decode'):
+                image = get_result_store().render_region(self.location, self.clip_rect, self.scale)
+                if image is None:
+                    if self.data is None:
+                        raise Exception("확대 영역을 그릴 원본이 없습니다.")
+                    target_size = QSize(max(1, round(self.clip_rect.width() * self.scale)),
+                                        max(1, round(self.clip_rect.height() * self.scale)))
+                    image, _ = decode_image(self.data, scaled_to=target_size, clip_rect=self.clip_rect)
+            self.signals.decoded.emit(self.request_id, self.clip_rect, image)
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, str(e))
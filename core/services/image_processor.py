@@ -4,55 +4,171 @@ import traceback
 
 from PyQt5.QtWidgets import QProgressDialog, QMessageBox
 from PyQt5.QtCore import Qt, QObject, pyqtSignal
-from core.dialog.parameter_input_dialog import ParameterInputDialog
-from utils.worker_thread import WorkerThread
+from core.services.job_queue import JobQueue, PRIORITY_NORMAL, PRIORITY_LOW
+from core.services.endpoint_pool import EndpointPool, load_endpoints
+from utils.path_manager import PathManager
+from utils.config_manager import get_config
+from utils.rate_controller import AdaptiveConcurrencyController
+from utils.retry_policy import RetryBudget, RetryPolicy
+from utils.metrics import metrics
+from utils.signal_batcher import SignalBatcher
+from core.services.error_collector import ErrorCollector
 import os
 
 class ImageProcessor(QObject):
     progress_updated = pyqtSignal(int)
     process_finished = pyqtSignal()
     error_occurred = pyqtSignal(str)
-    image_processed = pyqtSignal(str, dict)
+    images_processed = pyqtSignal(list)  # [(file_path, result)]
 
     def __init__(self, main_ui):
         super().__init__()
         self.main_ui = main_ui
         self.progress = None
-        self.worker = None
-        # self.api_url = "http://mldinos.sogang.ac.kr:58888/image/"
-        self.api_url = "http://172.16.6.92:58888/image/"
-
-    def send_selected_images(self, selected_files):
+        # 서버 목록과 동시성 설정은 config.json 에서 읽는다
+        config = get_config()
+        self.endpoint_pool = EndpointPool(load_endpoints(),
+                                          jobs_per_endpoint=config.get('jobs_per_endpoint'),
+                                          health_interval=config.get('health_interval'))
+        # 배치가 바뀌어도 서버 혼잡 상태를 이어서 반영하도록 하나를 공유한다
+        self.controller = AdaptiveConcurrencyController(
+            max_limit=config.get('max_concurrency') or self.endpoint_pool.capacity * 2,
+            initial_limit=self.endpoint_pool.capacity
+        )
+
+        # 작업별 구간 기록을 로그 파일 옆에 JSON lines 로 남긴다
+        metrics.set_export_path(PathManager.get_metrics_path())
+
+        # 감시 폴더 자동 처리는 마지막으로 사용한 파라미터로 진행 (없으면 처리할 때 기본값)
+        self.config = config
+        self.last_parameters = config.get('last_parameters')
+
+        # 처리 대기열. 이를 계속 비우는 처리 스레드는 첫 화면을 그린 뒤(warm_up)나 처음 쓸 때 만든다
+        self.job_queue = JobQueue()
+        self._worker = None
+
+        # 파일마다 오는 결과/진행률/오류는 워커 스레드에서 모아 50ms 마다 한 번씩 GUI 에 반영
+        self.result_batcher = SignalBatcher(50, self)
+        self.result_batcher.flushed.connect(self.handle_results)
+        self.error_batcher = SignalBatcher(50, self)
+        self.error_batcher.flushed.connect(self.handle_errors)
+        # 파일별 실패는 창을 띄우지 않고 원인별로 모아 둔다 (오류 창에서 다시 처리)
+        self.errors = ErrorCollector(self)
+        self.failure_batcher = SignalBatcher(50, self)
+        self.failure_batcher.flushed.connect(self.errors.add_failures)
+        self.progress_batcher = SignalBatcher(50, self)
+        self.progress_batcher.flushed.connect(lambda values: self.update_progress(values[-1]))
+        self.status_batcher = SignalBatcher(50, self)
+        self.status_batcher.flushed.connect(lambda statuses: self.update_queue_status(*statuses[-1]))
+
+        # 이번 처리에 사용자가 직접 보낸 작업이 있었는지 (없으면 완료 알림을 띄우지 않는다)
+        self.interactive_run = False
+
+    @property
+    def worker(self):
+        if self._worker is None:
+            self._worker = self.create_worker()
+        return self._worker
+
+    def create_worker(self):
+        # 처리 스레드 모듈은 numpy/requests 를 불러오므로 필요할 때 import 한다
+        from utils.worker_thread import QueueWorkerThread
+        self.endpoint_pool.start_health_checks()
+        config = self.config
+        retry_policy = RetryPolicy(max_retries=config.get('max_retries'), base_delay=config.get('retry_delay'),
+                                   max_delay=config.get('retry_max_delay'))
+        retry_budget = RetryBudget(ratio=config.get('retry_budget_ratio'))
+        worker = QueueWorkerThread(self.job_queue, self.endpoint_pool, self.controller,
+                                   retry_policy=retry_policy, retry_budget=retry_budget)
+        worker.result.connect(self.result_batcher.add, Qt.DirectConnection)
+        worker.error.connect(self.error_batcher.add, Qt.DirectConnection)
+        worker.failed.connect(self.failure_batcher.add, Qt.DirectConnection)
+        worker.progress.connect(self.progress_batcher.add, Qt.DirectConnection)
+        worker.queue_changed.connect(self.status_batcher.add, Qt.DirectConnection)
+        worker.finished.connect(self.process_results)
+        worker.start()
+        return worker
+
+    def warm_up(self):
+        """첫 화면을 그린 뒤 호출. 서버 상태 확인과 처리 스레드를 미리 시작해 둔다"""
+        return self.worker
+
+    def send_selected_images(self, selected_files, parameter_overrides=None):
         try:
             if not selected_files:
                 self.error_occurred.emit("선택된 파일이 없습니다.")
                 return
 
             # Show parameter input dialog
-            param_dialog = ParameterInputDialog(self.main_ui)
+            from core.dialog.parameter_input_dialog import ParameterInputDialog
+            param_dialog = ParameterInputDialog(
+                self.main_ui,
+                sample_file=selected_files[0],
+                endpoint_pool=self.endpoint_pool,
+                controller=self.controller
+            )
+            if self.last_parameters:
+                param_dialog.set_parameters(self.last_parameters)
             if param_dialog.exec_() != ParameterInputDialog.Accepted:
                 return
 
             parameters = param_dialog.get_parameters()
-            self.setup_progress_dialog()
-
-            # Initialize and start worker thread with parameters
-            self.worker = WorkerThread(selected_files, self.api_url, parameters)
-            self.worker.progress.connect(self.update_progress)
-            self.worker.result.connect(self.handle_single_result)
-            self.worker.finished.connect(self.process_results)
-            self.worker.error.connect(self.handle_error)
-
-            self.worker.start()
+            self.last_parameters = parameters
+            self.config.set('last_parameters', parameters)
+            self.start_processing(selected_files, parameters, parameter_overrides)
 
         except Exception as e:
             error_msg = f"이미지 전송 준비 중 오류가 발생했습니다: {str(e)}"
             self.error_occurred.emit(error_msg)
             QMessageBox.critical(self.main_ui, "오류", error_msg)
 
+    def start_processing(self, files, parameters=None, parameter_overrides=None, interactive=True):
+        """파라미터 창 없이 처리 대기열에 추가
+
+        interactive 가 아니면(감시 폴더 자동 처리) 낮은 우선순위로 넣고 진행 창을 띄우지 않는다.
+        """
+        if not parameters and not self.last_parameters:
+            from core.dialog.parameter_input_dialog import ParameterInputDialog
+            self.last_parameters = dict(ParameterInputDialog.DEFAULT_PARAMETERS)
+        parameters = parameters or self.last_parameters
+        # 개별 파라미터가 지정된 파일은 파라미터 묶음별로 나눠 넣는다
+        overrides = {
+            path: params for path, params in (parameter_overrides or {}).items() if path in files
+        }
+        priority = PRIORITY_NORMAL if interactive else PRIORITY_LOW
+        added = self.worker.submit(files, parameters, overrides, priority, interactive)
+
+        if interactive:
+            self.interactive_run = True
+            if self.progress is None:
+                self.setup_progress_dialog()
+        return added
+
+    def retry_failed(self, cause=None):
+        """실패 항목(cause 가 있으면 그 원인만)을 실패할 때의 파라미터로 다시 대기열에 넣는다"""
+        failures = self.errors.take(cause)
+        if not failures:
+            return 0
+        files = [failure.file_path for failure in failures]
+        overrides = {failure.file_path: failure.parameters for failure in failures}
+        return self.start_processing(files, self.last_parameters, overrides)
+
+    def bump_priority(self, files):
+        """대기 중인 파일을 먼저 처리 (이미 처리 중이거나 대기열에 없으면 무시)"""
+        if self._worker is None:
+            return 0
+        return self._worker.bump(files)
+
+    def shutdown(self):
+        if self._worker is None:
+            return
+        self._worker.stop()
+        self._worker.wait()
+
     def setup_progress_dialog(self):
         self.progress = QProgressDialog("이미지 처리 중...", "취소", 0, 100, self.main_ui)
-        self.progress.setWindowModality(Qt.WindowModal)
+        # 처리 중에도 파일을 더 보내거나 우선순위를 바꿀 수 있도록 모달로 띄우지 않는다
+        self.progress.setWindowModality(Qt.NonModal)
         self.progress.setWindowTitle("처리 진행 상황")
         self.progress.setAutoReset(False)
         self.progress.setAutoClose(False)
@@ -60,26 +176,40 @@ class ImageProcessor(QObject):
         self.progress.canceled.connect(self.cancel_processing)
         self.progress.show()
 
-    def handle_single_result(self, result):
+    def handle_results(self, results):
         try:
-            file_path, result_data = result
-
-            self.image_processed.emit(file_path, result_data)
+            # 다시 처리해서 성공한 파일은 실패 목록에서 뺀다
+            if len(self.errors):
+                self.errors.discard([file_path for file_path, _ in results])
+            self.images_processed.emit(results)
 
         except Exception as e:
             self.error_occurred.emit(f"결과 처리 중 오류 발생: {str(e)}")
 
     def process_results(self, results):
+        # 완료 알림보다 아직 쌓여 있는 결과/오류가 먼저 반영되도록 비운다
+        self.result_batcher.flush()
+        self.error_batcher.flush()
+        self.failure_batcher.flush()
+        interactive_run, self.interactive_run = self.interactive_run, False
+        if not interactive_run:
+            # 자동 처리만 있었던 경우는 알림 없이 목록만 정리
+            logging.getLogger(__name__).info(f"Auto-processed {len(results)} files")
+            self.process_finished.emit()
+            return
+
+        failure_note = (f"\n실패한 {len(self.errors)}건은 오류 창에서 원인을 확인하고 다시 처리할 수 있습니다."
+                        if len(self.errors) else "")
         try:
             if not results:
-                QMessageBox.warning(self.main_ui, "경고", "처리된 결과가 없습니다.")
+                QMessageBox.warning(self.main_ui, "경고", "처리된 결과가 없습니다." + failure_note)
                 return
 
             successful_count = len(results)
             QMessageBox.information(
                 self.main_ui,
                 "완료",
-                f"{successful_count}개의 이미지가 처리되었습니다."
+                f"{successful_count}개의 이미지가 처리되었습니다." + failure_note
             )
 
             self.process_finished.emit()
@@ -95,16 +225,30 @@ class ImageProcessor(QObject):
                 self.progress = None
 
     def cancel_processing(self):
-        if self.worker and self.worker.isRunning():
-            self.worker.stop()
-            self.worker.wait()
+        if self._worker is not None:
+            self._worker.cancel()
+        self.interactive_run = False
+        self.progress = None
 
         self.error_occurred.emit("처리가 사용자에 의해 취소되었습니다.")
 
+    def update_queue_status(self, waiting, running):
+        if self.progress is not None:
+            self.progress.setLabelText(f"이미지 처리 중... (처리 중 {running}개, 대기 {waiting}개)")
+
     def update_progress(self, value):
         if self.progress is not None:
             self.progress.setValue(value)
         self.progress_updated.emit(value)
 
     def handle_error(self, error_message):
-        self.error_occurred.emit(f"처리 중 오류 발생: {error_message}")
\ No newline at end of file
+        self.error_occurred.emit(f"처리 중 오류 발생: {error_message}")
+
+    def handle_errors(self, error_messages):
+        """50ms 동안 모인 오류를 메시지 하나로 알린다"""
+        if len(error_messages) == 1:
+            self.handle_error(error_messages[0])
+            return
+        shown = error_messages[:10]
+        more = f"\n... 외 {len(error_messages) - len(shown)}건" if len(error_messages) > len(shown) else ""
+        self.error_occurred.emit(f"{len(error_messages)}건의 처리 오류가 발생했습니다:\n" + "\n".join(shown) + more)
\ No newline at end of file
@@ -0,0 +1,107 @@
+# core/services/job_queue.py
+import heapq
+import itertools
+import threading
+
+# 숫자가 작을수록 먼저 처리
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+
+class Job:
+    """처리 대기열의 항목 하나"""
+
+    def __init__(self, file_path, parameters, priority=PRIORITY_NORMAL, interactive=True):
+        self.file_path = file_path
+        self.parameters = parameters
+        self.priority = priority
+        # 사용자가 직접 보낸 작업인지 (감시 폴더 자동 처리는 False)
+        self.interactive = interactive
+
+
+class JobQueue:
+    """앱이 켜져 있는 동안 유지되는 우선순위 처리 대기열
+
+    put() 은 처리 중에도 언제든 호출할 수 있고, 같은 파일이 이미 대기 중이면 새로 넣지 않는다.
+    bump() 로 대기 중인 파일을 앞으로 옮길 수 있다. 같은 우선순위끼리는 넣은 순서대로 나온다.
+    여러 스레드에서 함께 사용한다.
+    """
+
+    def __init__(self):
+        self._heap = []  # [(priority, seq, file_path)]
+        self._jobs = {}  # {file_path: (seq, Job)} 대기 중인 항목
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+
+    def put(self, job):
+        """대기열에 추가. 이미 대기 중인 파일이면 파라미터만 바꾸고 False"""
+        with self._condition:
+            queued = self._jobs.get(job.file_path)
+            if queued is not None:
+                _, current = queued
+                current.parameters = job.parameters
+                current.interactive = current.interactive or job.interactive
+                if job.priority < current.priority:
+                    self._push(current, job.priority)
+                return False
+            self._push(job, job.priority)
+            self._condition.notify()
+            return True
+
+    def bump(self, file_paths, priority=PRIORITY_HIGH):
+        """대기 중인 파일의 우선순위를 올린다. 실제로 옮긴 개수를 반환"""
+        moved = 0
+        with self._condition:
+            for file_path in file_paths:
+                queued = self._jobs.get(file_path)
+                if queued is not None and priority < queued[1].priority:
+                    self._push(queued[1], priority)
+                    moved += 1
+        return moved
+
+    def wait(self, timeout=None):
+        """작업이 들어올 때까지 대기. timeout 안에 들어오지 않으면 False"""
+        with self._condition:
+            if not self._jobs:
+                self._condition.wait(timeout)
+            return bool(self._jobs)
+
+    def take(self):
+        """가장 급한 작업을 꺼낸다. 대기 중인 작업이 없으면 None"""
+        with self._condition:
+            while self._heap:
+                priority, seq, file_path = heapq.heappop(self._heap)
+                queued = self._jobs.get(file_path)
+                # 우선순위를 바꾸면 예전 항목이 힙에 남으므로 건너뛴다
+                if queued is not None and queued[0] == seq:
+                    del self._jobs[file_path]
+                    return queued[1]
+            return None
+
+    def remove(self, file_path):
+        with self._condition:
+            return self._jobs.pop(file_path, None) is not None
+
+    def clear(self):
+        """대기 중인 작업을 모두 버리고 버린 개수를 반환"""
+        with self._condition:
+            count = len(self._jobs)
+            self._jobs.clear()
+            self._heap.clear()
+            return count
+
+    def contains(self, file_path):
+        with self._condition:
+            return file_path in self._jobs
+
+    def __len__(self):
+        with self._condition:
+            return len(self._jobs)
+
+    # 잠금 안에서 호출
+    def _push(self, job, priority):
+        seq = next(self._counter)
+        job.priority = priority
+        self._jobs[job.file_path] = (seq, job)
+        heapq.heappush(self._heap, (priority, seq, job.file_path))
@@ -1,9 +1,46 @@
+from collections import deque
+
+import numpy as np
 from PyQt5.QtCore import QThread, pyqtSignal, QRunnable, QThreadPool, Qt, QObject
-from PyQt5.QtGui import QImage
-from PyQt5.QtWidgets import QProgressDialog, QApplication
+from PyQt5.QtGui import QImage, QImageReader
 import os
 
+from core.services.process_pool import SharedArray, get_process_pool
+from core.services.thumbnail_cache import get_thumbnail_cache
+
+
+# 프로세스 풀에서 실행된다
+def load_thumbnail(file_path, output):
+    """이미지를 읽어 output((H, W, 4) 공유 배열) 크기 안에 맞춘 썸네일을 ARGB32 로 써 넣는다
+
+    반환값: 썸네일 (가로, 세로). 읽지 못하면 None
+    """
+    reader = QImageReader(file_path)
+    source_size = reader.size()
+    # 큰 이미지는 읽는 단계에서 먼저 줄인다 (JPEG 는 디코딩 자체가 빨라진다)
+    if source_size.isValid() and (source_size.width() > 1000 or source_size.height() > 1000):
+        reader.setScaledSize(source_size.scaled(1000, 1000, Qt.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return None
+
+    height, width = output.shape[:2]
+    thumbnail = image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    thumbnail = thumbnail.convertToFormat(QImage.Format_ARGB32)
+    bits = thumbnail.constBits()
+    bits.setsize(thumbnail.byteCount())
+    pixels = np.frombuffer(bits, dtype=np.uint8).reshape(thumbnail.height(), thumbnail.bytesPerLine())
+    output[:thumbnail.height(), :thumbnail.width()] = (
+        pixels[:, :thumbnail.width() * 4].reshape(thumbnail.height(), thumbnail.width(), 4))
+    return thumbnail.width(), thumbnail.height()
+
+
 class LoadImageWorker(QRunnable):
+    """썸네일 생성을 프로세스 풀에 넘기고 결과를 넣은 순서대로 내보낸다
+
+    디스크 썸네일 캐시에 있는 파일은 디코딩하지 않고 캐시에서 읽는다.
+    """
+
     class Signals(QObject):
         progress = pyqtSignal(int)
         finished = pyqtSignal()
@@ -19,27 +56,63 @@ class LoadImageWorker(QRunnable):
 
     def run(self):
         try:
+            pool = get_process_pool()
+            cache = get_thumbnail_cache()
             total = len(self.file_paths)
-            for i, file_path in enumerate(self.file_paths):
-                if not self.is_running:
+            file_paths = iter(self.file_paths)
+            pending = deque()
+            done = 0
+
+            while self.is_running:
+                # 공유 메모리를 너무 많이 잡지 않도록 넘겨 둔 작업 수를 제한
+                while len(pending) < pool.max_workers * 2:
+                    file_path = next(file_paths, None)
+                    if file_path is None:
+                        break
+                    cached = cache.get(file_path, self.thumbnail_size)
+                    if cached is not None:
+                        pending.append((file_path, None, cached))
+                        continue
+                    output = SharedArray((self.thumbnail_size.height(), self.thumbnail_size.width(), 4))
+                    pending.append((file_path, output, pool.submit(load_thumbnail, file_path, output)))
+                if not pending:
                     break
 
-                try:
-                    image = QImage(file_path)
-                    if not image.isNull():
-                        if image.width() > 1000 or image.height() > 1000:
-                            image = image.scaled(1000, 1000, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                file_path, output, future = pending.popleft()
+                if output is None:
+                    # 캐시에서 읽은 썸네일
+                    self.signals.image_loaded.emit(file_path, future)
+                else:
+                    try:
+                        size = future.result()
+                        if size is not None:
+                            width, height = size
+                            pixels = np.ascontiguousarray(output.array[:height, :width])
+                            thumbnail = QImage(pixels.data, width, height, width * 4, QImage.Format_ARGB32).copy()
+                            self.signals.image_loaded.emit(file_path, thumbnail)
+                            cache.put(file_path, self.thumbnail_size, thumbnail)
+                    except Exception as e:
+                        print(f"Error processing image {file_path}: {str(e)}")
+                    finally:
+                        output.release()
 
-                        thumbnail = image.scaled(self.thumbnail_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        self.signals.image_loaded.emit(file_path, thumbnail)
+                done += 1
+                self.signals.progress.emit(int(done * 100 / total))
 
-                    self.signals.progress.emit(int((i + 1) * 100 / total))
-                except Exception as e:
-                    print(f"Error processing image {file_path}: {str(e)}")
+            # 중간에 멈춘 경우 남은 작업 정리
+            for _, output, future in pending:
+                if output is None:
+                    continue
+                future.cancel()
+                try:
+                    future.result()
+                except Exception:
+                    pass
+                output.release()
 
             self.signals.finished.emit()
         except Exception as e:
             self.signals.error.emit(str(e))
 
     def stop(self):
-        self.is_running = False
\ No newline at end of file
+        self.is_running = False
@@ -0,0 +1,290 @@
+# core/services/mask_compositor.py
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage
+
+from utils.config_manager import get_config
+from utils.disk_budget import DiskBudget
+from utils.path_manager import PathManager
+
+# 서버에 원본 마스크만 요청할 때 보내는 파라미터
+NEUTRAL_PARAMETERS = {'mask_blur': 0, 'mask_offset': 0, 'invert_output': False}
+
+
+# QImage <-> NumPy 변환
+def qimage_to_rgba(image):
+    """QImage 를 (H, W, 4) uint8 RGBA 배열로 변환 (복사본)"""
+    image = image.convertToFormat(QImage.Format_RGBA8888)
+    width, height = image.width(), image.height()
+    buffer = image.constBits()
+    buffer.setsize(image.byteCount())
+    array = np.frombuffer(buffer, dtype=np.uint8).reshape(height, image.bytesPerLine())
+    return array[:, :width * 4].reshape(height, width, 4).copy()
+
+
+def rgba_to_qimage(array):
+    """(H, W, 4) uint8 RGBA 배열을 QImage 로 변환"""
+    array = np.ascontiguousarray(array, dtype=np.uint8)
+    height, width = array.shape[:2]
+    image = QImage(array.data, width, height, width * 4, QImage.Format_RGBA8888)
+    # array 가 해제되어도 안전하도록 QImage 쪽에 복사본을 둔다
+    return image.copy()
+
+
+def extract_mask(result_image, size=None):
+    """누끼 결과 이미지의 알파 채널을 마스크로 사용. size 가 다르면 원본 크기로 맞춘다"""
+    if size is not None and (result_image.width(), result_image.height()) != size:
+        result_image = result_image.scaled(size[0], size[1], Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    return qimage_to_rgba(result_image)[:, :, 3].copy()
+
+
+def decode_mask(content, output):
+    """(프로세스 풀에서 실행) 결과 이미지 바이트에서 마스크를 꺼내 output((H, W) 공유 배열)에 써 넣는다"""
+    result_image = QImage.fromData(content)
+    if result_image.isNull():
+        raise Exception("결과 이미지를 해석할 수 없습니다.")
+    height, width = output.shape
+    output[...] = extract_mask(result_image, (width, height))
+
+
+def resize_mask(mask, width, height):
+    """마스크를 지정한 크기로 부드럽게 축소/확대"""
+    mask = np.ascontiguousarray(mask, dtype=np.uint8)
+    image = QImage(mask.data, mask.shape[1], mask.shape[0], mask.shape[1], QImage.Format_Grayscale8)
+    scaled = image.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    buffer = scaled.constBits()
+    buffer.setsize(scaled.byteCount())
+    array = np.frombuffer(buffer, dtype=np.uint8).reshape(height, scaled.bytesPerLine())
+    return array[:, :width].copy()
+
+
+def scale_parameters(parameters, factor):
+    """미리보기 해상도에 맞게 blur/offset 픽셀 값을 비율대로 줄인다 (0 이 아닌 값은 최소 1px)"""
+    scaled = dict(parameters)
+    for key in ('mask_blur', 'mask_offset'):
+        value = int(parameters.get(key, 0))
+        if value:
+            scaled_value = max(1, int(round(abs(value) * factor)))
+            scaled[key] = scaled_value if value > 0 else -scaled_value
+    return scaled
+
+
+# 마스크 후처리 (모두 벡터 연산)
+def _box_blur_axis(values, radius, axis):
+    """누적합을 이용한 1차원 박스 블러. 반경과 무관하게 O(N)"""
+    values = np.moveaxis(values, axis, 0)
+    padded = np.concatenate([np.repeat(values[:1], radius + 1, axis=0), values,
+                             np.repeat(values[-1:], radius, axis=0)])
+    cumsum = np.cumsum(padded, axis=0, dtype=np.float32)
+    window = 2 * radius + 1
+    blurred = (cumsum[window:] - cumsum[:-window]) / window
+    return np.moveaxis(blurred, 0, axis)
+
+
+def blur_mask(mask, radius):
+    """가우시안에 가까운 블러 (가로/세로 박스 블러를 두 번 적용)"""
+    if radius <= 0:
+        return mask
+    values = mask.astype(np.float32)
+    for _ in range(2):
+        values = _box_blur_axis(values, radius, axis=1)
+        values = _box_blur_axis(values, radius, axis=0)
+    return np.clip(values + 0.5, 0, 255).astype(np.uint8)
+
+
+def _window_extreme_axis(values, radius, op):
+    """첫 번째 축 방향으로 폭 2*radius+1 구간의 최대/최소를 구한다
+
+    구간 길이를 두 배씩 늘려가며 합치므로 반경이 커져도 log2(폭) 번의 배열 연산이면 된다.
+    """
+    length = values.shape[0]
+    window = 2 * radius + 1
+    current = np.concatenate([np.repeat(values[:1], radius, axis=0), values,
+                              np.repeat(values[-1:], radius, axis=0)])
+    span = 1
+    while span * 2 <= window:
+        current = op(current[:-span], current[span:])
+        span *= 2
+    return op(current[:length], current[window - span:window - span + length])
+
+
+def offset_mask(mask, offset):
+    """양수면 팽창(dilate), 음수면 침식(erode). 정사각형 구조 요소를 가로/세로로 분리 적용"""
+    if offset == 0:
+        return mask
+    radius = abs(offset)
+    op = np.maximum if offset > 0 else np.minimum
+
+    result = _window_extreme_axis(mask.T, radius, op).T
+    return np.ascontiguousarray(_window_extreme_axis(result, radius, op))
+
+
+def invert_mask(mask):
+    return 255 - mask
+
+
+def apply_mask_parameters(mask, parameters):
+    """서버와 같은 순서(offset → blur → invert)로 파라미터를 적용"""
+    mask = offset_mask(mask, int(parameters.get('mask_offset', 0)))
+    mask = blur_mask(mask, int(parameters.get('mask_blur', 0)))
+    if parameters.get('invert_output'):
+        mask = invert_mask(mask)
+    return mask
+
+
+def composite(source_rgba, mask):
+    """원본 RGB 에 마스크를 알파로 입힌 RGBA 배열 반환"""
+    output = source_rgba.copy()
+    output[:, :, 3] = mask
+    return output
+
+
+class MaskCache:
+    """원본 마스크 캐시 (메모리 LRU + 디스크 .npy)
+
+    키는 파일 경로, 크기, 수정 시각으로 만들기 때문에 원본 파일이 바뀌면 자동으로 무효화된다.
+    메모리는 max_bytes, 디스크는 disk_max_bytes 안에서 오래된 것부터 지운다.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=512 * 1024 * 1024, disk_max_bytes=1024 * 1024 * 1024):
+        self.cache_dir = cache_dir or os.path.join(PathManager.get_cache_dir(), 'masks')
+        self.max_bytes = max_bytes
+        self.disk_budget = DiskBudget(self.cache_dir, disk_max_bytes)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def key_for(file_path):
+        stat = os.stat(file_path)
+        raw = f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.npy")
+
+    def get(self, file_path):
+        try:
+            key = self.key_for(file_path)
+        except OSError:
+            return None
+
+        with self._lock:
+            mask = self._entries.get(key)
+            if mask is not None:
+                self._entries.move_to_end(key)
+                return mask
+
+        disk_path = self._disk_path(key)
+        if os.path.exists(disk_path):
+            try:
+                mask = np.load(disk_path)
+            except (OSError, ValueError) as e:
+                self.logger.error(f"Failed to load cached mask: {str(e)}")
+                return None
+            self._remember(key, mask)
+            return mask
+        return None
+
+    def contains(self, file_path):
+        try:
+            key = self.key_for(file_path)
+        except OSError:
+            return False
+        with self._lock:
+            if key in self._entries:
+                return True
+        return os.path.exists(self._disk_path(key))
+
+    def put(self, file_path, mask):
+        key = self.key_for(file_path)
+        self._remember(key, mask)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = self._disk_path(key) + '.tmp'
+            with open(temp_path, 'wb') as f:
+                np.save(f, mask)
+            os.replace(temp_path, self._disk_path(key))
+        except OSError as e:
+            self.logger.error(f"Failed to write cached mask: {str(e)}")
+            return
+        self.disk_budget.record_write()
+
+    def _remember(self, key, mask):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = mask
+            self._bytes += mask.nbytes
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+
+_mask_cache = None
+_mask_cache_lock = threading.Lock()
+
+
+def get_mask_cache():
+    """앱 전체가 공유하는 MaskCache 반환"""
+    global _mask_cache
+    if _mask_cache is None:
+        with _mask_cache_lock:
+            if _mask_cache is None:
+                _mask_cache = MaskCache(max_bytes=get_config().get_bytes('mask_cache_mb'),
+                                        disk_max_bytes=get_config().get_bytes('mask_disk_cache_mb'))
+    return _mask_cache
+
+
+def result_cache_dir():
+    """로컬 합성/자동 자르기 결과 PNG 를 두는 폴더"""
+    return os.path.join(PathManager.get_cache_dir(), 'results')
+
+
+_result_cache_budget = None
+
+
+def get_result_cache_budget():
+    """결과 PNG 폴더의 디스크 예산. 결과는 프로세스 풀에서 쓰므로 받은 쪽(GUI 프로세스)에서 기록한다"""
+    global _result_cache_budget
+    if _result_cache_budget is None:
+        with _mask_cache_lock:
+            if _result_cache_budget is None:
+                _result_cache_budget = DiskBudget(result_cache_dir(), get_config().get_bytes('result_cache_mb'))
+    return _result_cache_budget
+
+
+def parameters_key(parameters):
+    """결과 파일 이름에 쓸 파라미터 조합 식별자"""
+    return (f"b{int(parameters.get('mask_blur', 0))}"
+            f"_o{int(parameters.get('mask_offset', 0))}"
+            f"_i{int(bool(parameters.get('invert_output')))}")
+
+
+def render_local_result(file_path, mask, parameters, output_dir=None):
+    """캐시된 마스크에 파라미터를 적용해 PNG 로 저장하고 경로를 반환"""
+    source = QImage(file_path)
+    if source.isNull():
+        raise Exception(f"원본 이미지를 열 수 없습니다: {os.path.basename(file_path)}")
+
+    source_rgba = qimage_to_rgba(source)
+    if mask.shape != source_rgba.shape[:2]:
+        raise Exception("마스크 크기가 원본 이미지와 다릅니다.")
+
+    output = composite(source_rgba, apply_mask_parameters(mask, parameters))
+
+    output_dir = output_dir or result_cache_dir()
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, f"{MaskCache.key_for(file_path)}_{parameters_key(parameters)}.png")
+    # 압축률보다 속도를 우선 (PNG 에서 quality 가 높을수록 압축 단계가 낮다)
+    if not rgba_to_qimage(output).save(output_path, 'PNG', 90):
+        raise Exception("합성 결과를 저장하지 못했습니다.")
+    return output_path
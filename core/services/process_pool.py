@@ -0,0 +1,174 @@
+# core/services/process_pool.py
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from utils.config_manager import get_config
+
+
+class SharedArray:
+    """공유 메모리에 올린 NumPy 배열
+
+    공유 메모리는 항상 만든 쪽(메인 프로세스)이 소유하고 release() 로 해제한다.
+    자식 프로세스로는 이름, 모양, 자료형만 피클되어 넘어가므로 픽셀 데이터는 복사되지 않는다.
+    as_bytes 가 True 면 자식 프로세스의 함수에는 배열 대신 공유 메모리의 memoryview 로(복사 없이) 전달된다.
+    """
+
+    def __init__(self, shape, dtype=np.uint8, as_bytes=False):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.as_bytes = as_bytes
+        nbytes = max(1, int(np.prod(self.shape)) * self.dtype.itemsize)
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self.name = self._shm.name
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self._shm.buf)
+
+    def __getstate__(self):
+        return {'name': self.name, 'shape': self.shape, 'dtype': self.dtype.str, 'as_bytes': self.as_bytes}
+
+    def __setstate__(self, state):
+        self.name = state['name']
+        self.shape = state['shape']
+        self.dtype = np.dtype(state['dtype'])
+        self.as_bytes = state['as_bytes']
+        self._shm = None
+        self.array = None
+
+    def release(self):
+        if self._shm is None:
+            return
+        # 배열 뷰가 남아 있으면 close() 가 실패하므로 먼저 놓는다
+        self.array = None
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+def share_array(array):
+    """배열을 공유 메모리에 복사한 SharedArray 반환"""
+    shared = SharedArray(array.shape, array.dtype)
+    shared.array[...] = array
+    return shared
+
+
+def share_bytes(data):
+    """바이트(인코딩된 이미지 등)를 공유 메모리에 올린다. 자식 함수에는 bytes 처럼 읽는 memoryview 로 전달된다"""
+    shared = SharedArray((len(data),), np.uint8, as_bytes=True)
+    shared.array[:] = np.frombuffer(data, dtype=np.uint8)
+    return shared
+
+
+# 아래 함수는 자식 프로세스에서 실행된다
+def _call_with_shared(function, args, kwargs):
+    """SharedArray 인자를 공유 메모리에 연결한 배열로 바꿔 function 을 호출"""
+    opened = []
+    views = []
+
+    def attach(value):
+        if not isinstance(value, SharedArray):
+            return value
+        shm = shared_memory.SharedMemory(name=value.name)
+        opened.append(shm)
+        if value.as_bytes:
+            # 공유 메모리는 페이지 단위로 잡히므로 실제 길이만큼 잘라 넘긴다
+            view = shm.buf[:value.shape[0]]
+            views.append(view)
+            return view
+        return np.ndarray(value.shape, dtype=value.dtype, buffer=shm.buf)
+
+    try:
+        return function(*[attach(arg) for arg in args], **{key: attach(arg) for key, arg in kwargs.items()})
+    finally:
+        # 함수가 배열 뷰를 들고 있지 않도록 인자 참조를 먼저 끊는다
+        args = kwargs = None
+        # close() 전에 넘긴 memoryview 를 놓는다
+        for view in views:
+            try:
+                view.release()
+            except BufferError:
+                pass
+        for shm in opened:
+            try:
+                shm.close()
+            except BufferError:
+                pass
+
+
+class ImageProcessPool:
+    """이미지 작업(디코딩, 합성, 인코딩)을 모든 코어에서 돌리는 프로세스 풀
+
+    Qt 이벤트 루프와 같은 프로세스의 GIL 을 다투지 않도록 CPU 를 많이 쓰는 작업을 넘긴다.
+    스레드가 여럿 도는 중에 fork 하지 않도록 spawn 으로 자식 프로세스를 만들고,
+    처음 사용할 때 시작한다. 자식 프로세스가 죽어 풀이 망가지면 다음 작업에서 다시 만든다.
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or os.cpu_count() or 2
+        self._executor = None
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self.logger.info(f"Starting image process pool with {self.max_workers} workers")
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+            return self._executor
+
+    def submit(self, function, *args, **kwargs):
+        """function 은 모듈 최상위 함수여야 한다. SharedArray 인자는 자식에서 배열로 바뀐다"""
+        executor = self._get_executor()
+        try:
+            return executor.submit(_call_with_shared, function, args, kwargs)
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self.logger.error("Image process pool is broken, restarting")
+                    self._executor = None
+            return self._get_executor().submit(_call_with_shared, function, args, kwargs)
+
+    def run(self, function, *args, **kwargs):
+        """작업을 넘기고 결과를 기다린다 (워커 스레드에서 호출)"""
+        return self.submit(function, *args, **kwargs).result()
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool():
+    """앱 전체가 공유하는 ImageProcessPool 반환"""
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = ImageProcessPool(get_config().get('process_workers') or None)
+    return _process_pool
+
+
+def shutdown_process_pool():
+    """앱 종료 시 자식 프로세스 정리"""
+    if _process_pool is not None:
+        _process_pool.shutdown()
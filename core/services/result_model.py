@@ -0,0 +1,222 @@
+# core/services/result_model.py
+import logging
+import os
+from collections import OrderedDict
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QObject, QRunnable, QThreadPool, QSize, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap, QColor
+
+from core.services.image_decoder import decode_image
+from core.services.thumbnail_cache import get_thumbnail_cache
+from utils.http_client import get_http_client
+
+
+class ResultRecord:
+    """처리 결과 한 건. 픽스맵은 들고 있지 않고 위치 정보만 가진다"""
+    __slots__ = ('source_path', 'location', 'width', 'height', 'parameters', 'job_id')
+
+    def __init__(self, source_path, location, parameters=None, job_id=None):
+        self.source_path = source_path
+        self.location = location
+        self.width = None
+        self.height = None
+        self.parameters = parameters
+        self.job_id = job_id
+
+    @property
+    def base_name(self):
+        return os.path.splitext(os.path.basename(self.source_path))[0]
+
+
+class PixmapBudgetCache:
+    """바이트 예산 안에서 픽스맵을 보관하는 LRU 캐시 (GUI 스레드 전용)"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def cost(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, key):
+        pixmap = self._entries.get(key)
+        if pixmap is not None:
+            self._entries.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap):
+        self.remove(key)
+        self._entries[key] = pixmap
+        self.used_bytes += self.cost(pixmap)
+        while self.used_bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.used_bytes -= self.cost(evicted)
+
+    def remove(self, key):
+        pixmap = self._entries.pop(key, None)
+        if pixmap is not None:
+            self.used_bytes -= self.cost(pixmap)
+
+    def clear(self):
+        self._entries.clear()
+        self.used_bytes = 0
+
+
+class ThumbnailLoader(QRunnable):
+    """결과 이미지를 받아 썸네일 크기로만 디코딩
+
+    만든 썸네일은 원본 크기와 함께 디스크 캐시에 남겨, 서버 결과가 만료된 뒤
+    세션을 복원해도 갤러리에 보이게 한다.
+    """
+
+    class Signals(QObject):
+        loaded = pyqtSignal(str, QImage, QSize)
+        failed = pyqtSignal(str, str)
+
+    def __init__(self, location, thumbnail_size):
+        super().__init__()
+        self.signals = self.Signals()
+        self.location = location
+        self.thumbnail_size = thumbnail_size
+
+    def run(self):
+        try:
+            cache = get_thumbnail_cache()
+            image = cache.get(self.location, self.thumbnail_size)
+            if image is not None:
+                width, _, height = image.text('full_size').partition('x')
+                full_size = QSize(int(width), int(height)) if width.isdigit() and height.isdigit() else QSize()
+                self.signals.loaded.emit(self.location, image, full_size)
+                return
+
+            content = get_http_client().fetch_bytes(self.location)
+            # 전체 해상도로 디코딩하지 않도록 읽기 단계에서 축소
+            image, full_size = decode_image(content, scaled_to=self.thumbnail_size)
+            image.setText('full_size', f"{full_size.width()}x{full_size.height()}")
+            self.signals.loaded.emit(self.location, image, full_size)
+            cache.put(self.location, self.thumbnail_size, image)
+        except Exception as e:
+            self.signals.failed.emit(self.location, str(e))
+
+
+class ResultListModel(QAbstractListModel):
+    """결과 갤러리 모델
+
+    레코드만 보관하고 썸네일은 뷰가 요청할 때(화면에 보일 때) 비동기로 만든다.
+    만든 썸네일은 메모리 예산을 넘으면 오래된 것부터 버리고, 다시 보이면 다시 만든다.
+    """
+    RecordRole = Qt.UserRole + 1
+
+    def __init__(self, thumbnail_size=QSize(96, 96), memory_budget=64 * 1024 * 1024, parent=None):
+        super().__init__(parent)
+        self.thumbnail_size = thumbnail_size
+        self.records = []
+        self._rows = {}  # {결과 위치: [행]} 썸네일이 도착했을 때 갱신할 행을 바로 찾는다
+        self.pixmap_cache = PixmapBudgetCache(memory_budget)
+        self._pending = set()
+        self._failed = set()
+
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(4)
+
+        self.placeholder = QPixmap(thumbnail_size)
+        self.placeholder.fill(QColor('#d8d8d8'))
+        self.logger = logging.getLogger(__name__)
+
+    # QAbstractListModel
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.records):
+            return None
+
+        record = self.records[index.row()]
+        if role == Qt.DisplayRole:
+            return os.path.basename(record.source_path)
+        if role == Qt.DecorationRole:
+            return self.thumbnail(record)
+        if role == Qt.ToolTipRole:
+            size = f"{record.width}x{record.height}" if record.width else "-"
+            return f"{record.source_path}\n{size}"
+        if role == self.RecordRole:
+            return record
+        return None
+
+    # 레코드 관리
+    def add_result(self, source_path, location, parameters=None, job_id=None):
+        row = len(self.records)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.records.append(ResultRecord(source_path, location, parameters, job_id))
+        self._rows.setdefault(location, []).append(row)
+        self.endInsertRows()
+        return row
+
+    def add_results(self, results):
+        """[(source_path, location, parameters, job_id)] 를 한 번의 행 추가로 넣는다"""
+        if not results:
+            return len(self.records)
+        first_row = len(self.records)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(results) - 1)
+        self.records.extend(ResultRecord(*result) for result in results)
+        self._index_rows(first_row)
+        self.endInsertRows()
+        return first_row
+
+    def _index_rows(self, first_row=0):
+        for row in range(first_row, len(self.records)):
+            self._rows.setdefault(self.records[row].location, []).append(row)
+
+    def remove_row(self, row):
+        if not 0 <= row < len(self.records):
+            return None
+        self.beginRemoveRows(QModelIndex(), row, row)
+        record = self.records.pop(row)
+        # 뒤의 행 번호가 모두 당겨지므로 다시 만든다 (삭제는 사용자가 하나씩 하는 드문 작업)
+        self._rows = {}
+        self._index_rows()
+        self.endRemoveRows()
+        self.pixmap_cache.remove(record.location)
+        return record
+
+    def record(self, row):
+        return self.records[row] if 0 <= row < len(self.records) else None
+
+    def clear(self):
+        self.beginResetModel()
+        self.records = []
+        self._rows = {}
+        self.pixmap_cache.clear()
+        self.endResetModel()
+
+    # 썸네일
+    def thumbnail(self, record):
+        pixmap = self.pixmap_cache.get(record.location)
+        if pixmap is not None:
+            return pixmap
+
+        if record.location not in self._pending and record.location not in self._failed:
+            self._pending.add(record.location)
+            loader = ThumbnailLoader(record.location, self.thumbnail_size)
+            loader.signals.loaded.connect(self.thumbnail_loaded)
+            loader.signals.failed.connect(self.thumbnail_failed)
+            self.thread_pool.start(loader)
+        return self.placeholder
+
+    def thumbnail_loaded(self, location, image, full_size):
+        self._pending.discard(location)
+        self.pixmap_cache.put(location, QPixmap.fromImage(image))
+
+        for row in self._rows.get(location, ()):
+            record = self.records[row]
+            if full_size.isValid():
+                record.width, record.height = full_size.width(), full_size.height()
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole, Qt.ToolTipRole])
+
+    def thumbnail_failed(self, location, error_message):
+        self._pending.discard(location)
+        self._failed.add(location)
+        self.logger.error(f"Failed to load thumbnail {location}: {error_message}")
@@ -0,0 +1,203 @@
+# core/services/result_store.py
+import logging
+import math
+import threading
+import zlib
+from collections import OrderedDict
+
+from PyQt5.QtCore import Qt, QRect, QSize
+from PyQt5.QtGui import QImage, QPainter
+
+from utils.config_manager import get_config
+from utils.metrics import metrics
+
+TILE_SIZE = 512
+# 이 크기 이하가 될 때까지 절반씩 줄인 단계(피라미드)를 함께 저장한다
+MIN_LEVEL_SIDE = 512
+
+
+class TiledImage:
+    """결과 이미지 한 장을 단계별 타일로 나눠 zlib 으로 압축해 보관
+
+    levels[0] 이 원본 해상도이고 단계가 올라갈 때마다 가로/세로가 절반이 된다.
+    타일은 압축된 상태로만 들고 있다가 화면에 필요할 때 풀어 쓴다.
+    """
+
+    def __init__(self, location, size, image_format):
+        self.location = location
+        self.size = QSize(size)
+        self.image_format = image_format
+        self.levels = []  # [(QSize, {(col, row): bytes})]
+        self.nbytes = 0
+
+    @classmethod
+    def from_image(cls, location, image, compress_level=1):
+        image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        tiled = cls(location, image.size(), image.format())
+
+        level_image = image
+        while True:
+            tiles = {}
+            for row in range(math.ceil(level_image.height() / TILE_SIZE)):
+                for col in range(math.ceil(level_image.width() / TILE_SIZE)):
+                    tile = level_image.copy(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                    bits = tile.constBits()
+                    bits.setsize(tile.byteCount())
+                    tiles[(col, row)] = zlib.compress(bytes(bits), compress_level)
+            tiled.levels.append((level_image.size(), tiles))
+            tiled.nbytes += sum(len(data) for data in tiles.values())
+
+            if max(level_image.width(), level_image.height()) <= MIN_LEVEL_SIDE:
+                break
+            level_image = level_image.scaled(max(1, level_image.width() // 2), max(1, level_image.height() // 2),
+                                             Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        return tiled
+
+    def level_for_scale(self, scale):
+        """scale(원본 1px 당 화면 px) 이상의 해상도를 가진 가장 작은 단계"""
+        level = 0
+        while level + 1 < len(self.levels) and 2 ** -(level + 1) >= scale:
+            level += 1
+        return level
+
+    def decode_tile(self, level, col, row):
+        # copy() 로 압축 해제 버퍼와 분리된 QImage 를 만든다
+        data = zlib.decompress(self.levels[level][1][(col, row)])
+        return QImage(data, TILE_SIZE, TILE_SIZE, TILE_SIZE * 4, self.image_format).copy()
+
+
+class ResultImageStore:
+    """압축 타일로 결과 이미지를 보관하는 저장소
+
+    압축 타일 전체와 풀어 둔 타일 각각에 바이트 예산이 있고, 넘으면 오래 쓰지 않은 것부터 버린다.
+    여러 스레드(디코딩 워커, 타일 워커)에서 함께 사용한다.
+    """
+
+    def __init__(self, max_compressed_bytes=256 * 1024 * 1024, max_tile_bytes=64 * 1024 * 1024):
+        self.max_compressed_bytes = max_compressed_bytes
+        self.max_tile_bytes = max_tile_bytes
+
+        self._images = OrderedDict()
+        self._compressed_bytes = 0
+        self._tiles = OrderedDict()
+        self._tile_bytes = 0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    # 이미지 단위
+    def contains(self, location):
+        with self._lock:
+            return location in self._images
+
+    def get(self, location):
+        with self._lock:
+            tiled = self._images.get(location)
+            if tiled is not None:
+                self._images.move_to_end(location)
+            return tiled
+
+    def put_image(self, location, image):
+        """전체 해상도 QImage 를 타일로 압축해 저장"""
+        with metrics.span(None, 'tile_store'):
+            tiled = TiledImage.from_image(location, image)
+
+        with self._lock:
+            self._discard(location)
+            self._images[location] = tiled
+            self._compressed_bytes += tiled.nbytes
+            while self._compressed_bytes > self.max_compressed_bytes and len(self._images) > 1:
+                evicted_location, _ = next(iter(self._images.items()))
+                self._discard(evicted_location)
+        return tiled
+
+    def remove(self, location):
+        with self._lock:
+            self._discard(location)
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._tiles.clear()
+            self._compressed_bytes = 0
+            self._tile_bytes = 0
+
+    def memory_usage(self):
+        with self._lock:
+            return {'compressed': self._compressed_bytes, 'tiles': self._tile_bytes, 'images': len(self._images)}
+
+    # 영역 렌더링
+    def render_region(self, location, source_rect, scale):
+        """원본 좌표계의 source_rect 를 scale 배율로 그린 QImage 반환. 저장되어 있지 않으면 None
+
+        필요한 단계의 겹치는 타일만 풀어서 이어 붙인다.
+        """
+        tiled = self.get(location)
+        if tiled is None:
+            return None
+
+        level = tiled.level_for_scale(scale)
+        level_size = tiled.levels[level][0]
+        factor = level_size.width() / tiled.size.width()
+        level_rect = QRect(int(source_rect.x() * factor), int(source_rect.y() * factor),
+                           max(1, math.ceil(source_rect.width() * factor)),
+                           max(1, math.ceil(source_rect.height() * factor)))
+        level_rect = level_rect.intersected(QRect(0, 0, level_size.width(), level_size.height()))
+
+        output = QImage(level_rect.size(), tiled.image_format)
+        output.fill(Qt.transparent)
+        painter = QPainter(output)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        for row in range(level_rect.top() // TILE_SIZE, level_rect.bottom() // TILE_SIZE + 1):
+            for col in range(level_rect.left() // TILE_SIZE, level_rect.right() // TILE_SIZE + 1):
+                tile = self._tile(tiled, level, col, row)
+                painter.drawImage(col * TILE_SIZE - level_rect.x(), row * TILE_SIZE - level_rect.y(), tile)
+        painter.end()
+
+        target = QSize(max(1, round(source_rect.width() * scale)), max(1, round(source_rect.height() * scale)))
+        if output.width() > target.width() or output.height() > target.height():
+            output = output.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return output
+
+    def _tile(self, tiled, level, col, row):
+        key = (tiled.location, level, col, row)
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+                metrics.incr('tile_cache.hit')
+                return tile
+
+        metrics.incr('tile_cache.miss')
+        tile = tiled.decode_tile(level, col, row)
+        with self._lock:
+            if key not in self._tiles:
+                self._tiles[key] = tile
+                self._tile_bytes += tile.byteCount()
+                while self._tile_bytes > self.max_tile_bytes and len(self._tiles) > 1:
+                    _, evicted = self._tiles.popitem(last=False)
+                    self._tile_bytes -= evicted.byteCount()
+        return tile
+
+    # 잠금 안에서 호출
+    def _discard(self, location):
+        tiled = self._images.pop(location, None)
+        if tiled is None:
+            return
+        self._compressed_bytes -= tiled.nbytes
+        for key in [key for key in self._tiles if key[0] == location]:
+            self._tile_bytes -= self._tiles.pop(key).byteCount()
+
+
+_result_store = None
+_result_store_lock = threading.Lock()
+
+
+def get_result_store():
+    """앱 전체가 공유하는 ResultImageStore 반환"""
+    global _result_store
+    if _result_store is None:
+        with _result_store_lock:
+            if _result_store is None:
+                config = get_config()
+                _result_store = ResultImageStore(config.get_bytes('result_store_mb'), config.get_bytes('tile_cache_mb'))
+    return _result_store
@@ -0,0 +1,212 @@
+# core/services/session_store.py
+import base64
+import json
+import logging
+import os
+import uuid
+
+from utils.path_manager import PathManager
+
+SESSION_VERSION = 1
+
+
+def pack_bits(flags):
+    """[bool] 을 비트맵(base64 문자열)으로"""
+    packed = bytearray((len(flags) + 7) // 8)
+    for index, flag in enumerate(flags):
+        if flag:
+            packed[index // 8] |= 1 << (index % 8)
+    return base64.b64encode(bytes(packed)).decode('ascii')
+
+
+def unpack_bits(data, count):
+    packed = base64.b64decode(data or '')
+    return [bool(packed[index // 8] & (1 << (index % 8))) if index // 8 < len(packed) else False
+            for index in range(count)]
+
+
+def empty_state():
+    return {'files': [], 'checked': [], 'overrides': {}, 'results': [], 'current_index': -1}
+
+
+class SessionStore:
+    """파일 목록, 체크 상태, 개별 파라미터, 결과 목록, 보고 있던 결과 위치를 저장/복원
+
+    session.json 스냅샷에 변경분만 session.journal 에 한 줄씩 덧붙이고,
+    변경분이 compact_after 줄을 넘거나 앱을 닫을 때 스냅샷을 새로 쓴다.
+    저널 첫 줄의 generation 이 스냅샷과 다르면(스냅샷 교체 직후 종료 등) 저널은 무시한다.
+    GUI 스레드에서만 사용한다.
+    """
+
+    def __init__(self, directory=None, compact_after=1000):
+        directory = directory or PathManager.get_app_data_dir()
+        self.snapshot_path = os.path.join(directory, 'session.json')
+        self.journal_path = os.path.join(directory, 'session.journal')
+        self.compact_after = compact_after
+        self.logger = logging.getLogger(__name__)
+        self.generation = None
+        self.journal_lines = 0
+        self._last = empty_state()
+
+    # 읽기
+    def load(self):
+        """저장된 상태를 읽는다. 없거나 읽을 수 없으면 None"""
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Failed to read session: {str(e)}")
+            return None
+        if snapshot.get('version') != SESSION_VERSION:
+            return None
+
+        files = snapshot.get('files', [])
+        checked = unpack_bits(snapshot.get('checked'), len(files))
+        state = {
+            'files': files,
+            'checked': [path for path, flag in zip(files, checked) if flag],
+            'overrides': snapshot.get('overrides', {}),
+            'results': snapshot.get('results', []),
+            'current_index': snapshot.get('current_index', -1),
+        }
+        self.generation = snapshot.get('generation')
+        self.journal_lines = self._replay(state)
+        self._last = self._copy(state)
+        return state
+
+    def _replay(self, state):
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            self.logger.error(f"Failed to read session journal: {str(e)}")
+            return 0
+
+        applied = 0
+        for number, line in enumerate(lines):
+            try:
+                op = json.loads(line)
+            except ValueError:
+                # 기록 중에 끊긴 마지막 줄
+                break
+            if number == 0:
+                if op.get('generation') != self.generation:
+                    return 0
+                continue
+            self._apply(state, op)
+            applied += 1
+        return applied
+
+    @staticmethod
+    def _apply(state, op):
+        kind = op.get('op')
+        if kind in ('files', 'results', 'overrides', 'current_index'):
+            state[kind] = op['value']
+        elif kind in ('add_files', 'add_results'):
+            state[kind[len('add_'):]].extend(op['value'])
+        elif kind == 'remove_files':
+            removed = set(op['value'])
+            state['files'] = [path for path in state['files'] if path not in removed]
+        elif kind == 'remove_results':
+            removed = set(op['value'])
+            state['results'] = [result for result in state['results'] if result[1] not in removed]
+        elif kind == 'check':
+            checked = set(state['checked'])
+            checked.update(op.get('add', []))
+            checked.difference_update(op.get('remove', []))
+            state['checked'] = list(checked)
+
+    # 쓰기
+    def save(self, state):
+        """지난번 저장한 상태와 달라진 부분만 저널에 덧붙인다"""
+        ops = self._diff(self._last, state)
+        if not ops:
+            return
+        if self.generation is None or self.journal_lines + len(ops) > self.compact_after:
+            self.compact(state)
+            return
+        try:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(''.join(json.dumps(op, ensure_ascii=False) + '\n' for op in ops))
+            self.journal_lines += len(ops)
+            self._last = self._copy(state)
+        except OSError as e:
+            self.logger.error(f"Failed to write session journal: {str(e)}")
+
+    def compact(self, state):
+        """스냅샷을 새로 쓰고 저널을 비운다"""
+        generation = uuid.uuid4().hex
+        files = state['files']
+        checked = set(state['checked'])
+        snapshot = {
+            'version': SESSION_VERSION,
+            'generation': generation,
+            'files': files,
+            'checked': pack_bits([path in checked for path in files]),
+            'overrides': state['overrides'],
+            'results': state['results'],
+            'current_index': state['current_index'],
+        }
+        temp_path = self.snapshot_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, self.snapshot_path)
+            with open(self.journal_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'generation': generation}) + '\n')
+        except OSError as e:
+            self.logger.error(f"Failed to write session: {str(e)}")
+            return
+        self.generation = generation
+        self.journal_lines = 0
+        self._last = self._copy(state)
+
+    @staticmethod
+    def _copy(state):
+        return {
+            'files': list(state['files']),
+            'checked': list(state['checked']),
+            'overrides': dict(state['overrides']),
+            'results': [list(result) for result in state['results']],
+            'current_index': state['current_index'],
+        }
+
+    @staticmethod
+    def _diff_list(old, new, key, add_op, remove_op, replace_op):
+        """뒤에 덧붙이거나 일부를 지운 경우만 변경분으로, 그 밖의 변경은 통째로 기록"""
+        old_keys = [key(entry) for entry in old]
+        new_keys = set(key(entry) for entry in new)
+        if len(new_keys) != len(new) or len(set(old_keys)) != len(old_keys):
+            # 같은 키가 여럿이면 지운 항목을 키로 가릴 수 없다
+            return [{'op': replace_op, 'value': new}] if old != new else []
+        removed = [entry_key for entry_key in old_keys if entry_key not in new_keys]
+        removed_set = set(removed)
+        kept = [entry for entry in old if key(entry) not in removed_set]
+        if [key(entry) for entry in new[:len(kept)]] != [key(entry) for entry in kept]:
+            return [{'op': replace_op, 'value': new}]
+        ops = []
+        if removed:
+            ops.append({'op': remove_op, 'value': removed})
+        if len(new) > len(kept):
+            ops.append({'op': add_op, 'value': new[len(kept):]})
+        return ops
+
+    def _diff(self, old, new):
+        ops = self._diff_list(old['files'], new['files'], lambda path: path,
+                              'add_files', 'remove_files', 'files')
+        ops += self._diff_list(old['results'], [list(result) for result in new['results']],
+                               lambda result: result[1], 'add_results', 'remove_results', 'results')
+
+        old_checked, new_checked = set(old['checked']), set(new['checked'])
+        if old_checked != new_checked:
+            ops.append({'op': 'check', 'add': sorted(new_checked - old_checked),
+                        'remove': sorted(old_checked - new_checked)})
+        if old['overrides'] != new['overrides']:
+            ops.append({'op': 'overrides', 'value': new['overrides']})
+        if old['current_index'] != new['current_index']:
+            ops.append({'op': 'current_index', 'value': new['current_index']})
+        return ops
@@ -0,0 +1,87 @@
+# core/services/thumbnail_cache.py
+import hashlib
+import logging
+import os
+import threading
+
+from PyQt5.QtGui import QImage
+
+from utils.config_manager import get_config
+from utils.disk_budget import DiskBudget
+from utils.http_client import is_remote
+from utils.path_manager import PathManager
+
+
+class ThumbnailCache:
+    """썸네일을 디스크에 PNG 로 보관
+
+    키는 위치, 썸네일 크기와 (로컬 파일이면) 수정 시각/크기로 만들므로 파일이 바뀌면 저절로 새로 만든다.
+    세션을 복원하거나 같은 파일을 다시 추가할 때 원본을 다시 디코딩하지 않는다.
+    여러 스레드에서 호출해도 된다. 예산을 넘으면 오래된 파일부터 지운다.
+    """
+
+    def __init__(self, cache_dir, max_bytes, prune_interval=200):
+        self.cache_dir = cache_dir
+        self.budget = DiskBudget(cache_dir, max_bytes, prune_interval)
+        self.logger = logging.getLogger(__name__)
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, location, size):
+        """원본이 없으면 None"""
+        parts = [location, f"{size.width()}x{size.height()}"]
+        if not is_remote(location):
+            try:
+                stat = os.stat(location)
+            except OSError:
+                return None
+            parts += [str(stat.st_mtime_ns), str(stat.st_size)]
+        return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + '.png')
+
+    def get(self, location, size):
+        key = self.key(location, size)
+        if key is None:
+            return None
+        path = self.path(key)
+        if not os.path.exists(path):
+            return None
+        image = QImage(path)
+        return None if image.isNull() else image
+
+    def put(self, location, size, image):
+        key = self.key(location, size)
+        if key is None:
+            return
+        path = self.path(key)
+        temp_path = f"{path}.{threading.get_ident()}.part"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if image.save(temp_path, 'PNG'):
+                os.replace(temp_path, path)
+        except OSError as e:
+            self.logger.error(f"Failed to cache thumbnail for {location}: {str(e)}")
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        self.budget.record_write()
+
+    def prune(self):
+        """예산을 넘으면 오래된 썸네일부터 지운다"""
+        self.budget.prune()
+
+
+_thumbnail_cache = None
+_thumbnail_cache_lock = threading.Lock()
+
+
+def get_thumbnail_cache():
+    """앱 전체가 공유하는 ThumbnailCache 반환"""
+    global _thumbnail_cache
+    if _thumbnail_cache is None:
+        with _thumbnail_cache_lock:
+            if _thumbnail_cache is None:
+                _thumbnail_cache = ThumbnailCache(os.path.join(PathManager.get_cache_dir(), 'thumbnails'),
+                                                  get_config().get_bytes('thumbnail_cache_mb'))
+    return _thumbnail_cache
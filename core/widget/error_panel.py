@@ -0,0 +1,102 @@
+import os
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+                             QHeaderView, QLabel, QPushButton, QAbstractItemView, QListWidget)
+from PyQt5.QtCore import Qt, pyqtSignal
+
+
+class ErrorPanel(QWidget):
+    """실패한 파일을 원인별 건수로 보여주는 비모달 창. 처리를 막지 않는다"""
+    retry_requested = pyqtSignal(object)  # 원인 문자열, None 이면 전체
+
+    def __init__(self, collector, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.collector = collector
+        self.setWindowTitle("처리 오류")
+        self.resize(640, 420)
+        # 처리 중에 떠도 작업 중인 창의 포커스를 빼앗지 않는다
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.setup_ui()
+
+        self.collector.changed.connect(self.refresh)
+        self.refresh()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        self.group_table = QTableWidget(0, 2)
+        self.group_table.setHorizontalHeaderLabels(['원인', '건수'])
+        self.group_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.group_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        self.group_table.verticalHeader().setVisible(False)
+        self.group_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.group_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.group_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.group_table.itemSelectionChanged.connect(self.show_group_files)
+        layout.addWidget(self.group_table, 2)
+
+        # 선택한 원인에 속한 파일과 마지막 오류 메시지
+        self.file_list = QListWidget()
+        layout.addWidget(self.file_list, 3)
+
+        button_layout = QHBoxLayout()
+        self.clear_btn = QPushButton("목록 지우기")
+        self.clear_btn.clicked.connect(self.collector.clear)
+        self.retry_group_btn = QPushButton("선택한 원인 다시 처리")
+        self.retry_group_btn.clicked.connect(self.retry_selected_group)
+        self.retry_all_btn = QPushButton("실패 항목 모두 다시 처리")
+        self.retry_all_btn.clicked.connect(lambda: self.retry_requested.emit(None))
+        button_layout.addWidget(self.clear_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(self.retry_group_btn)
+        button_layout.addWidget(self.retry_all_btn)
+        layout.addLayout(button_layout)
+
+    def refresh(self):
+        selected_cause = self.selected_cause()
+        groups = self.collector.groups()
+        self.summary_label.setText(f"실패 {len(self.collector)}건, 원인 {len(groups)}가지" if groups
+                                   else "실패한 항목이 없습니다.")
+
+        self.group_table.blockSignals(True)
+        self.group_table.setRowCount(len(groups))
+        selected_row = 0
+        for row, (cause, failures) in enumerate(groups):
+            self.group_table.setItem(row, 0, QTableWidgetItem(cause))
+            count_item = QTableWidgetItem(str(len(failures)))
+            count_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            self.group_table.setItem(row, 1, count_item)
+            if cause == selected_cause:
+                selected_row = row
+        if groups:
+            self.group_table.selectRow(selected_row)
+        self.group_table.blockSignals(False)
+
+        self.retry_group_btn.setEnabled(bool(groups))
+        self.retry_all_btn.setEnabled(bool(groups))
+        self.clear_btn.setEnabled(bool(groups))
+        self.show_group_files()
+
+    def selected_cause(self):
+        rows = self.group_table.selectionModel().selectedRows() if self.group_table.selectionModel() else []
+        if not rows:
+            return None
+        item = self.group_table.item(rows[0].row(), 0)
+        return item.text() if item else None
+
+    def show_group_files(self):
+        self.file_list.clear()
+        cause = self.selected_cause()
+        for group_cause, failures in self.collector.groups():
+            if group_cause != cause:
+                continue
+            for failure in failures:
+                self.file_list.addItem(f"{os.path.basename(failure.file_path)}  -  {failure.message}")
+
+    def retry_selected_group(self):
+        cause = self.selected_cause()
+        if cause is not None:
+            self.retry_requested.emit(cause)
@@ -1,25 +1,41 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableWidget, QHeaderView,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView,
                              QCheckBox, QLabel, QHBoxLayout, QAbstractItemView,
                              QTableWidgetSelectionRange, QMessageBox, QMenu, QAction, QPushButton, QProgressDialog,
                              QApplication)
 from PyQt5.QtGui import QIcon, QPixmap, QColor, QImage, QCursor
-from PyQt5.QtCore import Qt, QFileInfo, QSize, pyqtSignal, QThreadPool
-from core.services.load_image_worker import LoadImageWorker
+from PyQt5.QtCore import Qt, QFileInfo, QSize, QTimer, pyqtSignal, QThreadPool
+from core.services.result_model import PixmapBudgetCache
+from utils.config_manager import get_config
+from utils.signal_batcher import SignalBatcher
+import logging
 import os
 import sys
 import subprocess
 
+# 행 상태(경로, 체크 여부, 개별 파라미터)는 각 행의 QTableWidgetItem 에 두고,
+# 체크박스/썸네일이 있는 행 위젯은 화면에 보이는 행만 만든다
+FILE_PATH_ROLE = Qt.UserRole
+PARAMETERS_ROLE = Qt.UserRole + 1
+CHECKED_ROLE = Qt.UserRole + 2
+
+# 보이는 행 위아래로 미리 만들어 둘 행 위젯 수
+MATERIALIZE_MARGIN = 10
+
 
 class FileListWidget(QTableWidget):
     file_clicked = pyqtSignal(str, str)
     files_selected = pyqtSignal(list)
+    priority_requested = pyqtSignal(list)  # 먼저 처리할 파일 목록
+    parameters_changed = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_ui()
         self.setup_connections()
+        self.logger = logging.getLogger(__name__)
         self.allowed_formats = {'.jpg', '.jpeg', '.png', '.bmp'}
-        self.thumbnail_size = QSize(100, 100)
+        thumbnail_side = get_config().get('file_thumbnail_size')
+        self.thumbnail_size = QSize(thumbnail_side, thumbnail_side)
         self.all_selected = False
 
         self.thread_pool = QThreadPool()
@@ -28,6 +44,21 @@ class FileListWidget(QTableWidget):
         # 프로그레스 다이얼로그 초기화
         self.progress_dialog = None
 
+        # 썸네일/진행률은 워커 스레드에서 모아 두었다가 50ms 마다 한 번에 반영
+        self.image_batcher = SignalBatcher(50, self)
+        self.image_batcher.flushed.connect(self.add_images)
+        self.progress_batcher = SignalBatcher(50, self)
+        self.progress_batcher.flushed.connect(lambda values: self.update_progress(values[-1]))
+
+        # 아직 행 위젯이 없는 행의 썸네일 (예산을 넘으면 버리고 필요할 때 디스크 캐시에서 다시 읽는다)
+        self.thumbnails = PixmapBudgetCache(get_config().get_bytes('pixmap_cache_mb'))
+        self.thumbnail_placeholder = QPixmap(self.thumbnail_size)
+        self.thumbnail_placeholder.fill(QColor('#eeeeee'))
+        self._thumbnail_requests = set()
+        self.thumbnail_batcher = SignalBatcher(50, self)
+        self.thumbnail_batcher.flushed.connect(self.update_thumbnails)
+        self._materialize_scheduled = False
+
     def setup_ui(self):
         # 테이블 기본 설정
         self.setColumnCount(1)
@@ -71,6 +102,10 @@ class FileListWidget(QTableWidget):
         self.setSelectionMode(QAbstractItemView.MultiSelection)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
 
+        # 탐색기에서 파일/폴더를 끌어다 놓아 추가
+        self.setAcceptDrops(True)
+        self.setDragDropMode(QAbstractItemView.DropOnly)
+
         # 전체 선택 버튼을 위한 컨테이너 위젯 생성
         self.container = QWidget()
         self.container_layout = QVBoxLayout(self.container)
@@ -92,6 +127,7 @@ class FileListWidget(QTableWidget):
         self.cellDoubleClicked.connect(self.open_image_doubleclick)
         self.customContextMenuRequested.connect(self.show_context_menu)
         self.select_all_btn.clicked.connect(self.toggle_select_all)
+        self.verticalScrollBar().valueChanged.connect(self.schedule_materialize)
 
     # image upload 관련 함수
     def cancel_loading(self):
@@ -104,6 +140,7 @@ class FileListWidget(QTableWidget):
             self.progress_dialog.setValue(value)
 
     def loading_finished(self):
+        self.image_batcher.flush()
         if self.progress_dialog:
             self.progress_dialog.close()
         self.progress_dialog = None
@@ -116,16 +153,33 @@ class FileListWidget(QTableWidget):
         self.progress_dialog = None
         QMessageBox.warning(self, "오류", f"이미지 로딩 중 오류가 발생했습니다: {error_msg}")
 
-    def add_file_to_list(self, file_paths):
+    def add_file_to_list(self, file_paths, show_progress=True, skip_existing=False):
+        """파일 썸네일을 백그라운드에서 만들어 목록에 추가
+
+        show_progress 가 False 면(감시 폴더, 드래그 앤 드롭) 진행 창 없이 조용히 추가한다.
+        """
         if isinstance(file_paths, str):
             file_paths = [file_paths]
 
         # 유효한 파일만 필터링
         valid_files = [f for f in file_paths if self.is_allowed_format(f)]
+        if skip_existing:
+            existing = set(self.get_all_files())
+            valid_files = [f for f in valid_files if f not in existing]
 
         if not valid_files:
             return
 
+        # numpy 를 쓰는 로더는 처음 파일을 추가할 때 불러온다 (시작 시간 단축)
+        from core.services.load_image_worker import LoadImageWorker
+        if not show_progress:
+            worker = LoadImageWorker(valid_files, self.thumbnail_size)
+            worker.signals.image_loaded.connect(self.image_batcher.add, Qt.DirectConnection)
+            worker.signals.finished.connect(self.silent_loading_finished)
+            worker.signals.error.connect(lambda error_msg: self.logger.error(f"Error loading images: {error_msg}"))
+            self.thread_pool.start(worker)
+            return
+
         # 프로그레스 다이얼로그 설정
         self.progress_dialog = QProgressDialog("이미지 로딩 중...", "취소", 0, 100, self)
         self.progress_dialog.setWindowModality(Qt.WindowModal)
@@ -134,40 +188,147 @@ class FileListWidget(QTableWidget):
 
         # 워커 생성 및 시그널 연결
         worker = LoadImageWorker(valid_files, self.thumbnail_size)
-        worker.signals.progress.connect(self.update_progress)
-        worker.signals.image_loaded.connect(self.add_single_image)
+        worker.signals.progress.connect(self.progress_batcher.add, Qt.DirectConnection)
+        worker.signals.image_loaded.connect(self.image_batcher.add, Qt.DirectConnection)
         worker.signals.finished.connect(self.loading_finished)
         worker.signals.error.connect(self.loading_error)
 
         self.current_worker = worker
         self.thread_pool.start(worker)
 
+    def silent_loading_finished(self):
+        self.image_batcher.flush()
+        self.select_all_btn.setEnabled(self.rowCount() > 0)
+
+    def add_images(self, images):
+        """[(file_path, thumbnail)] 을 한 번에 추가"""
+        for file_path, thumbnail in images:
+            self.thumbnails.put(file_path, QPixmap.fromImage(thumbnail))
+        self.append_rows([file_path for file_path, _ in images])
+
     def add_single_image(self, file_path, thumbnail):
-        try:
-            row_position = self.rowCount()
-            self.insertRow(row_position)
+        self.add_images([(file_path, thumbnail)])
 
-            widget = self.create_item_widget_with_thumbnail(file_path, thumbnail)
-            self.setCellWidget(row_position, 0, widget)
+    def restore_files(self, file_paths, checked=(), overrides=None):
+        """세션에서 읽은 목록을 썸네일 없이 바로 채운다. 썸네일은 행이 보일 때 캐시에서 읽는다"""
+        self.append_rows(file_paths, checked, overrides)
+        self.select_all_btn.setEnabled(self.rowCount() > 0)
 
-        except Exception as e:
-            print(f"Error adding image to list: {str(e)}")
-            if self.rowCount() > row_position:
-                self.removeRow(row_position)
+    def append_rows(self, file_paths, checked=(), overrides=None):
+        """행 항목만 만들고 행 위젯은 보이는 행만 만든다. 다 넣을 때까지 다시 그리지 않는다"""
+        if not file_paths:
+            return
+        checked = set(checked)
+        overrides = overrides or {}
+        self.setUpdatesEnabled(False)
+        try:
+            first_row = self.rowCount()
+            self.setRowCount(first_row + len(file_paths))
+            checked_rows = []
+            for row, file_path in enumerate(file_paths, first_row):
+                item = QTableWidgetItem()
+                item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+                item.setData(FILE_PATH_ROLE, file_path)
+                item.setData(PARAMETERS_ROLE, overrides.get(file_path))
+                item.setData(CHECKED_ROLE, file_path in checked)
+                self.setItem(row, 0, item)
+                if file_path in checked:
+                    checked_rows.append(row)
+            self.select_rows(checked_rows)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.schedule_materialize()
+
+    def select_rows(self, rows):
+        """체크된 행을 연속 구간 단위로 선택 표시"""
+        start = previous = None
+        for row in list(rows) + [None]:
+            if start is not None and (row is None or row != previous + 1):
+                self.setRangeSelected(QTableWidgetSelectionRange(start, 0, previous, 0), True)
+                start = None
+            if row is not None and start is None:
+                start = row
+            previous = row
+
+    # 행 위젯은 보이는 행만
+    def schedule_materialize(self):
+        if not self._materialize_scheduled:
+            self._materialize_scheduled = True
+            QTimer.singleShot(0, self.materialize_visible_rows)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.schedule_materialize()
+
+    def materialize_visible_rows(self):
+        self._materialize_scheduled = False
+        if not self.rowCount():
+            return
+        first = self.rowAt(0)
+        last = self.rowAt(self.viewport().height() - 1)
+        first = 0 if first < 0 else first
+        last = self.rowCount() - 1 if last < 0 else last
+
+        missing = []
+        for row in range(max(0, first - MATERIALIZE_MARGIN), min(self.rowCount(), last + MATERIALIZE_MARGIN + 1)):
+            if self.cellWidget(row, 0) is None and self.item(row, 0) is not None:
+                widget = self.create_row_widget(row)
+                self.setCellWidget(row, 0, widget)
+                if widget.property("has_thumbnail") is False:
+                    missing.append(self.file_path(row))
+        self.request_thumbnails(missing)
+
+    def request_thumbnails(self, file_paths):
+        file_paths = [path for path in file_paths if path not in self._thumbnail_requests]
+        if not file_paths:
+            return
+        self._thumbnail_requests.update(file_paths)
+        from core.services.load_image_worker import LoadImageWorker
+        worker = LoadImageWorker(file_paths, self.thumbnail_size)
+        worker.signals.image_loaded.connect(self.thumbnail_batcher.add, Qt.DirectConnection)
+        worker.signals.error.connect(lambda error_msg: self.logger.error(f"Error loading thumbnails: {error_msg}"))
+        self.thread_pool.start(worker)
 
-    def create_item_widget_with_thumbnail(self, file_path, thumbnail):
+    def update_thumbnails(self, images):
+        """늦게 도착한 썸네일을 이미 만든 행 위젯에 반영"""
+        thumbnails = {}
+        for file_path, thumbnail in images:
+            self._thumbnail_requests.discard(file_path)
+            thumbnails[file_path] = QPixmap.fromImage(thumbnail)
+        for row in range(self.rowCount()):
+            pixmap = thumbnails.get(self.file_path(row))
+            widget = self.cellWidget(row, 0)
+            if pixmap is None:
+                continue
+            if widget is None:
+                self.thumbnails.put(self.file_path(row), pixmap)
+                continue
+            widget.findChild(QLabel, "thumbnail_label").setPixmap(pixmap)
+            widget.setProperty("has_thumbnail", True)
+
+    def create_row_widget(self, row):
+        item = self.item(row, 0)
+        file_path = item.data(FILE_PATH_ROLE)
         widget = QWidget()
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(5, 0, 5, 0)
         layout.setSpacing(10)
 
         checkbox = QCheckBox()
+        checkbox.setChecked(bool(item.data(CHECKED_ROLE)))
         checkbox.stateChanged.connect(
             lambda state: self.on_checkbox_changed(state, self.indexAt(widget.pos()).row()))
         layout.addWidget(checkbox)
+        if checkbox.isChecked():
+            widget.setStyleSheet("background-color: #d0d0d0;")
 
         icon_label = QLabel()
-        icon_label.setPixmap(QPixmap.fromImage(thumbnail))
+        icon_label.setObjectName("thumbnail_label")
+        # 위젯이 픽스맵을 들고 있으므로 메모리 캐시에서는 뺀다
+        thumbnail = self.thumbnails.get(file_path)
+        self.thumbnails.remove(file_path)
+        icon_label.setPixmap(thumbnail if thumbnail is not None else self.thumbnail_placeholder)
+        widget.setProperty("has_thumbnail", thumbnail is not None)
         layout.addWidget(icon_label)
 
         file_name_label = QLabel(os.path.basename(file_path))
@@ -177,8 +338,36 @@ class FileListWidget(QTableWidget):
         widget.setProperty("file_path", file_path)
         layout.addStretch()
 
+        # 개별 파라미터 표시 (지정된 경우에만 보임)
+        parameter_label = QLabel()
+        parameter_label.setObjectName("parameter_label")
+        parameter_label.setStyleSheet("color: #4a9eff; font-size: 10px;")
+        parameter_label.hide()
+        layout.addWidget(parameter_label)
+        self.update_parameter_label(widget, item.data(PARAMETERS_ROLE))
+
         return widget
 
+    def file_path(self, row):
+        item = self.item(row, 0)
+        return item.data(FILE_PATH_ROLE) if item is not None else None
+
+    def is_checked(self, row):
+        item = self.item(row, 0)
+        return bool(item.data(CHECKED_ROLE)) if item is not None else False
+
+    def remove_files(self, file_paths):
+        """경로가 file_paths 에 있는 행을 한 번에 지운다"""
+        file_paths = set(file_paths)
+        self.setUpdatesEnabled(False)
+        try:
+            for row in reversed(range(self.rowCount())):
+                if self.file_path(row) in file_paths:
+                    self.removeRow(row)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.schedule_materialize()
+
     def clear(self):
         self.setRowCount(0)
         self.clearSelection()
@@ -251,21 +440,49 @@ class FileListWidget(QTableWidget):
                 checkbox.setChecked(not checkbox.isChecked())
 
     def on_checkbox_changed(self, state, row):
+        self.item(row, 0).setData(CHECKED_ROLE, state == Qt.Checked)
         self.setRangeSelected(QTableWidgetSelectionRange(row, 0, row, 0), state == Qt.Checked)
         color = QColor('#d0d0d0') if state == Qt.Checked else QColor('white')
         self.cellWidget(row, 0).setStyleSheet(f"background-color: {color.name()};")
         self.files_selected.emit(self.get_selected_files())
 
+    def get_all_files(self):
+        return [self.file_path(row) for row in range(self.rowCount()) if self.item(row, 0) is not None]
+
+    # 드래그 앤 드롭
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+        else:
+            super().dragEnterEvent(event)
+
+    def dragMoveEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+        else:
+            super().dragMoveEvent(event)
+
+    def dropEvent(self, event):
+        if not event.mimeData().hasUrls():
+            super().dropEvent(event)
+            return
+        event.acceptProposedAction()
+
+        file_paths = []
+        for url in event.mimeData().urls():
+            path = url.toLocalFile()
+            if os.path.isdir(path):
+                # 폴더를 놓으면 하위 폴더까지 이미지 파일을 모은다
+                for root, _, names in os.walk(path):
+                    file_paths.extend(os.path.join(root, name) for name in sorted(names))
+            elif path:
+                file_paths.append(path)
+
+        valid_files = [f for f in file_paths if self.is_allowed_format(f)]
+        self.add_file_to_list(valid_files, show_progress=len(valid_files) > 20, skip_existing=True)
+
     def get_selected_files(self):
-        selected_files = []
-        for row in range(self.rowCount()):
-            widget = self.cellWidget(row, 0)
-            if widget:
-                checkbox = widget.layout().itemAt(0).widget()
-                if checkbox.isChecked():
-                    file_path = widget.property("file_path")
-                    selected_files.append(file_path)
-        return selected_files
+        return [self.file_path(row) for row in range(self.rowCount()) if self.is_checked(row)]
 
     def clear(self):
         self.setRowCount(0)
@@ -277,8 +494,75 @@ class FileListWidget(QTableWidget):
         delete_action = QAction("삭제", self)
         delete_action.triggered.connect(self.delete_selected_items)
         context_menu.addAction(delete_action)
+
+        context_menu.addSeparator()
+        parameter_action = QAction("개별 파라미터 지정", self)
+        parameter_action.triggered.connect(self.set_parameters_for_selected)
+        context_menu.addAction(parameter_action)
+        reset_parameter_action = QAction("개별 파라미터 해제", self)
+        reset_parameter_action.triggered.connect(lambda: self.apply_parameter_override(None))
+        context_menu.addAction(reset_parameter_action)
+
+        context_menu.addSeparator()
+        priority_action = QAction("먼저 처리", self)
+        priority_action.setToolTip("처리 대기 중인 선택 항목을 대기열 맨 앞으로 옮깁니다.")
+        priority_action.triggered.connect(lambda: self.priority_requested.emit(self.get_selected_files()))
+        context_menu.addAction(priority_action)
+
         context_menu.exec_(QCursor.pos())
 
+    # 파일별 파라미터
+    def set_parameters_for_selected(self):
+        selected_files = self.get_selected_files()
+        if not selected_files:
+            QMessageBox.information(self, "알림", "파라미터를 지정할 항목을 선택해주세요.")
+            return
+
+        from core.dialog.parameter_input_dialog import ParameterInputDialog
+        dialog = ParameterInputDialog(self, sample_file=selected_files[0])
+        dialog.info_label.setText(f"선택된 {len(selected_files)}개 이미지에만 적용됩니다.")
+        current = self.get_parameter_overrides().get(selected_files[0])
+        if current:
+            dialog.set_parameters(current)
+
+        if dialog.exec_() == ParameterInputDialog.Accepted:
+            self.apply_parameter_override(dialog.get_parameters())
+
+    def apply_parameter_override(self, parameters):
+        """체크된 행에 개별 파라미터를 저장 (None 이면 해제)"""
+        for row in range(self.rowCount()):
+            if not self.is_checked(row):
+                continue
+            self.item(row, 0).setData(PARAMETERS_ROLE, dict(parameters) if parameters else None)
+            widget = self.cellWidget(row, 0)
+            if widget:
+                self.update_parameter_label(widget, parameters)
+        self.parameters_changed.emit()
+
+    @staticmethod
+    def update_parameter_label(widget, parameters):
+        parameter_label = widget.findChild(QLabel, "parameter_label")
+        if parameter_label is None:
+            return
+        if parameters:
+            parameter_label.setText(
+                f"blur {parameters['mask_blur']} / offset {parameters['mask_offset']}"
+                f"{' / invert' if parameters['invert_output'] else ''}"
+                f"{' / crop' if parameters.get('auto_crop') else ''}"
+            )
+            parameter_label.show()
+        else:
+            parameter_label.hide()
+
+    def get_parameter_overrides(self):
+        """{파일 경로: 파라미터} 형태로 개별 파라미터가 지정된 항목 반환"""
+        overrides = {}
+        for row in range(self.rowCount()):
+            item = self.item(row, 0)
+            if item is not None and item.data(PARAMETERS_ROLE):
+                overrides[item.data(FILE_PATH_ROLE)] = item.data(PARAMETERS_ROLE)
+        return overrides
+
     def delete_selected_items(self):
         selected_rows = set(index.row() for index in self.selectedIndexes())
         if not selected_rows:
@@ -319,24 +603,34 @@ class FileListWidget(QTableWidget):
         self.all_selected = not self.all_selected
         self.select_all_btn.setText("전체 해제" if self.all_selected else "전체 선택")
 
+        # 행마다 시그널을 보내지 않고 상태만 바꾼 뒤 한 번 알린다
         for row in range(self.rowCount()):
+            item = self.item(row, 0)
+            if item is not None:
+                item.setData(CHECKED_ROLE, self.all_selected)
             widget = self.cellWidget(row, 0)
             if widget:
                 checkbox = widget.layout().itemAt(0).widget()
                 if isinstance(checkbox, QCheckBox):
+                    checkbox.blockSignals(True)
                     checkbox.setChecked(self.all_selected)
+                    checkbox.blockSignals(False)
+                widget.setStyleSheet(f"background-color: {'#d0d0d0' if self.all_selected else 'white'};")
+        if self.all_selected:
+            self.selectAll()
+        else:
+            self.clearSelection()
+        self.files_selected.emit(self.get_selected_files())
 
     def open_image_doubleclick(self, row, column):
-        widget = self.cellWidget(row, column)
-        if widget:
-            file_path = widget.property("file_path")
-            if file_path:
-                try:
-                    if sys.platform == 'win32':
-                        os.startfile(file_path)
-                    elif sys.platform == 'darwin':
-                        subprocess.call(['open', file_path])
-                    else:
-                        subprocess.call(['xdg-open', file_path])
-                except Exception as e:
-                    print(f"파일 열기 실패: {str(e)}")
\ No newline at end of file
+        file_path = self.file_path(row)
+        if file_path:
+            try:
+                if sys.platform == 'win32':
+                    os.startfile(file_path)
+                elif sys.platform == 'darwin':
+                    subprocess.call(['open', file_path])
+                else:
+                    subprocess.call(['xdg-open', file_path])
+            except Exception as e:
+                print(f"파일 열기 실패: {str(e)}")
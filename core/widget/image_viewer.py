@@ -0,0 +1,232 @@
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QTimer, QThreadPool, QRect, QRectF, QPointF, QSize
+from PyQt5.QtGui import QPainter, QPixmap, QColor
+
+from core.services.image_decoder import RegionDecodeWorker
+
+
+class ImageViewer(QWidget):
+    """결과 이미지 뷰어
+
+    평소에는 화면 크기로 줄인 이미지를 그리고, 휠로 확대하면 축소본을 늘려 먼저 보여준 뒤
+    보이는 영역만 필요한 해상도로 다시 디코딩해(타일) 덮어 그린다.
+    더블클릭하면 화면 맞춤으로 돌아간다.
+    """
+
+    MAX_PIXEL_SCALE = 4.0
+    ZOOM_STEP = 1.25
+    TILE_DEBOUNCE_MS = 80
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMouseTracking(False)
+        self.setFocusPolicy(Qt.StrongFocus)
+
+        self.display_pixmap = None
+        self.location = None
+        self.source_data = None
+        self.image_size = QSize()
+        self.message = ""
+
+        self.zoom = 1.0  # 1.0 = 화면 맞춤
+        self.center = QPointF()
+        self.drag_origin = None
+
+        self.tile_pixmap = None
+        self.tile_rect = QRect()
+        self.tile_request_id = 0
+
+        self.tile_pool = QThreadPool(self)
+        self.tile_pool.setMaxThreadCount(1)
+        self.tile_timer = QTimer(self)
+        self.tile_timer.setSingleShot(True)
+        self.tile_timer.setInterval(self.TILE_DEBOUNCE_MS)
+        self.tile_timer.timeout.connect(self.request_tile)
+
+    # 이미지 설정
+    def begin_image(self):
+        """새 이미지를 표시하기 전에 확대 상태와 이전 이미지 정보를 초기화"""
+        self.display_pixmap = None
+        self.location = None
+        self.source_data = None
+        self.image_size = QSize()
+        self.message = ""
+        self.reset_zoom()
+
+    def set_source(self, location, data, full_size):
+        """data 는 타일 저장소에 없을 때 확대 영역을 읽을 원본 바이트 (없으면 None)"""
+        self.location = location
+        self.source_data = data
+        self.image_size = QSize(full_size)
+        self.center = QPointF(full_size.width() / 2, full_size.height() / 2)
+        self.update()
+
+    def set_display_image(self, image):
+        self.display_pixmap = QPixmap.fromImage(image)
+        if not self.image_size.isValid():
+            self.image_size = image.size()
+            self.center = QPointF(image.width() / 2, image.height() / 2)
+        self.message = ""
+        self.update()
+
+    def show_message(self, text):
+        self.display_pixmap = None
+        self.message = text
+        self.update()
+
+    def clear(self):
+        self.display_pixmap = None
+        self.location = None
+        self.source_data = None
+        self.image_size = QSize()
+        self.message = ""
+        self.reset_zoom()
+
+    def reset_zoom(self):
+        self.zoom = 1.0
+        self.tile_pixmap = None
+        self.tile_request_id += 1
+        if self.image_size.isValid():
+            self.center = QPointF(self.image_size.width() / 2, self.image_size.height() / 2)
+        self.update()
+
+    # 좌표 계산
+    def fit_scale(self):
+        if not self.image_size.isValid() or self.image_size.isEmpty():
+            return 1.0
+        return min(1.0, self.width() / self.image_size.width(), self.height() / self.image_size.height())
+
+    def pixel_scale(self):
+        """원본 1픽셀이 화면에서 차지하는 크기"""
+        return self.fit_scale() * self.zoom
+
+    def visible_source_rect(self):
+        """현재 화면에 보이는 원본 좌표계의 영역"""
+        scale = self.pixel_scale()
+        width = min(self.image_size.width(), self.width() / scale)
+        height = min(self.image_size.height(), self.height() / scale)
+        left = min(max(self.center.x() - width / 2, 0), self.image_size.width() - width)
+        top = min(max(self.center.y() - height / 2, 0), self.image_size.height() - height)
+        return QRectF(left, top, width, height)
+
+    def target_rect(self, source_rect):
+        scale = self.pixel_scale()
+        width, height = source_rect.width() * scale, source_rect.height() * scale
+        return QRectF((self.width() - width) / 2, (self.height() - height) / 2, width, height)
+
+    # 그리기
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor('#e0e0e0'))
+
+        if self.display_pixmap is None or not self.image_size.isValid():
+            if self.message:
+                painter.setPen(QColor('#333333'))
+                painter.drawText(self.rect(), Qt.AlignCenter, self.message)
+            return
+
+        source = self.visible_source_rect()
+        target = self.target_rect(source)
+
+        # 축소본에서 보이는 영역을 늘려 먼저 그린다
+        ratio_x = self.display_pixmap.width() / self.image_size.width()
+        ratio_y = self.display_pixmap.height() / self.image_size.height()
+        pixmap_source = QRectF(source.x() * ratio_x, source.y() * ratio_y,
+                               source.width() * ratio_x, source.height() * ratio_y)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, self.zoom == 1.0)
+        painter.drawPixmap(target, self.display_pixmap, pixmap_source)
+
+        # 확대 상태면 준비된 타일을 제 위치에 덮어 그린다
+        if self.zoom > 1.0 and self.tile_pixmap is not None:
+            scale = self.pixel_scale()
+            tile_target = QRectF(target.x() + (self.tile_rect.x() - source.x()) * scale,
+                                 target.y() + (self.tile_rect.y() - source.y()) * scale,
+                                 self.tile_rect.width() * scale, self.tile_rect.height() * scale)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+            painter.drawPixmap(tile_target, self.tile_pixmap, QRectF(self.tile_pixmap.rect()))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.zoom > 1.0:
+            self.tile_timer.start()
+
+    # 확대/이동
+    def wheelEvent(self, event):
+        if self.display_pixmap is None or not self.image_size.isValid():
+            return
+        steps = event.angleDelta().y() / 120
+        if not steps:
+            return
+
+        max_zoom = max(1.0, self.MAX_PIXEL_SCALE / self.fit_scale())
+        new_zoom = min(max_zoom, max(1.0, self.zoom * (self.ZOOM_STEP ** steps)))
+        if new_zoom == self.zoom:
+            return
+
+        # 커서 아래의 원본 위치가 확대 후에도 커서 아래에 있도록 중심을 옮긴다
+        source = self.visible_source_rect()
+        target = self.target_rect(source)
+        scale = self.pixel_scale()
+        anchor = QPointF(source.x() + (event.pos().x() - target.x()) / scale,
+                         source.y() + (event.pos().y() - target.y()) / scale)
+        self.zoom = new_zoom
+        new_scale = self.pixel_scale()
+        self.center = QPointF(anchor.x() + (self.width() / 2 - event.pos().x()) / new_scale,
+                              anchor.y() + (self.height() / 2 - event.pos().y()) / new_scale)
+        self.clamp_center()
+        self.schedule_tile()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and self.zoom > 1.0:
+            self.drag_origin = (event.pos(), QPointF(self.center))
+            self.setCursor(Qt.ClosedHandCursor)
+
+    def mouseMoveEvent(self, event):
+        if self.drag_origin is None:
+            return
+        origin, center = self.drag_origin
+        scale = self.pixel_scale()
+        delta = event.pos() - origin
+        self.center = QPointF(center.x() - delta.x() / scale, center.y() - delta.y() / scale)
+        self.clamp_center()
+        self.schedule_tile()
+
+    def mouseReleaseEvent(self, event):
+        if self.drag_origin is not None:
+            self.drag_origin = None
+            self.unsetCursor()
+
+    def mouseDoubleClickEvent(self, event):
+        self.reset_zoom()
+
+    def clamp_center(self):
+        source = self.visible_source_rect()
+        self.center = source.center()
+
+    # 타일 요청
+    def schedule_tile(self):
+        self.update()
+        if self.zoom > 1.0:
+            self.tile_timer.start()
+        else:
+            self.tile_pixmap = None
+
+    def request_tile(self):
+        if self.location is None or self.zoom <= 1.0:
+            return
+        # 이동 중 가장자리가 비지 않도록 약간 여유를 두고 정수 좌표로 맞춘다
+        source = self.visible_source_rect().toAlignedRect().adjusted(-16, -16, 16, 16)
+        source = source.intersected(QRect(0, 0, self.image_size.width(), self.image_size.height()))
+        scale = min(1.0, self.pixel_scale())
+
+        self.tile_request_id += 1
+        worker = RegionDecodeWorker(self.tile_request_id, self.location, self.source_data, source, scale)
+        worker.signals.decoded.connect(self.tile_decoded)
+        self.tile_pool.start(worker)
+
+    def tile_decoded(self, request_id, rect, image):
+        if request_id != self.tile_request_id or self.zoom <= 1.0:
+            return
+        self.tile_rect = rect
+        self.tile_pixmap = QPixmap.fromImage(image)
+        self.update()
@@ -0,0 +1,46 @@
+from PyQt5.QtWidgets import QListView, QAbstractItemView
+from PyQt5.QtCore import Qt, QSize, pyqtSignal
+
+
+class ResultGallery(QListView):
+    """처리 결과 썸네일 그리드
+
+    QListView 는 화면에 보이는 항목만 그리므로 결과가 수만 개여도
+    보이는 범위의 썸네일만 모델에 요청된다.
+    """
+    result_activated = pyqtSignal(int)
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+
+        thumbnail_size = model.thumbnail_size
+        self.setViewMode(QListView.IconMode)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(True)
+        self.setIconSize(thumbnail_size)
+        self.setGridSize(QSize(thumbnail_size.width() + 24, thumbnail_size.height() + 28))
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+        self.setMovement(QListView.Static)
+        self.setResizeMode(QListView.Adjust)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.setStyleSheet("""
+            QListView {
+                background-color: #f5f5f5;
+                border: 1px solid #cccccc;
+                border-radius: 3px;
+            }
+        """)
+
+        self.clicked.connect(lambda index: self.result_activated.emit(index.row()))
+
+    def set_current_row(self, row):
+        index = self.model().index(row)
+        if index.isValid():
+            self.setCurrentIndex(index)
+            self.scrollTo(index)
@@ -0,0 +1,83 @@
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+                             QHeaderView, QLabel, QPushButton, QAbstractItemView)
+from PyQt5.QtCore import Qt, QTimer
+
+from utils.metrics import metrics
+
+
+class StatsPanel(QWidget):
+    """처리 단계별 카운터와 구간 히스토그램을 보여주는 비모달 창"""
+
+    REFRESH_INTERVAL_MS = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("처리 통계")
+        self.resize(720, 480)
+        self.setup_ui()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        # 구간별 히스토그램 (단위: ms)
+        self.histogram_table = QTableWidget(0, 7)
+        self.histogram_table.setHorizontalHeaderLabels(['구간', '횟수', '평균', 'p50', 'p95', '최소', '최대'])
+        self.histogram_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.histogram_table.verticalHeader().setVisible(False)
+        self.histogram_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.histogram_table, 3)
+
+        # 카운터
+        self.counter_table = QTableWidget(0, 2)
+        self.counter_table.setHorizontalHeaderLabels(['카운터', '값'])
+        self.counter_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.counter_table.verticalHeader().setVisible(False)
+        self.counter_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.counter_table, 2)
+
+        button_layout = QHBoxLayout()
+        self.reset_btn = QPushButton("초기화")
+        self.reset_btn.clicked.connect(self.reset_metrics)
+        button_layout.addStretch()
+        button_layout.addWidget(self.reset_btn)
+        layout.addLayout(button_layout)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.refresh_timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def reset_metrics(self):
+        metrics.reset()
+        self.refresh()
+
+    def refresh(self):
+        snapshot = metrics.snapshot()
+        self.summary_label.setText(f"진행 중인 작업: {snapshot['active_jobs']}")
+
+        histograms = sorted(snapshot['histograms'].items())
+        self.histogram_table.setRowCount(len(histograms))
+        for row, (name, summary) in enumerate(histograms):
+            values = [name, str(summary['count'])]
+            for key in ('mean', 'p50', 'p95', 'min', 'max'):
+                value = summary[key]
+                values.append(f"{value * 1000:.1f} ms" if value is not None else "-")
+            for column, text in enumerate(values):
+                self.histogram_table.setItem(row, column, QTableWidgetItem(text))
+
+        counters = sorted(snapshot['counters'].items())
+        self.counter_table.setRowCount(len(counters))
+        for row, (name, value) in enumerate(counters):
+            self.counter_table.setItem(row, 0, QTableWidgetItem(name))
+            self.counter_table.setItem(row, 1, QTableWidgetItem(str(value)))
@@ -1,13 +1,51 @@
 
+import multiprocessing
 import sys
 
-from PyQt5.QtWidgets import QApplication
 
-from core.dialog.main_dialog import MainUI
+def main():
+    from utils.startup_profiler import profiler
 
-if __name__ == '__main__':
+    # --profile-startup: 시작 단계별 시각과 오래 걸린 import 를 출력 (다른 모듈을 불러오기 전에 켠다)
+    if '--profile-startup' in sys.argv:
+        sys.argv.remove('--profile-startup')
+        profiler.enable()
+
+    from PyQt5.QtWidgets import QApplication
+
+    from core.dialog.main_dialog import MainUI
+    from utils.config_manager import get_config
+    from utils.http_client import close_http_client
+    from utils.metrics import metrics
+
+    profiler.mark("모듈 import")
     app = QApplication(sys.argv)
     # ui = TestDesign()
     ui = MainUI()
+    profiler.mark("MainUI 생성")
+    profiler.mark_first_paint(ui)
     ui.show()
-    app.exec()
+    profiler.mark("show")
+    exit_code = app.exec()
+    # 다음 실행 때 복원할 파일 목록/결과
+    ui.save_session(final=True)
+    # 처리 중인 작업을 멈추고 대기열 스레드 종료
+    ui.image_processor.shutdown()
+    # 남은 자동 저장을 마친 뒤에 프로세스 풀을 닫는다
+    ui.auto_saver.shutdown()
+    from core.services.process_pool import shutdown_process_pool
+    shutdown_process_pool()
+    close_http_client()
+    # 남은 작업 기록(metrics.jsonl) 쓰기
+    metrics.close_export()
+    # 아직 저장되지 않은 설정 변경 사항 기록
+    get_config().flush()
+    return exit_code
+
+
+if __name__ == '__main__':
+    # 내보내기 프로세스 풀이 pyinstaller 실행 파일에서도 동작하도록
+    multiprocessing.freeze_support()
+    # GUI 모듈은 여기서만 불러온다. spawn 으로 만든 자식 프로세스는 이 파일을 __mp_main__ 으로
+    # 다시 import 하므로, 모듈 최상단에 두면 프로세스마다 PyQt 화면 모듈을 전부 불러오게 된다
+    sys.exit(main())
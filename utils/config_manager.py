@@ -0,0 +1,161 @@
+# utils/config_manager.py
+import json
+import logging
+import os
+import threading
+
+from utils.path_manager import PathManager
+
+# 설정 항목: 이름 -> (타입, 기본값). 기본값이 None 이면 사용하는 쪽의 기본값을 따른다
+SETTINGS = {
+    # 마지막으로 사용한 폴더
+    'load_dir': (str, ''),
+    'export_dir': (str, ''),
+
+    # 서버/동시성
+    'endpoints': (list, None),
+    'jobs_per_endpoint': (int, 2),
+    'health_interval': (float, 30.0),
+    'max_concurrency': (int, 0),  # 0 이면 서버 수용량의 두 배
+
+    # HTTP 연결 (keep-alive 커넥션 풀)
+    'http_pool_maxsize': (int, 0),  # 서버당 유지할 연결 수. 0 이면 동시 작업 상한과 다운로드 스레드 수로 계산
+    'http_connect_timeout': (float, 5.0),
+    'http_read_timeout': (float, 60.0),
+    'http_gzip': (bool, True),  # JSON 응답 압축 전송 요청
+
+    # 일시적인 오류(연결 끊김, 5xx, 시간 초과) 재시도
+    'max_retries': (int, 2),
+    'retry_delay': (float, 1.0),  # 첫 재시도 전 대기(초), 이후 두 배씩
+    'retry_max_delay': (float, 30.0),
+    'retry_budget_ratio': (float, 0.2),  # 배치 작업 수 대비 재시도 허용 비율
+
+    # 썸네일/캐시 크기
+    'file_thumbnail_size': (int, 100),
+    'result_thumbnail_size': (int, 96),
+    'pixmap_cache_mb': (int, 64),
+    'mask_cache_mb': (int, 512),
+    'mask_disk_cache_mb': (int, 1024),  # 디스크 마스크 캐시(.npy)
+    'result_cache_mb': (int, 1024),  # 로컬 합성/자동 자르기 결과 PNG
+    'result_store_mb': (int, 256),
+    'tile_cache_mb': (int, 64),
+    'thumbnail_cache_mb': (int, 256),  # 디스크 썸네일 캐시
+
+    # 디코딩/내보내기
+    'decode_threads': (int, 2),
+    'process_workers': (int, 0),  # 이미지 작업 프로세스 수. 0 이면 CPU 수
+    'export_presets': (list, None),
+    'auto_save_dir': (str, ''),
+    'auto_save_threads': (int, 2),  # 결과 자동 저장에 쓰는 다운로드 스레드 수
+
+    # 감시 폴더
+    'watch_dir': (str, ''),
+    'watch_auto_submit': (bool, False),
+    'watch_polling': (bool, False),  # 파일 시스템 알림 대신 항상 주기적으로 확인
+    'last_parameters': (dict, None),
+
+    # 세션
+    'restore_session': (bool, True),  # 시작할 때 지난번 파일 목록/결과를 복원
+}
+
+
+class ConfigManager:
+    """config.json 을 한 번만 읽어 메모리에 두고, 변경 사항은 모아서 저장하는 설정 서비스
+
+    set() 은 메모리 값만 바꾸고 저장을 예약한다. 예약된 저장은 마지막 변경 후
+    save_delay 초가 지나면 임시 파일에 쓴 뒤 이름을 바꾸는 방식으로 한 번에 기록된다.
+    SETTINGS 에 없는 항목도 지우지 않고 그대로 다시 쓴다.
+    """
+
+    def __init__(self, config_path=None, save_delay=1.0):
+        self.config_path = config_path or PathManager.get_config_path()
+        self.save_delay = save_delay
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.RLock()
+        self._timer = None
+        self._dirty = False
+        self._data = self._read()
+
+    def _read(self):
+        if not os.path.exists(self.config_path):
+            return {}
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, json.JSONDecodeError) as e:
+            # 깨진 설정 파일은 기본값으로 시작하고, 다음 저장 때 새로 쓴다
+            self.logger.error(f"Failed to read config: {str(e)}")
+            return {}
+
+    # 값 읽기/쓰기
+    def get(self, key):
+        value_type, default = SETTINGS[key]
+        with self._lock:
+            value = self._data.get(key)
+        if value is None:
+            return default
+        try:
+            if value_type in (list, dict):
+                return value_type(value) if isinstance(value, value_type) else default
+            return value_type(value)
+        except (TypeError, ValueError):
+            self.logger.error(f"Invalid config value for {key}: {value!r}")
+            return default
+
+    def get_bytes(self, key):
+        """MB 단위 항목을 바이트로 반환"""
+        return self.get(key) * 1024 * 1024
+
+    def set(self, key, value):
+        if key not in SETTINGS:
+            raise KeyError(f"알 수 없는 설정 항목입니다: {key}")
+        with self._lock:
+            if self._data.get(key) == value:
+                return
+            self._data[key] = value
+            self._dirty = True
+            self._schedule_save()
+
+    # 저장
+    def _schedule_save(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.save_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self):
+        """예약된 변경 사항을 바로 저장 (앱 종료 시 호출)"""
+        # 타이머 스레드와 종료 시 호출이 겹쳐도 같은 임시 파일에 동시에 쓰지 않도록 잠근 채로 기록
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+
+            temp_path = self.config_path + '.tmp'
+            try:
+                os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._data, f, indent=4, ensure_ascii=False)
+                os.replace(temp_path, self.config_path)
+                self._dirty = False
+            except OSError as e:
+                self.logger.error(f"Failed to write config: {str(e)}")
+
+
+_config = None
+_config_lock = threading.Lock()
+
+
+def get_config():
+    """앱 전체가 공유하는 ConfigManager 반환 (최초 호출 시 config.json 을 읽는다)"""
+    global _config
+    if _config is None:
+        with _config_lock:
+            if _config is None:
+                _config = ConfigManager()
+    return _config
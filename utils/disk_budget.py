@@ -0,0 +1,50 @@
+# utils/disk_budget.py
+import os
+import threading
+
+
+def prune_directory(directory, max_bytes):
+    """directory 아래 파일 합계가 max_bytes 를 넘으면 오래된(수정 시각) 파일부터 지운다"""
+    entries = []
+    for root, _, names in os.walk(directory):
+        for name in names:
+            try:
+                stat = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, os.path.join(root, name)))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+class DiskBudget:
+    """디스크 캐시 폴더의 용량 예산
+
+    파일을 쓸 때마다 record_write() 를 부르면 prune_interval 번에 한 번 폴더를 훑어 예산을 맞춘다.
+    여러 스레드에서 호출해도 된다.
+    """
+
+    def __init__(self, directory, max_bytes, prune_interval=200):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.prune_interval = prune_interval
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def record_write(self):
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % self.prune_interval == 0
+        if prune:
+            self.prune()
+
+    def prune(self):
+        prune_directory(self.directory, self.max_bytes)
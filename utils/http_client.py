@@ -0,0 +1,237 @@
+# utils/http_client.py
+import base64
+import hashlib
+import io
+import logging
+import os
+import re
+import threading
+
+from utils.config_manager import get_config
+from utils.metrics import metrics
+from utils.retry_policy import TransientError
+
+# 다운로드 본문을 이 크기씩 받는다
+DOWNLOAD_CHUNK = 256 * 1024
+# 서버당 커넥션 풀 최소 크기
+DEFAULT_POOL_SIZE = 16
+
+# 서버가 알려 주는 체크섬 헤더: Repr-Digest/Digest 의 sha-256, Content-MD5
+_DIGEST = re.compile(r'sha-256=:?([A-Za-z0-9+/=]+):?', re.IGNORECASE)
+_CONTENT_RANGE = re.compile(r'bytes (\d+)-(\d+)/(\d+|\*)')
+
+
+class DownloadError(TransientError):
+    """받은 결과가 잘렸거나 체크섬이 맞지 않음. 다시 받으면 성공할 수 있다"""
+
+
+def expected_digest(headers):
+    """응답 헤더의 체크섬을 (hashlib 이름, 바이트) 로. 없으면 None"""
+    for name in ('Repr-Digest', 'Digest'):
+        match = _DIGEST.search(headers.get(name, ''))
+        if match:
+            return 'sha256', base64.b64decode(match.group(1))
+    if headers.get('Content-MD5'):
+        return 'md5', base64.b64decode(headers['Content-MD5'])
+    return None
+
+
+class HttpClient:
+    """앱 전체가 공유하는 HTTP 클라이언트
+
+    하나의 requests.Session 위에 크기가 정해진 커넥션 풀을 두고 keep-alive 로
+    연결을 재사용한다. urllib3 커넥션 풀은 스레드 안전하므로 WorkerThread 와
+    GUI 스레드가 동시에 사용해도 된다.
+    """
+
+    def __init__(self, pool_connections=4, pool_maxsize=DEFAULT_POOL_SIZE, connect_timeout=5.0, read_timeout=60.0,
+                 gzip=True, max_resumes=3):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_resumes = max_resumes
+        self.logger = logging.getLogger(__name__)
+
+        # requests 는 불러오는 데 오래 걸려 클라이언트를 처음 만들 때 import 한다 (시작 시간 단축)
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['Connection'] = 'keep-alive'
+        # 결과 이미지는 이미 압축되어 있으므로 gzip 은 JSON 응답에만 효과가 있다
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate' if gzip else 'identity'
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def fetch_bytes(self, location, **kwargs):
+        """결과 위치가 URL 이면 검증하며 내려받고, 로컬 경로(로컬 합성 결과)면 파일을 읽는다
+
+        내려받은 본문은 복사하지 않고 받은 버퍼의 memoryview 로 돌려준다 (bytes 처럼 읽기만 할 것).
+        """
+        if is_remote(location):
+            buffer = io.BytesIO()
+            self.receive(location, buffer, **kwargs)
+            return buffer.getbuffer()
+        with open(location, 'rb') as f:
+            return f.read()
+
+    def download(self, url, save_path, validate=None, **kwargs):
+        """url 을 save_path 에 저장
+
+        save_path + '.part' 에 받으면서 길이와 체크섬을 확인하고, validate(임시 경로) 가
+        False 를 돌려주면 실패로 본다. 모두 통과해야 이름을 바꾸므로 잘린 파일이 남지 않는다.
+        """
+        temp_path = save_path + '.part'
+        try:
+            # 체크섬 확인을 위해 다시 읽을 수 있게 연다
+            with open(temp_path, 'w+b') as f:
+                self.receive(url, f, **kwargs)
+            if validate is not None and not validate(temp_path):
+                raise DownloadError(f"받은 이미지를 디코딩할 수 없습니다: {url}")
+            os.replace(temp_path, save_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def receive(self, url, sink, **kwargs):
+        """url 의 본문을 sink(쓰기 가능한 바이너리 파일 객체)에 받는다
+
+        Content-Length 와 체크섬 헤더(Repr-Digest, Digest, Content-MD5)가 있으면 확인한다.
+        받는 중 연결이 끊기면 받은 곳부터 Range 요청으로 이어 받고(최대 max_resumes 번),
+        서버가 Range 를 지원하지 않거나 그 사이 결과가 바뀌었으면 처음부터 다시 받는다.
+        """
+        import requests
+        headers = dict(kwargs.pop('headers', None) or {})
+        # 길이와 Range 가 실제 바이트와 맞도록 압축 전송은 받지 않는다 (결과 이미지는 이미 압축되어 있다)
+        headers['Accept-Encoding'] = 'identity'
+        total = digest = validator = None
+        resumes = 0
+
+        while True:
+            received = sink.tell()
+            request_headers = dict(headers)
+            if received:
+                request_headers['Range'] = f"bytes={received}-"
+                if validator:
+                    request_headers['If-Range'] = validator
+            try:
+                with self.get(url, headers=request_headers, stream=True, **kwargs) as response:
+                    response.raise_for_status()
+                    if received and response.status_code == 206:
+                        match = _CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+                        if not match or int(match.group(1)) != received:
+                            raise DownloadError(f"이어 받기 응답의 범위가 맞지 않습니다: {url}")
+                        metrics.incr('download.resumed')
+                    else:
+                        # 첫 요청이거나 서버가 전체를 다시 보냈으면 처음부터 쓴다
+                        sink.seek(0)
+                        sink.truncate()
+                        length = response.headers.get('Content-Length')
+                        total = int(length) if length and length.isdigit() else None
+                        digest = expected_digest(response.headers)
+                        validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+                        if received:
+                            metrics.incr('download.restarted')
+
+                    # 길이는 아래에서 직접 확인한다. urllib3 가 짧은 본문에 예외를 올리면
+                    # 끊기기 전까지 받은 바이트를 버리므로 이어 받을 수 없다
+                    response.raw.enforce_content_length = False
+                    for chunk in response.iter_content(DOWNLOAD_CHUNK):
+                        sink.write(chunk)
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                # 받은 것이 없으면 이어 받을 게 없으므로 호출한 쪽의 재시도에 맡긴다
+                if sink.tell() <= received or resumes >= self.max_resumes:
+                    raise
+                resumes += 1
+                self.logger.info(f"Download interrupted at {sink.tell()} bytes, resuming: {url} ({e})")
+                continue
+
+            size = sink.tell()
+            if total is None or size == total:
+                break
+            if size > total:
+                raise DownloadError(f"받은 크기({size})가 Content-Length({total})보다 큽니다: {url}")
+            if size <= received or resumes >= self.max_resumes:
+                raise DownloadError(f"다운로드가 중간에 끊겼습니다 ({size}/{total} 바이트): {url}")
+            # 오류 없이 짧게 끝난 응답도 끊긴 것으로 보고 이어 받는다
+            resumes += 1
+
+        if digest is not None:
+            algorithm, expected = digest
+            if self._digest_of(sink, algorithm) != expected:
+                metrics.incr('download.checksum_mismatch')
+                raise DownloadError(f"받은 결과의 체크섬이 맞지 않습니다: {url}")
+        metrics.incr('download.bytes', sink.tell())
+
+    @staticmethod
+    def _digest_of(sink, algorithm):
+        end = sink.tell()
+        hasher = hashlib.new(algorithm)
+        sink.flush()
+        sink.seek(0)
+        while sink.tell() < end:
+            chunk = sink.read(min(DOWNLOAD_CHUNK, end - sink.tell()))
+            if not chunk:
+                break
+            hasher.update(chunk)
+        sink.seek(end)
+        return hasher.digest()
+
+    def close(self):
+        self.session.close()
+
+
+def is_remote(location):
+    return location.startswith(('http://', 'https://'))
+
+
+def pool_size_for(config):
+    """서버당 커넥션 풀 크기. 설정이 0 이면 동시에 한 서버로 나갈 수 있는 요청 수로 계산
+
+    풀보다 동시 요청이 많으면 urllib3 가 남는 연결을 버려 keep-alive 재사용이 깨진다.
+    업로드/폴링 동시 작업 상한(ImageProcessor 와 같은 계산)에 결과 디코딩, 자동 저장 스레드와
+    서버 상태 확인 몫을 더한다. 갤러리 썸네일 등 다른 요청 몫으로 최소 DEFAULT_POOL_SIZE 는 둔다.
+    """
+    size = config.get('http_pool_maxsize')
+    if size > 0:
+        return size
+    endpoints = max(1, len(config.get('endpoints') or [None]))
+    concurrency = config.get('max_concurrency') or endpoints * config.get('jobs_per_endpoint') * 2
+    return max(DEFAULT_POOL_SIZE,
+               concurrency + config.get('decode_threads') + config.get('auto_save_threads') + 1)
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client():
+    """공유 HttpClient 인스턴스 반환 (최초 호출 시 생성)"""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_lock:
+            if _shared_client is None:
+                config = get_config()
+                _shared_client = HttpClient(pool_maxsize=pool_size_for(config),
+                                            connect_timeout=config.get('http_connect_timeout'),
+                                            read_timeout=config.get('http_read_timeout'),
+                                            gzip=config.get('http_gzip'))
+    return _shared_client
+
+
+def close_http_client():
+    """앱 종료 시 공유 커넥션 풀 정리"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
@@ -0,0 +1,224 @@
+# utils/metrics.py
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class Histogram:
+    """최근 샘플을 보관해 백분위수를 계산하는 간단한 히스토그램"""
+
+    def __init__(self, max_samples=4096):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self._samples = deque(maxlen=max_samples)
+
+    def observe(self, value):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self._samples.append(value)
+
+    def percentile(self, pct):
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(pct / 100.0 * len(ordered)))
+        return ordered[index]
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+        }
+
+
+class JobTrace:
+    """작업 하나의 구간(span) 기록. 시간은 time.monotonic() 기준"""
+
+    def __init__(self, job_id, attrs):
+        self.job_id = job_id
+        self.attrs = attrs
+        self.start = time.monotonic()
+        self.end = None
+        self.status = None
+        self.spans = []
+
+    def to_dict(self):
+        return {
+            'type': 'job',
+            'job_id': self.job_id,
+            'start': self.start,
+            'end': self.end,
+            'duration': (self.end - self.start) if self.end is not None else None,
+            'status': self.status,
+            'attrs': self.attrs,
+            'spans': self.spans,
+        }
+
+
+class MetricsRecorder:
+    """작업별 구간 기록과 카운터/히스토그램 집계
+
+    여러 워커 스레드에서 동시에 호출되므로 모든 상태 변경은 잠금 안에서 이루어진다.
+    export 경로가 설정되면 완료된 작업과 단독 구간을 JSON lines 로 추가 기록한다.
+    파일 쓰기는 전용 스레드 하나가 모아서 하므로 워커 스레드는 디스크를 기다리지 않는다.
+    파일이 max_bytes 를 넘으면 logging 의 RotatingFileHandler 처럼 .1, .2 ... 로 밀어낸다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._jobs = {}
+        self._export_path = None
+        self._export_max_bytes = 0
+        self._export_backups = 0
+        self._export_queue = queue.SimpleQueue()
+        self._writer = None
+        self.logger = logging.getLogger(__name__)
+
+    def set_export_path(self, path, max_bytes=10 * 1024 * 1024, backup_count=3):
+        with self._lock:
+            self._export_path = path
+            self._export_max_bytes = max_bytes
+            self._export_backups = backup_count
+            if path and self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="metrics-writer", daemon=True)
+                self._writer.start()
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._jobs.clear()
+
+    # 카운터 / 히스토그램
+    def incr(self, name, value=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name, value):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(value)
+
+    # 작업 구간
+    def start_job(self, job_id, **attrs):
+        trace = JobTrace(job_id, attrs)
+        with self._lock:
+            self._jobs[job_id] = trace
+        return trace
+
+    def record_span(self, job_id, name, start, end, **attrs):
+        """이미 측정된 구간을 작업에 추가 (job_id 가 없으면 단독 구간으로 기록)"""
+        span = {'name': name, 'start': start, 'end': end, 'duration': end - start}
+        if attrs:
+            span['attrs'] = attrs
+
+        self.observe(f"span.{name}", end - start)
+
+        with self._lock:
+            trace = self._jobs.get(job_id) if job_id is not None else None
+            if trace is not None:
+                trace.spans.append(span)
+                return
+
+        span['type'] = 'span'
+        span['job_id'] = job_id
+        self._export(span)
+
+    @contextmanager
+    def span(self, job_id, name, **attrs):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record_span(job_id, name, start, time.monotonic(), **attrs)
+
+    def finish_job(self, job_id, status='ok'):
+        with self._lock:
+            trace = self._jobs.pop(job_id, None)
+        if trace is None:
+            return None
+
+        trace.end = time.monotonic()
+        trace.status = status
+        self.incr(f"jobs.{status}")
+        self.observe('job.total', trace.end - trace.start)
+        self._export(trace.to_dict())
+        return trace
+
+    # 조회 / 내보내기
+    def snapshot(self):
+        with self._lock:
+            return {
+                'counters': dict(self._counters),
+                'histograms': {name: h.summary() for name, h in self._histograms.items()},
+                'active_jobs': len(self._jobs),
+            }
+
+    def _export(self, record):
+        if self._export_path:
+            # 직렬화도 쓰기 스레드에서 한다. 기록은 더 이상 바뀌지 않는 완료된 작업/구간이다
+            self._export_queue.put(record)
+
+    def close_export(self, timeout=5.0):
+        """앱 종료 시 남은 기록을 파일에 쓰고 쓰기 스레드를 끝낸다"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._export_queue.put(None)
+            writer.join(timeout)
+
+    def _write_loop(self):
+        while True:
+            records = [self._export_queue.get()]
+            # 쌓여 있는 기록은 한 번에 쓴다
+            while True:
+                try:
+                    records.append(self._export_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in records
+            lines = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records if record is not None)
+            with self._lock:
+                path, max_bytes, backups = self._export_path, self._export_max_bytes, self._export_backups
+            if path and lines:
+                try:
+                    self._rotate_if_needed(path, max_bytes, backups)
+                    with open(path, 'a', encoding='utf-8') as f:
+                        f.write(lines)
+                except OSError as e:
+                    self.logger.error(f"Failed to write metrics: {str(e)}")
+            if stop:
+                return
+
+    @staticmethod
+    def _rotate_if_needed(path, max_bytes, backups):
+        if max_bytes <= 0 or not os.path.exists(path) or os.path.getsize(path) < max_bytes:
+            return
+        if backups <= 0:
+            os.remove(path)
+            return
+        for index in range(backups - 1, 0, -1):
+            if os.path.exists(f"{path}.{index}"):
+                os.replace(f"{path}.{index}", f"{path}.{index + 1}")
+        os.replace(path, f"{path}.1")
+
+
+# 앱 전체에서 공유하는 인스턴스
+metrics = MetricsRecorder()
@@ -1,15 +1,18 @@
-import json
-import logging
 import os
 import sys
 
-from PyQt5.QtWidgets import QWidget, QFileDialog, QMessageBox
-
 
 class PathManager:
+    # 디렉토리 확인/생성은 처음 한 번만 한다
+    _app_data_dir = None
+    _cache_dir = None
+
     @staticmethod
     def get_app_data_dir():
         """앱 데이터 저장 디렉토리 경로 반환"""
+        if PathManager._app_data_dir is not None:
+            return PathManager._app_data_dir
+
         app_name = "ImageSegmentTool"
 
         if sys.platform == 'win32':
@@ -19,9 +22,9 @@ class PathManager:
             app_data = os.path.join(os.path.expanduser('~'), f'.{app_name}')
 
         # 디렉토리가 없으면 생성
-        if not os.path.exists(app_data):
-            os.makedirs(app_data)
+        os.makedirs(app_data, exist_ok=True)
 
+        PathManager._app_data_dir = app_data
         return app_data
 
     @staticmethod
@@ -33,3 +36,17 @@ class PathManager:
     def get_log_path():
         """로그 파일 경로 반환"""
         return os.path.join(PathManager.get_app_data_dir(), 'image_processor.log')
+
+    @staticmethod
+    def get_cache_dir():
+        """마스크/결과 캐시 디렉토리 경로 반환"""
+        if PathManager._cache_dir is None:
+            cache_dir = os.path.join(PathManager.get_app_data_dir(), 'cache')
+            os.makedirs(cache_dir, exist_ok=True)
+            PathManager._cache_dir = cache_dir
+        return PathManager._cache_dir
+
+    @staticmethod
+    def get_metrics_path():
+        """작업 메트릭(JSON lines) 파일 경로 반환"""
+        return os.path.join(PathManager.get_app_data_dir(), 'image_processor_metrics.jsonl')
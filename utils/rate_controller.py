@@ -0,0 +1,148 @@
+# utils/rate_controller.py
+import threading
+import time
+
+from utils.metrics import metrics
+
+# 서버 과부하를 뜻하는 상태 코드
+OVERLOAD_STATUS_CODES = (429, 503)
+
+
+class AdaptiveConcurrencyController:
+    """AIMD 방식으로 동시 작업 수와 폴링 간격을 조절
+
+    정상 응답이면 동시 작업 한도를 조금씩(1/limit) 늘리고 폴링 간격을 줄인다.
+    429/503 응답이나 기준 대비 크게 늘어난 업로드 지연시간은 혼잡 신호로 보고
+    한도를 절반으로 줄인다. 업로드 지연시간은 파일 크기로 나눠(작은 파일은 payload_floor 로 간주)
+    크고 작은 이미지가 섞여도 큰 파일을 혼잡으로 오인하지 않게 한다. 폴링이 느려지거나 과부하 응답을 받으면 폴링 간격을 두 배로 늘린다.
+    여러 작업이 동시에 혼잡을 보고해도 cooldown 안에서는 한 번만 줄인다.
+    """
+
+    # 지연시간 기준값 지수이동평균 가중치. 느린 값도 천천히 반영해 기준이 너무 낮게 잡혔으면 회복한다
+    BASELINE_ALPHA = 0.1
+    SLOW_BASELINE_ALPHA = 0.02
+    # 기준값을 이만큼 모은 뒤부터 혼잡을 판단한다 (첫 값 하나로 기준이 정해지지 않도록)
+    WARMUP_SAMPLES = 5
+
+    def __init__(self, max_limit, initial_limit=None, min_limit=1, decrease_factor=0.5,
+                 latency_tolerance=2.5, poll_interval=2.0, min_poll_interval=0.5, max_poll_interval=10.0,
+                 cooldown=2.0, overload_backoff=0.5, payload_floor=256 * 1024):
+        self.max_limit = max(max_limit, min_limit)
+        self.min_limit = min_limit
+        self.limit = float(initial_limit if initial_limit is not None else max(min_limit, self.max_limit // 2))
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.poll_interval = poll_interval
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.cooldown = cooldown
+        self.min_overload_backoff = overload_backoff
+        self.overload_backoff = overload_backoff
+        self.payload_floor = payload_floor
+
+        self.in_flight = 0
+        self._upload_baseline = None
+        self._upload_samples = 0
+        self._poll_baseline = None
+        self._poll_samples = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    # 동시 작업 한도
+    def acquire(self, is_running=lambda: True):
+        """한도 안에 자리가 날 때까지 대기. 중간에 취소되면 False"""
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                if not is_running():
+                    return False
+                self._condition.wait(0.5)
+            if not is_running():
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self):
+        with self._condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._condition.notify()
+
+    # 신호 처리
+    def on_upload(self, latency, payload_bytes=None):
+        """업로드가 끝났을 때 호출. payload_bytes 가 있으면 payload_floor 바이트당 지연시간으로 비교한다"""
+        if payload_bytes is not None:
+            latency = latency * self.payload_floor / max(payload_bytes, self.payload_floor)
+        with self._condition:
+            congested = self._is_slow(latency, self._upload_baseline, self._upload_samples)
+            self._upload_baseline = self._update_baseline(self._upload_baseline, latency, congested)
+            self._upload_samples += 1
+            if congested:
+                self._decrease()
+            else:
+                self.overload_backoff = self.min_overload_backoff
+                self._increase()
+
+    def on_poll(self, duration):
+        with self._condition:
+            slow = self._is_slow(duration, self._poll_baseline, self._poll_samples)
+            self._poll_baseline = self._update_baseline(self._poll_baseline, duration, slow)
+            self._poll_samples += 1
+            if slow:
+                self.poll_interval = min(self.max_poll_interval, self.poll_interval * 2)
+            else:
+                self.poll_interval = max(self.min_poll_interval, self.poll_interval * 0.8)
+            metrics.observe('poll.interval', self.poll_interval)
+
+    def on_overload(self, retry_after=None, polling=False):
+        """429/503 응답을 받았을 때 호출. 다음 시도까지 기다릴 시간을 반환
+
+        연속된 과부하 응답마다 대기 시간을 두 배로 늘리고, 업로드가 성공하면 초기화한다.
+        """
+        with self._condition:
+            self._decrease()
+            if polling:
+                self.poll_interval = min(self.max_poll_interval, self.poll_interval * 2)
+                delay = self.poll_interval
+            else:
+                delay = self.overload_backoff
+                self.overload_backoff = min(self.max_poll_interval, self.overload_backoff * 2)
+        metrics.incr('server.overload')
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    # 내부 계산 (잠금 안에서 호출)
+    def _is_slow(self, value, baseline, samples):
+        return (baseline is not None and samples >= self.WARMUP_SAMPLES
+                and value > baseline * self.latency_tolerance)
+
+    def _update_baseline(self, baseline, value, slow):
+        if baseline is None:
+            return value
+        # 혼잡 중의 값은 기준을 조금만 끌어올린다. 아예 빼면 기준이 낮게 잡혔을 때 영영 혼잡으로 본다
+        alpha = self.SLOW_BASELINE_ALPHA if slow else self.BASELINE_ALPHA
+        return alpha * value + (1 - alpha) * baseline
+
+    def _increase(self):
+        self.limit = min(self.max_limit, self.limit + 1.0 / max(self.limit, 1.0))
+        self._condition.notify_all()
+        metrics.observe('concurrency.limit', self.limit)
+
+    def _decrease(self):
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+        metrics.incr('concurrency.decrease')
+        metrics.observe('concurrency.limit', self.limit)
+
+
+def parse_retry_after(response):
+    """Retry-After 헤더(초 단위)를 읽는다. 없거나 날짜 형식이면 None"""
+    if response is None:
+        return None
+    value = response.headers.get('Retry-After')
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
@@ -0,0 +1,98 @@
+# utils/retry_policy.py
+import random
+import threading
+import time
+
+from utils.metrics import metrics
+
+
+class TransientError(Exception):
+    """잠시 뒤 다시 시도하면 성공할 수 있는 오류 (서버 없음, 결과 대기 시간 초과 등)"""
+
+
+def is_retryable(error):
+    """연결 끊김, 시간 초과, 5xx 처럼 일시적인 오류인지. 4xx 나 이미지 손상은 다시 해도 같다"""
+    import requests
+    while error is not None:
+        if isinstance(error, (TransientError, requests.ConnectionError, requests.Timeout,
+                              requests.exceptions.ChunkedEncodingError)):
+            return True
+        if isinstance(error, requests.HTTPError):
+            status = error.response.status_code if error.response is not None else None
+            return status is None or status >= 500 or status in (408, 429)
+        error = error.__cause__
+    return False
+
+
+class RetryBudget:
+    """배치 하나에서 쓸 수 있는 재시도 횟수
+
+    시작한 작업 수의 ratio 배에 minimum 을 더한 만큼만 재시도한다.
+    서버가 완전히 죽었을 때 모든 파일이 재시도를 반복하며 배치를 끝없이 늘리지 않도록 한다.
+    """
+
+    def __init__(self, ratio=0.2, minimum=5):
+        self.ratio = ratio
+        self.minimum = minimum
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.jobs = 0
+            self.spent = 0
+
+    def record_job(self):
+        with self._lock:
+            self.jobs += 1
+
+    def try_spend(self):
+        with self._lock:
+            if self.spent >= self.minimum + self.ratio * self.jobs:
+                return False
+            self.spent += 1
+            return True
+
+
+class RetryPolicy:
+    """일시적인 오류를 지수 백오프로 재시도
+
+    max_retries 는 첫 시도를 뺀 재시도 횟수이고, n 번째 재시도 전에는
+    base_delay * 2^(n-1) 초(최대 max_delay, ±jitter)를 기다린다.
+    """
+
+    def __init__(self, max_retries=2, base_delay=1.0, max_delay=30.0, jitter=0.2):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, retry):
+        delay = min(self.max_delay, self.base_delay * 2 ** (retry - 1))
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def call(self, function, budget=None, is_running=lambda: True, job_id=None, name='retry'):
+        """function() 을 실행하고, 일시적인 오류면 예산 안에서 기다렸다 다시 실행
+
+        재시도할 수 없거나 횟수/예산을 다 쓰면 마지막 오류를 그대로 올린다.
+        """
+        retry = 0
+        while True:
+            try:
+                return function()
+            except Exception as e:
+                if not is_running() or retry >= self.max_retries or not is_retryable(e):
+                    raise
+                if budget is not None and not budget.try_spend():
+                    metrics.incr('retry.budget_exhausted')
+                    raise
+                retry += 1
+                metrics.incr(f"{name}.attempts")
+                delay = self.delay(retry)
+                with metrics.span(job_id, 'retry_backoff', attempt=retry, error=type(e).__name__):
+                    # 취소되면 바로 빠져나오도록 나눠서 기다린다
+                    deadline = time.monotonic() + delay
+                    while time.monotonic() < deadline:
+                        if not is_running():
+                            raise
+                        time.sleep(max(0.0, min(0.1, deadline - time.monotonic())))
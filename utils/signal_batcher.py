@@ -0,0 +1,47 @@
+# utils/signal_batcher.py
+import threading
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class SignalBatcher(QObject):
+    """워커 스레드의 이벤트를 모아 GUI 스레드에 interval_ms 마다 한 번씩 목록으로 전달
+
+    워커 시그널을 Qt.DirectConnection 으로 add 에 연결하면 워커 스레드에서 목록에 쌓기만 하고,
+    GUI 스레드로는 창 하나(interval_ms)당 깨우기 이벤트 하나와 flushed(list) 한 번만 간다.
+    인자가 하나인 이벤트는 값 그대로, 여러 개면 튜플로 쌓인다.
+    완료 시그널처럼 순서가 중요한 처리 전에는 flush() 를 직접 불러 남은 이벤트를 먼저 내보낸다.
+    """
+    flushed = pyqtSignal(list)
+    _wake = pyqtSignal()
+
+    def __init__(self, interval_ms=50, parent=None):
+        super().__init__(parent)
+        self._items = []
+        self._scheduled = False
+        self._lock = threading.Lock()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        # 다른 스레드에서 emit 하면 QueuedConnection 으로 GUI 스레드의 타이머를 시작한다
+        self._wake.connect(self._timer.start)
+
+    def add(self, *args):
+        """어느 스레드에서나 호출 가능"""
+        with self._lock:
+            self._items.append(args[0] if len(args) == 1 else args)
+            wake = not self._scheduled
+            self._scheduled = True
+        if wake:
+            self._wake.emit()
+
+    def flush(self):
+        """쌓인 이벤트를 바로 내보낸다 (GUI 스레드에서 호출)"""
+        self._timer.stop()
+        with self._lock:
+            items, self._items = self._items, []
+            self._scheduled = False
+        if items:
+            self.flushed.emit(items)
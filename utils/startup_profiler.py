@@ -0,0 +1,120 @@
+# utils/startup_profiler.py
+import sys
+import time
+from importlib.machinery import PathFinder
+
+from PyQt5.QtCore import QObject, QEvent
+
+
+class _ImportTimer:
+    """sys.meta_path 에 끼워 모듈마다 실행(import) 시간을 잰다 (하위 모듈 시간 포함)"""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.depth = 0
+
+    def find_spec(self, name, path=None, target=None):
+        spec = PathFinder.find_spec(name, path, target)
+        if spec is None or spec.loader is None or not hasattr(spec.loader, 'exec_module'):
+            return spec
+
+        exec_module = spec.loader.exec_module
+        timer = self
+
+        def timed_exec_module(module):
+            started = time.perf_counter()
+            timer.depth += 1
+            try:
+                exec_module(module)
+            finally:
+                timer.depth -= 1
+                timer.profiler.imports.append((started, time.perf_counter() - started, timer.depth, name))
+
+        spec.loader.exec_module = timed_exec_module
+        return spec
+
+
+class _FirstPaintFilter(QObject):
+    def __init__(self, profiler, label):
+        super().__init__()
+        self.profiler = profiler
+        self.label = label
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            watched.removeEventFilter(self)
+            self.profiler.mark(self.label)
+            self.profiler._paint_filter = None
+            if self.profiler._report_pending:
+                self.profiler.report()
+        return False
+
+
+class StartupProfiler:
+    """--profile-startup 으로 켜면 시작 단계별 시각과 오래 걸린 import 를 출력
+
+    꺼져 있으면 mark() 는 아무것도 하지 않는다.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.started = time.perf_counter()
+        self.marks = []  # [(시각, 이름)]
+        self.imports = []  # [(시작 시각, 걸린 시간, 깊이, 모듈)]
+        self._import_timer = None
+        self._paint_filter = None
+        self._report_pending = False
+        self._reported = False
+
+    def enable(self, time_imports=True):
+        self.enabled = True
+        self.started = time.perf_counter()
+        if time_imports and self._import_timer is None:
+            # 내장/frozen 모듈 다음, 일반 경로 탐색(PathFinder) 앞에 둔다
+            self._import_timer = _ImportTimer(self)
+            index = next((i for i, finder in enumerate(sys.meta_path) if finder is PathFinder), len(sys.meta_path))
+            sys.meta_path.insert(index, self._import_timer)
+
+    def mark(self, label):
+        if self.enabled:
+            self.marks.append((time.perf_counter(), label))
+
+    def mark_first_paint(self, widget, label="첫 화면 그리기"):
+        """widget 이 처음 그려질 때 mark"""
+        if not self.enabled:
+            return
+        self._paint_filter = _FirstPaintFilter(self, label)
+        widget.installEventFilter(self._paint_filter)
+
+    def finish(self, label="시작 완료"):
+        """시작 작업이 끝나면 호출. 아직 첫 화면을 그리기 전이면 그린 뒤에 보고서를 출력"""
+        if not self.enabled:
+            return
+        self.mark(label)
+        if self._paint_filter is not None:
+            self._report_pending = True
+        else:
+            self.report()
+
+    def report(self, min_import_ms=5.0):
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        if self._import_timer in sys.meta_path:
+            sys.meta_path.remove(self._import_timer)
+
+        print("\n[시작 프로파일] 단계 (프로세스 시작 기준 ms)")
+        previous = self.started
+        for moment, label in self.marks:
+            print(f"  {(moment - self.started) * 1000:8.1f}  (+{(moment - previous) * 1000:7.1f})  {label}")
+            previous = moment
+
+        slow = [entry for entry in self.imports if entry[1] * 1000 >= min_import_ms]
+        if slow:
+            print(f"[시작 프로파일] {min_import_ms:.0f}ms 이상 걸린 import (시작 시각 순, 하위 모듈 포함)")
+            for started, elapsed, depth, name in sorted(slow):
+                print(f"  {(started - self.started) * 1000:8.1f}  {elapsed * 1000:7.1f}ms  {'  ' * depth}{name}")
+        sys.stdout.flush()
+
+
+profiler = StartupProfiler()
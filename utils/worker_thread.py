@@ -1,43 +1,115 @@
 # core/services/worker_thread.py
 
 from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader
 import requests
 import logging
 import os
+import threading
 import time
+import itertools
 import json
-from typing import List, Dict
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Union
+
+from core.services.auto_crop import auto_crop_result
+from core.services.endpoint_pool import EndpointPool
+from core.services.error_collector import error_cause
+from core.services.job_queue import Job, JobQueue, PRIORITY_NORMAL
+from core.services.mask_compositor import (NEUTRAL_PARAMETERS, decode_mask, get_mask_cache, get_result_cache_budget,
+                                          render_local_result)
+from core.services.process_pool import SharedArray, get_process_pool, share_array, share_bytes
+from utils.metrics import metrics
+from utils.http_client import get_http_client
+from utils.rate_controller import AdaptiveConcurrencyController, OVERLOAD_STATUS_CODES, parse_retry_after
+from utils.retry_policy import RetryBudget, RetryPolicy, TransientError
+
+
+def group_by_parameters(image_files, default_parameters, file_parameters):
+    """파일을 동일한 파라미터 조합별로 묶는다. 묶음 순서는 처음 등장한 순서를 따른다
+
+    반환값: [(parameters, [file_path, ...]), ...]
+    """
+    groups = {}
+    for image_path in image_files:
+        parameters = file_parameters.get(image_path) or default_parameters
+        key = tuple(sorted(parameters.items()))
+        if key not in groups:
+            groups[key] = (parameters, [])
+        groups[key][1].append(image_path)
+    return list(groups.values())
 
 
 class WorkerThread(QThread):
     progress = pyqtSignal(int)
     result = pyqtSignal(tuple)  # (file_path, response)
     finished = pyqtSignal(list)  # List of (file_path, response) tuples
-    error = pyqtSignal(str)
+    error = pyqtSignal(str)  # 스레드 전체의 오류
+    failed = pyqtSignal(str, str, dict, str)  # 파일 하나의 실패 (file_path, 오류 메시지, 파라미터, 원인)
+
+    # 429/503 으로 업로드가 밀렸을 때 재시도 횟수
+    MAX_OVERLOAD_RETRIES = 5
 
-    def __init__(self, image_files: List[str], api_url: str, parameters: Dict):
+    def __init__(self, image_files: List[str], api_url: Union[str, EndpointPool], parameters: Dict,
+                 controller: AdaptiveConcurrencyController = None, file_parameters: Dict[str, Dict] = None,
+                 retry_policy: RetryPolicy = None, retry_budget: RetryBudget = None):
         super().__init__()
         self.image_files = image_files
-        self.api_url = api_url
+        # 단일 URL 이 주어지면 서버 하나짜리 풀로 감싼다
+        if isinstance(api_url, EndpointPool):
+            self.endpoint_pool = api_url
+        else:
+            self.endpoint_pool = EndpointPool([api_url], health_interval=0)
+        # 서버 응답에 따라 동시 작업 수와 폴링 간격을 조절 (배치 간에 공유 가능)
+        self.controller = controller or AdaptiveConcurrencyController(
+            max_limit=self.endpoint_pool.capacity * 2,
+            initial_limit=self.endpoint_pool.capacity
+        )
         self.parameters = parameters
+        # 파일별로 따로 지정된 파라미터 (없으면 parameters 사용)
+        self.file_parameters = file_parameters or {}
+        # 연결 끊김/5xx/시간 초과는 만들어 둔 업로드 데이터로 다시 보낸다 (배치마다 재시도 예산을 둔다)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget or RetryBudget()
         self.results = []
+        self._results_lock = threading.Lock()
         self._is_running = True
 
         # Setup logging
         self.logger = logging.getLogger(__name__)
 
-    def wait_for_result(self, session, token, max_retries=30):
-        """이미지 처리 결과를 기다림"""
+    def stop(self):
+        self._is_running = False
+
+    def wait_for_result(self, session, token, max_retries=30, job_id=None, endpoint=None):
+        """이미지 처리 결과를 기다림 (토큰을 발급한 서버에 조회)"""
+        endpoint = endpoint or self.endpoint_pool.endpoints[0]
+        wait_start = time.monotonic()
         for i in range(max_retries):
+            if not self._is_running:
+                return None
+
+            poll_start = time.monotonic()
             try:
-                response = session.get(f"{self.api_url}{token}")
+                response = session.get(f"{endpoint.url}{token}")
+                if response.status_code in OVERLOAD_STATUS_CODES:
+                    # 서버 과부하: 폴링을 늦추고 같은 토큰으로 다시 조회
+                    time.sleep(self.controller.on_overload(parse_retry_after(response), polling=True))
+                    continue
                 response.raise_for_status()
                 result = response.json()
+                ready = bool(result.get('result_images'))
+                poll_end = time.monotonic()
+                self.controller.on_poll(poll_end - poll_start)
+                metrics.record_span(job_id, 'poll', poll_start, poll_end, attempt=i + 1, ready=ready)
+                metrics.incr('poll.requests')
 
-                self.logger.info(f"Polling result: {result}")
+                self.logger.debug(f"Polling token {token}: attempt {i + 1}, ready={ready}")
 
                 # API 응답 구조에 맞게 처리
-                if result.get('result_images'):
+                if ready:
+                    metrics.record_span(job_id, 'queue_wait', wait_start, time.monotonic(), polls=i + 1)
                     return {
                         'results': [{
                             'result_images': [
@@ -46,75 +118,283 @@ class WorkerThread(QThread):
                         }]
                     }
 
-                time.sleep(2)
+                time.sleep(self.controller.poll_interval)
 
             except requests.RequestException as e:
+                metrics.incr('poll.errors')
                 self.logger.error(f"Network error checking result: {str(e)}")
-                time.sleep(2)
+                time.sleep(self.controller.poll_interval)
             except json.JSONDecodeError as e:
+                metrics.incr('poll.errors')
                 self.logger.error(f"Invalid JSON response: {str(e)}")
-                time.sleep(2)
+                time.sleep(self.controller.poll_interval)
             except Exception as e:
+                metrics.incr('poll.errors')
                 self.logger.error(f"Error checking result: {str(e)}")
-                time.sleep(2)
+                time.sleep(self.controller.poll_interval)
 
         return None
 
-    def run(self):
+    def upload_image(self, session, files, data, job_id, probe=False):
+        """업로드할 서버를 골라 전송. 서버가 죽었거나 응답이 없으면 다음 서버로 넘어간다
+
+        성공하면 (endpoint, 응답 JSON) 을 반환하며, 반환된 endpoint 는 호출한 쪽에서
+        결과를 받은 뒤 release() 해야 한다. probe 면(재시도) 죽은 것으로 표시된 서버도 시험해 본다.
+        """
+        tried = set()
+        last_error = None
+        overload_retries = 0
+
+        while len(tried) < len(self.endpoint_pool) and self._is_running:
+            endpoint = self.endpoint_pool.acquire(exclude=tried, include_down=probe)
+            if endpoint is None:
+                break
+
+            upload_start = time.monotonic()
+            try:
+                with metrics.span(job_id, 'upload', endpoint=endpoint.url):
+                    upload_response = session.post(endpoint.url, files=files, data=data)
+                    if (upload_response.status_code in OVERLOAD_STATUS_CODES
+                            and overload_retries < self.MAX_OVERLOAD_RETRIES):
+                        # 서버가 살아 있지만 밀려 있음: 장애로 보지 않고 속도를 늦춰 재시도
+                        overload_retries += 1
+                        self.endpoint_pool.release(endpoint)
+                        time.sleep(self.controller.on_overload(parse_retry_after(upload_response)))
+                        continue
+                    upload_response.raise_for_status()
+                    upload_result = upload_response.json()
+                upload_latency = time.monotonic() - upload_start
+                self.endpoint_pool.record_success(endpoint, upload_latency)
+                self.controller.on_upload(upload_latency, sum(len(part[1]) for part in files.values()))
+                return endpoint, upload_result
+
+            except (requests.ConnectionError, requests.Timeout) as e:
+                last_error = e
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code < 500:
+                    self.endpoint_pool.release(endpoint)
+                    raise
+                last_error = e
+            except Exception:
+                self.endpoint_pool.release(endpoint)
+                raise
+
+            # 서버 장애: 기록 후 다른 서버로 재시도 (연달아 실패하면 죽은 서버로 표시된다)
+            tried.add(endpoint)
+            self.endpoint_pool.release(endpoint)
+            self.endpoint_pool.record_failure(endpoint, str(last_error))
+            metrics.incr('upload.failover')
+
+        raise TransientError(f"사용 가능한 서버가 없습니다: {last_error}") from last_error
+
+    def upload_and_wait(self, session, files, data, job_id, probe=False):
+        """업로드 후 결과가 나올 때까지 폴링. 반환된 endpoint 는 호출한 쪽에서 release() 해야 한다
+
+        실패하면 endpoint 를 반납하고 오류를 올리므로, 같은 files/data 로 그대로 다시 호출할 수 있다.
+        """
+        endpoint, upload_result = self.upload_image(session, files, data, job_id, probe)
         try:
-            total_files = len(self.image_files)
-            session = requests.Session()
+            if 'image_token' not in upload_result:
+                return endpoint, None
+            token = upload_result['image_token']
+            self.logger.info(f"Got token: {token} from {endpoint.url}")
 
-            for index, image_path in enumerate(self.image_files):
-                if not self._is_running:
-                    break
+            # Wait for processing result
+            result = self.wait_for_result(session, token, job_id=job_id, endpoint=endpoint)
+            if result is None and self._is_running:
+                raise TransientError("처리 결과를 받지 못했습니다.")
+            return endpoint, result
+        except Exception:
+            self.endpoint_pool.release(endpoint)
+            raise
 
-                try:
-                    self.logger.info(f"Processing file {index + 1}/{total_files}: {image_path}")
-
-                    # Prepare multipart form data
-                    with open(image_path, 'rb') as img_file:
-                        files = {
-                            'image': (
-                                os.path.basename(image_path),
-                                img_file,
-                                'image/jpeg' if image_path.lower().endswith(('.jpg', '.jpeg')) else 'image/png'
-                            )
-                        }
-
-                        # Add parameters to the request
-                        data = {
-                            'mask_blur': str(self.parameters['mask_blur']),
-                            'mask_offset': str(self.parameters['mask_offset']),
-                            'invert_output': str(self.parameters['invert_output']).lower()
-                        }
-
-                        # Upload image and get token
-                        upload_response = session.post(self.api_url, files=files, data=data)
-                        upload_response.raise_for_status()
-                        upload_result = upload_response.json()
-
-                        if 'image_token' in upload_result:
-                            token = upload_result['image_token']
-                            self.logger.info(f"Got token: {token}")
-
-                            # Wait for processing result
-                            result = self.wait_for_result(session, token)
-                            if result:
-                                self.results.append((image_path, result))
-                                self.result.emit((image_path, result))
-                            else:
-                                raise Exception("처리 결과를 받지 못했습니다.")
-
-                    # Update progress
-                    progress = int(((index + 1) / total_files) * 100)
-                    self.progress.emit(progress)
+    def with_retry(self, function, job_id):
+        return self.retry_policy.call(function, self.retry_budget, lambda: self._is_running, job_id)
+
+    def report_failure(self, image_path, message, parameters, error=None):
+        """error 가 있으면 메시지 대신 예외 종류(Timeout, ConnectionError, HTTP 상태 코드)로 원인을 정한다"""
+        self.logger.error(f"Error processing {os.path.basename(image_path)}: {message}")
+        self.failed.emit(image_path, message, parameters, error_cause(message, error))
 
+    def emit_result(self, job_id, image_path, result, parameters):
+        result['job_id'] = job_id
+        result['parameters'] = parameters
+        metrics.finish_job(job_id, 'ok')
+        with self._results_lock:
+            self.results.append((image_path, result))
+        self.result.emit((image_path, result))
+
+    def fetch_mask(self, session, image_path, result, job_id):
+        """서버가 돌려준 원본 누끼 결과에서 마스크를 꺼내 캐시에 저장"""
+        result_url = result['results'][0]['result_images'][0]['image']
+        with metrics.span(job_id, 'result_fetch'):
+            content = self.with_retry(lambda: session.fetch_bytes(result_url), job_id)
+
+        # 디코딩과 마스크 추출은 프로세스 풀에서 하고, 마스크는 공유 메모리로 돌려받는다
+        with metrics.span(job_id, 'decode'):
+            source_size = QImageReader(image_path).size()
+            if not source_size.isValid():
+                raise Exception("원본 이미지 크기를 읽을 수 없습니다.")
+            with share_bytes(content) as shared_content, \
+                    SharedArray((source_size.height(), source_size.width())) as shared_mask:
+                get_process_pool().run(decode_mask, shared_content, shared_mask)
+                mask = shared_mask.array.copy()
+
+        get_mask_cache().put(image_path, mask)
+        return mask
+
+    def render_local(self, job_id, image_path, mask, parameters):
+        """캐시된 마스크에 현재 파라미터를 적용한 결과를 만든다"""
+        with metrics.span(job_id, 'composite'):
+            with share_array(mask) as shared_mask:
+                output_path = get_process_pool().run(render_local_result, image_path, shared_mask, parameters)
+        get_result_cache_budget().record_write()
+        return {
+            'results': [{
+                'result_images': [{'image': output_path}]
+            }],
+            'local': True
+        }
+
+    def crop_result(self, session, job_id, result, parameters):
+        """결과의 투명 여백을 잘라낸 로컬 파일로 바꾼다. 실패하면 원래 결과를 그대로 쓴다"""
+        result_url = result['results'][0]['result_images'][0]['image']
+        try:
+            with metrics.span(job_id, 'result_fetch'):
+                content = self.with_retry(lambda: session.fetch_bytes(result_url), job_id)
+            with metrics.span(job_id, 'auto_crop'), share_bytes(content) as shared_content:
+                output_path, rect, size, timings = get_process_pool().run(
+                    auto_crop_result, shared_content, int(parameters.get('crop_padding', 0)))
+        except Exception as e:
+            self.logger.error(f"Auto crop failed, keeping original result: {str(e)}")
+            return result
+
+        for stage, elapsed in timings.items():
+            metrics.observe(f"span.auto_crop.{stage}", elapsed)
+        if output_path is None:
+            return result
+        get_result_cache_budget().record_write()
+
+        metrics.incr('auto_crop.pixels_removed', size.width() * size.height() - rect.width() * rect.height())
+        result = dict(result)
+        result['results'] = [{'result_images': [{'image': output_path}]}]
+        result['crop_rect'] = (rect.x(), rect.y(), rect.width(), rect.height())
+        return result
+
+    def finish_result(self, session, job_id, image_path, result, parameters):
+        """선택적 후처리 단계를 거친 뒤 결과를 내보낸다"""
+        if parameters.get('auto_crop'):
+            result = self.crop_result(session, job_id, result, parameters)
+        self.emit_result(job_id, image_path, result, parameters)
+
+    def process_file(self, session, image_path, index, total_files, parameters):
+        """파일 하나를 업로드하고 결과를 받을 때까지 처리"""
+        if not self._is_running:
+            return
+
+        # 로컬 합성 모드에서 마스크가 캐시되어 있으면 서버를 거치지 않는다
+        local_mode = bool(parameters.get('local_compositing'))
+        if local_mode:
+            mask = get_mask_cache().get(image_path)
+            if mask is not None:
+                metrics.incr('mask_cache.hit')
+                job_id = uuid.uuid4().hex
+                metrics.start_job(job_id, file=image_path, cached_mask=True)
+                try:
+                    self.finish_result(session, job_id, image_path,
+                                       self.render_local(job_id, image_path, mask, parameters), parameters)
                 except Exception as e:
-                    error_msg = f"Error processing {os.path.basename(image_path)}: {str(e)}"
-                    self.logger.error(error_msg)
-                    self.error.emit(error_msg)
-                    continue
+                    metrics.finish_job(job_id, 'error')
+                    self.report_failure(image_path, str(e), parameters, e)
+                return
+            metrics.incr('mask_cache.miss')
+
+        # 동시 작업 한도 안에 자리가 날 때까지 대기
+        if not self.controller.acquire(lambda: self._is_running):
+            return
+
+        job_id = uuid.uuid4().hex
+        metrics.start_job(job_id, file=image_path)
+        self.retry_budget.record_job()
+        endpoint = None
+        try:
+            self.logger.info(f"Processing file {index + 1}/{total_files}: {image_path}")
+
+            # Prepare multipart form data
+            with metrics.span(job_id, 'read_file'):
+                with open(image_path, 'rb') as img_file:
+                    image_bytes = img_file.read()
+            metrics.incr('upload.bytes', len(image_bytes))
+
+            files = {
+                'image': (
+                    os.path.basename(image_path),
+                    image_bytes,
+                    'image/jpeg' if image_path.lower().endswith(('.jpg', '.jpeg')) else 'image/png'
+                )
+            }
+
+            # Add parameters to the request
+            # (로컬 합성 모드에서는 후처리 없는 원본 마스크만 요청)
+            upload_parameters = NEUTRAL_PARAMETERS if local_mode else parameters
+            data = {
+                'mask_blur': str(upload_parameters['mask_blur']),
+                'mask_offset': str(upload_parameters['mask_offset']),
+                'invert_output': str(upload_parameters['invert_output']).lower()
+            }
+
+            # Upload image and get token, then wait for the result
+            # (일시적인 오류면 위에서 만든 files/data 를 그대로 다시 보낸다)
+            attempts = itertools.count()
+            endpoint, result = self.with_retry(
+                lambda: self.upload_and_wait(session, files, data, job_id, probe=next(attempts) > 0), job_id)
+
+            if result:
+                if local_mode:
+                    mask = self.fetch_mask(session, image_path, result, job_id)
+                    result = self.render_local(job_id, image_path, mask, parameters)
+                self.finish_result(session, job_id, image_path, result, parameters)
+            elif not self._is_running:
+                metrics.finish_job(job_id, 'cancelled')
+            else:
+                metrics.finish_job(job_id, 'no_token')
+                self.report_failure(image_path, "서버가 작업 토큰을 돌려주지 않았습니다.", parameters)
+
+        except Exception as e:
+            if not self._is_running:
+                metrics.finish_job(job_id, 'cancelled')
+                return
+            metrics.finish_job(job_id, 'error')
+            self.report_failure(image_path, str(e), parameters, e)
+
+        finally:
+            if endpoint is not None:
+                self.endpoint_pool.release(endpoint)
+            self.controller.release()
+
+    def run(self):
+        try:
+            total_files = len(self.image_files)
+            # 공유 커넥션 풀을 사용하므로 배치가 끝나도 세션을 닫지 않는다
+            session = get_http_client()
+            completed = 0
+
+            # 같은 파라미터 묶음끼리 연속해서 투입한다.
+            # 실제 동시 작업 수는 controller 가 max_workers 이하에서 조절한다
+            with ThreadPoolExecutor(max_workers=self.controller.max_limit) as executor:
+                futures = []
+                for parameters, files in group_by_parameters(self.image_files, self.parameters,
+                                                             self.file_parameters):
+                    self.logger.info(f"Scheduling {len(files)} files with parameters {parameters}")
+                    for image_path in files:
+                        futures.append(executor.submit(
+                            self.process_file, session, image_path, len(futures), total_files, parameters
+                        ))
+
+                for future in as_completed(futures):
+                    completed += 1
+                    if self._is_running:
+                        self.progress.emit(int((completed / total_files) * 100))
 
             if self._is_running:
                 self.logger.info(f"Processing completed. {len(self.results)} files processed.")
@@ -127,8 +407,145 @@ class WorkerThread(QThread):
             self.error.emit(error_msg)
 
         finally:
-            session.close()
             self.logger.info("Worker thread finished")
+
+class QueueWorkerThread(WorkerThread):
+    """JobQueue 에서 작업을 꺼내 업로드하는, 앱이 켜져 있는 동안 계속 도는 처리 스레드
+
+    처리 중에도 submit() 으로 작업을 더 넣을 수 있다. 동시 작업 한도에 자리가 났을 때만
+    대기열에서 꺼내므로, 대기 중인 작업의 우선순위를 올리면 바로 다음 차례가 된다.
+    대기열과 처리 중인 작업이 모두 비면 그동안의 결과로 finished 를 내보낸다.
+    """
+    queue_changed = pyqtSignal(int, int)  # (대기 중, 처리 중)
+
+    def __init__(self, job_queue: JobQueue, api_url: Union[str, EndpointPool],
+                 controller: AdaptiveConcurrencyController = None, retry_policy: RetryPolicy = None,
+                 retry_budget: RetryBudget = None):
+        super().__init__([], api_url, {}, controller, retry_policy=retry_policy, retry_budget=retry_budget)
+        self.job_queue = job_queue
+        self.running_files = set()
+        self.submitted = 0
+        self.completed = 0
+        self._alive = True
+        self._cancel_requested = False
+        self._dispatch_condition = threading.Condition()
+
+    def submit(self, image_files, parameters, file_parameters=None, priority=PRIORITY_NORMAL, interactive=True):
+        """작업 추가. 이미 대기 중인 파일은 건너뛰며 새로 추가된 개수를 반환"""
+        added = 0
+        # 같은 파라미터 묶음끼리 연속해서 처리되도록 묶음 순서대로 넣는다
+        for group_parameters, files in group_by_parameters(image_files, parameters, file_parameters or {}):
+            for image_path in files:
+                if self.job_queue.put(Job(image_path, group_parameters, priority, interactive)):
+                    added += 1
+        with self._dispatch_condition:
+            self.submitted += added
+        self.emit_queue_changed()
+        return added
+
+    def bump(self, image_files):
+        moved = self.job_queue.bump(image_files)
+        if moved:
+            self.logger.info(f"Moved {moved} files to the front of the queue")
+        return moved
+
+    def cancel(self):
+        """대기 중인 작업을 버리고 처리 중인 작업을 중단한다. 스레드는 계속 돈다"""
+        cleared = self.job_queue.clear()
+        with self._dispatch_condition:
+            self.submitted -= cleared
+            self._cancel_requested = True
+            self._dispatch_condition.notify_all()
+        self.emit_queue_changed()
+
+    def stop(self):
+        self._alive = False
+        super().stop()
+        with self._dispatch_condition:
+            self._dispatch_condition.notify_all()
+
+    def emit_queue_changed(self):
+        with self._dispatch_condition:
+            running = len(self.running_files)
+        self.queue_changed.emit(len(self.job_queue), running)
+
+    def run(self):
+        # 공유 커넥션 풀을 사용하므로 세션을 닫지 않는다
+        session = get_http_client()
+        try:
+            with ThreadPoolExecutor(max_workers=self.controller.max_limit) as executor:
+                while self._alive:
+                    if self._cancel_requested:
+                        self.cancel_running()
+                        continue
+                    if not self.job_queue.wait(0.2):
+                        continue
+
+                    with self._dispatch_condition:
+                        # 동시 작업 한도만큼만 꺼내 두고 나머지는 대기열에서 순서를 기다린다
+                        if len(self.running_files) >= max(1, int(self.controller.limit)):
+                            self._dispatch_condition.wait(0.2)
+                            continue
+                        job = self.job_queue.take()
+                        if job is None:
+                            continue
+                        self.running_files.add(job.file_path)
+                        index = self.completed + len(self.running_files) - 1
+
+                    executor.submit(self.run_job, session, job, index)
+                    self.emit_queue_changed()
+
+        except Exception as e:
+            error_msg = f"Critical worker thread error: {str(e)}"
+            self.logger.error(error_msg)
+            self.error.emit(error_msg)
+
+        finally:
+            self.logger.info("Queue worker thread finished")
+
+    def run_job(self, session, job, index):
+        try:
+            self.process_file(session, job.file_path, index, self.submitted, job.parameters)
+        finally:
+            with self._dispatch_condition:
+                self.running_files.discard(job.file_path)
+                self.completed += 1
+                progress = int(self.completed * 100 / max(self.submitted, 1))
+                drained = not self.running_files and not len(self.job_queue) and self._is_running
+                if drained:
+                    results = self.reset_run()
+                self._dispatch_condition.notify_all()
+
+            self.emit_queue_changed()
+            if self._is_running:
+                self.progress.emit(min(progress, 100))
+            if drained:
+                self.logger.info(f"Queue drained. {len(results)} files processed.")
+                self.finished.emit(results)
+
+    def cancel_running(self):
+        """처리 중인 작업이 모두 멈출 때까지 기다린 뒤 다시 받을 준비를 한다"""
+        self._is_running = False
+        with self._dispatch_condition:
+            while self.running_files:
+                self._dispatch_condition.wait(0.2)
+            self._cancel_requested = False
+            self.reset_run()
+            # 취소 후 바로 들어온 작업은 다음 진행률에 포함
+            self.submitted = len(self.job_queue)
+        self._is_running = self._alive
+
+    # _dispatch_condition 안에서 호출
+    def reset_run(self):
+        with self._results_lock:
+            results, self.results = self.results, []
+        # 재시도 예산은 배치(대기열이 빌 때까지)마다 새로
+        self.retry_budget.reset()
+        self.submitted = 0
+        self.completed = 0
+        return results
+
+
 # # core/services/worker_thread.py
 #
 # from PyQt5.QtCore import QThread, pyqtSignal